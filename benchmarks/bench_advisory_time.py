@@ -0,0 +1,89 @@
+"""Time the advisory time parser.
+
+Compares the old per-poll strptime parsing with the precompiled parser,
+cold and memoized, on the phrasings below and the phrases of the bundled
+bulletin fixtures. tests/test_advisory_time.py checks what they parse to.
+
+    python benchmarks/bench_advisory_time.py
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import re
+
+from common import FIXTURES, load_module, measure, report
+
+advisory_time = load_module("advisory_time")
+MANILA = advisory_time.MANILA_TZ
+REFERENCE = datetime(2026, 2, 5, 20, 0, tzinfo=MANILA)
+
+# Relative phrases are resolved against REFERENCE
+PHRASES = [
+    "08:00 pm, 05 February 2026",
+    "Issued at 5:00 PM, 17 October 2026",
+    "Issued at 11:00 AM, 1 January 2027",
+    "Feb 06, 2026 05:00 AM",
+    "Sept 30, 2026 11:00 PM",
+    "12:00 NN, 06 February 2026",
+    "12:00 MN, 06 February 2026",
+    "11:00 PM today",
+    "5:00 AM tomorrow",
+    "5 a.m. tomorrow",
+    "(Valid for broadcast until the next advisory to be issued at 11:00 PM today)",
+    "11:00 PM",
+    "No time here",
+    "13:00 PM today",
+]
+
+
+def fixture_phrases() -> list[str]:
+    """Collect the time phrases of the bundled bulletin pages."""
+    phrases = []
+    for path in FIXTURES.values():
+        html = path.read_text(encoding="utf-8")
+        phrases += re.findall(r"Issued at ([^<]+)</h5>", html)
+        phrases += re.findall(r"issued at ([\d:]+ [AP]M \w+)\)", html)
+        phrases += re.findall(r"<li>\s*([A-Z][a-z]{2} \d{2}, \d{4} \d{2}:\d{2} [AP]M)", html)
+    return phrases
+
+
+def legacy(phrase: str):
+    """The previous approach, strptime on every poll and today/tomorrow only."""
+    match = re.search(r"([\d:]+ [AP]M) (\w+)", phrase)
+    if not match:
+        return None
+    day = REFERENCE.date() + timedelta(days=1 if match.group(2).lower() == "tomorrow" else 0)
+    try:
+        return datetime.combine(day, datetime.strptime(match.group(1), "%I:%M %p").time()).replace(tzinfo=MANILA)
+    except ValueError:
+        return None
+
+
+def parse_all(phrases):
+    return [advisory_time.parse_advisory_time(phrase, REFERENCE) for phrase in phrases]
+
+
+def parse_all_cold(phrases):
+    advisory_time._parse.cache_clear()
+    return parse_all(phrases)
+
+
+def main() -> None:
+    phrases = fixture_phrases()
+    workload = PHRASES + phrases
+    legacy_ms, _ = measure(lambda: [legacy(phrase) for phrase in workload], repeat=200)
+    cold_ms, _ = measure(parse_all_cold, workload, repeat=200)
+    warm_ms, _ = measure(parse_all, workload, repeat=200)
+    report(
+        f"{len(PHRASES)} phrasings and {len(phrases)} fixture phrases, time to parse all",
+        [
+            ("", "time (ms)"),
+            ("strptime per poll (old)", f"{legacy_ms:.3f}"),
+            ("precompiled, cold cache", f"{cold_ms:.3f}"),
+            ("precompiled, memoized", f"{warm_ms:.3f}"),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
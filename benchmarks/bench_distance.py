@@ -0,0 +1,60 @@
+"""Compare a per-pair haversine loop with the batched NumPy distance matrix.
+
+The coordinator computes every storm against home and every configured
+point of interest; this shows how both approaches scale with the number
+of points.
+
+    python benchmarks/bench_distance.py
+"""
+from __future__ import annotations
+
+import math
+import random
+
+from common import load_module, measure, report
+
+const = load_module("const")
+distance = load_module("distance")
+
+STORMS = [(12.2, 130.4), (8.7, 126.8), (18.9, 121.0)]
+POINT_COUNTS = (10, 100, 1_000, 10_000)
+
+
+def haversine(a, b):
+    """Scalar haversine, what the integration used per storm before."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (*a, *b))
+    h = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * const.EARTH_RADIUS_KM * math.asin(math.sqrt(h))
+
+
+def loop(storms, points):
+    return [[haversine(storm, point) for point in points] for storm in storms]
+
+
+def batched(storms, points):
+    return distance.nearest_storms(distance.distance_matrix(storms, points))
+
+
+def main() -> None:
+    rng = random.Random(0)
+    rows = [("", "loop (ms)", "numpy (ms)", "speedup")]
+    for count in POINT_COUNTS:
+        points = [(rng.uniform(4.5, 21.0), rng.uniform(116.0, 127.0)) for _ in range(count)]
+        expected = loop(STORMS, points)
+        matrix = distance.distance_matrix(STORMS, points)
+        assert all(
+            abs(matrix[i, j] - expected[i][j]) < 1e-6
+            for i in range(len(STORMS)) for j in range(count)
+        )
+
+        loop_ms, _ = measure(loop, STORMS, points, repeat=5)
+        numpy_ms, _ = measure(batched, STORMS, points, repeat=5)
+        rows.append((f"{len(STORMS)} storms x {count} points", f"{loop_ms:.3f}", f"{numpy_ms:.3f}", f"{loop_ms / numpy_ms:.1f}x"))
+    report("distance matrix", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Compare per-field panel lookups with the one-pass panel index.
+
+The previous extraction scanned every panel of a storm section again for
+each field it looked up (movement, strength, forecast, wind signal,
+location), lowercasing every heading each time, searched the h5 headings
+twice per field and compiled its regexes inline. The index maps every
+heading once. Both must extract the same fields from the fixtures.
+
+    python benchmarks/bench_panels.py
+"""
+from __future__ import annotations
+
+import re
+
+from bs4 import BeautifulSoup
+
+from common import load_module, measure, read_fixture, report
+
+parser = load_module("parser")
+
+
+def storm_sections(body: bytes):
+    stream = parser.BulletinStreamParser()
+    stream.feed_bytes(body)
+    stream.close()
+    soup = BeautifulSoup("".join(stream.sections), "html.parser")
+    sections = []
+    for section in soup.find_all("div", class_=parser.SECTION_CLASS):
+        sections.extend(section.find_all("div", class_="tab-pane") or [section])
+    return stream.sections, sections
+
+
+def legacy_fields(section) -> tuple:
+    """The previous lookups, one full panel scan per field."""
+
+    def get_panel(heading):
+        for panel in section.find_all("div", class_="panel"):
+            head = panel.find("div", class_="panel-heading")
+            if head and heading.lower() in head.get_text(strip=True).lower():
+                return panel
+        return None
+
+    def get_panel_text(heading):
+        panel = get_panel(heading)
+        body = panel.find("div", class_="panel-body") if panel else None
+        return body.get_text(strip=True) if body else None
+
+    movement = get_panel_text("Movement")
+    strength = get_panel_text("Strength") or ""
+    sustained = re.search(r"sustained winds of (\d+)", strength)
+    gust = re.search(r"gustiness of up to (\d+)", strength)
+    issued = section.find("h5", style=lambda s: s and "margin-bottom" in s)
+    if not issued:
+        issued = next((h5 for h5 in section.find_all("h5") if "Issued at" in h5.get_text()), None)
+    upcoming = section.find("h5", style=lambda s: s and "margin-top" in s)
+    if not upcoming:
+        upcoming = next((h5 for h5 in section.find_all("h5") if "next advisory" in h5.get_text()), None)
+    forecast = get_panel("Forecast Position")
+    signals = get_panel("Wind Signal")
+    location = get_panel_text("Location of Eye/center") or ""
+    coords = re.search(r'\(\s*(\d+\.\d+)\s*°N,\s*(\d+\.\d+)\s*°E\s*\)', location)
+    return (
+        movement,
+        sustained and int(sustained.group(1)),
+        gust and int(gust.group(1)),
+        issued.get_text(strip=True) if issued else None,
+        upcoming.get_text(strip=True) if upcoming else None,
+        forecast is not None,
+        signals is not None,
+        coords and coords.groups(),
+    )
+
+
+def indexed_fields(section) -> tuple:
+    """The same fields read from the panel index."""
+    panels = parser.index_panels(section)
+    movement = parser.panel_text(panels.get("movement"))
+    strength = parser.panel_text(panels.get("strength")) or ""
+    sustained = parser.SUSTAINED_PATTERN.search(strength)
+    gust = parser.GUST_PATTERN.search(strength)
+    issued, upcoming = parser._issued_headings(section)  # pylint: disable=protected-access
+    coords = parser.COORDINATES_PATTERN.search(parser.panel_text(panels.get("location")) or "")
+    return (
+        movement,
+        sustained and int(sustained.group(1)),
+        gust and int(gust.group(1)),
+        issued,
+        upcoming,
+        "forecast" in panels,
+        "signals" in panels,
+        coords and coords.groups(),
+    )
+
+
+def run(extract, sections):
+    return [extract(section) for section in sections]
+
+
+def main() -> None:
+    for name in ("advisory", "no_advisory"):
+        raw, sections = storm_sections(read_fixture(name))
+        assert run(legacy_fields, sections) == run(indexed_fields, sections)
+
+        legacy_ms, _ = measure(run, legacy_fields, sections, repeat=50)
+        indexed_ms, _ = measure(run, indexed_fields, sections, repeat=50)
+        full_ms, full_kib = measure(parser.parse_bulletin_sections, raw)
+        report(
+            f"{name} ({len(sections)} storm section(s))",
+            [
+                ("", "time (ms)"),
+                ("per-field panel scans", f"{legacy_ms:.3f}"),
+                ("one-pass panel index", f"{indexed_ms:.3f}"),
+                ("whole section parse", f"{full_ms:.2f}"),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Compare the full-page BeautifulSoup parse with the streaming section parser.
+
+Run from the repository root:
+
+    python benchmarks/bench_parser.py
+"""
+from __future__ import annotations
+
+from bs4 import BeautifulSoup
+
+from common import chunked, load_module, measure, read_fixture, report
+
+parser = load_module("parser")
+const = load_module("const")
+
+
+def full_page(body: bytes):
+    """The previous path: decode everything and build a tree of the whole page."""
+    soup = BeautifulSoup(body.decode("utf-8"), "html.parser")
+    return soup.find_all("div", class_=parser.SECTION_CLASS)
+
+
+def streaming(chunks: list[bytes]):
+    """The streaming path: scan the chunks, only build a tree of the sections."""
+    stream = parser.BulletinStreamParser()
+    for chunk in chunks:
+        stream.feed_bytes(chunk)
+    stream.close()
+    soup = BeautifulSoup("".join(stream.sections), "html.parser")
+    return soup.find_all("div", class_=parser.SECTION_CLASS)
+
+
+def main() -> None:
+    for name in ("advisory", "no_advisory"):
+        body = read_fixture(name)
+        chunks = chunked(body, const.FETCH_CHUNK_SIZE)
+
+        old_sections = full_page(body)
+        new_sections = streaming(chunks)
+        assert [s.get_text() for s in old_sections] == [s.get_text() for s in new_sections]
+
+        old_ms, old_kib = measure(full_page, body)
+        new_ms, new_kib = measure(streaming, chunks)
+        report(
+            f"{name} ({len(body) / 1024:.0f} KiB, {len(new_sections)} section(s))",
+            [
+                ("", "time (ms)", "peak (KiB)"),
+                ("full page BeautifulSoup", f"{old_ms:.2f}", f"{old_kib:.0f}"),
+                ("streaming section parser", f"{new_ms:.2f}", f"{new_kib:.0f}"),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""Compare bulletin request latency of a generic session with the tuned PAGASA session.
+
+A local stand-in server plays both PAGASA hosts. It serves the bulletin
+fixture (gzipped when asked) and a
+track image, and holds the first request of every new connection back by
+``--handshake-ms`` to stand in for TCP and TLS setup. Name lookups are
+delayed by ``--dns-ms``.
+
+"before" is the previous fetch path: Home Assistant's shared connector
+settings (15 s keep-alive, 10 s DNS cache), one timeout around the whole
+request and the body read with ``response.text()``. "after" uses
+session.create_session() with the connect and read timeouts and reads the
+raw chunks the stream parser is fed with. A refresh requests the bulletin
+``--bulletins`` times (a retry, or the coordinator and a button press) and
+then the track image. Refreshes are ``--interval`` seconds apart, by
+default longer than Home Assistant's keep-alive and DNS cache but within
+the session's keep-alive, as retries and manual refreshes are. Scheduled
+polls are further apart, past both keep-alives (``--interval 70``), there
+"after" only saves the lookup, and from 5 minutes on not even that.
+Parsing takes the same time in both and is not timed, both bodies must
+parse into the same sections.
+
+    python benchmarks/bench_session.py [--refreshes 4] [--interval 20]
+
+Needs Home Assistant installed.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import socket
+import statistics
+import time
+import weakref
+
+import aiohttp
+import async_timeout
+from aiohttp import web
+from aiohttp.resolver import DefaultResolver
+
+from common import load_module, read_fixture, report
+
+const = load_module("const")
+parser = load_module("parser")
+session_module = load_module("session")
+
+HOSTS = ("www.pagasa.test", "pubfiles.pagasa.test")
+IMAGE = bytes(64 * 1024)
+
+
+class SlowResolver(DefaultResolver):
+    """Resolve the stand-in hosts to localhost, after a delay."""
+
+    def __init__(self, delay: float) -> None:
+        super().__init__()
+        self.delay = delay
+        self.lookups = 0
+
+    async def resolve(self, host, port=0, family=socket.AF_INET):
+        self.lookups += 1
+        await asyncio.sleep(self.delay)
+        return [{"hostname": host, "host": "127.0.0.1", "port": port, "family": socket.AF_INET, "proto": 0, "flags": 0}]
+
+
+async def start_server(body: bytes, handshake: float):
+    compressed = gzip.compress(body)
+    connections = weakref.WeakSet()
+    stats = {"connections": 0}
+
+    async def handle(request: web.Request) -> web.Response:
+        transport = request.transport
+        if transport not in connections:
+            connections.add(transport)
+            stats["connections"] += 1
+            await asyncio.sleep(handshake)
+        if request.path.endswith(".png"):
+            return web.Response(body=IMAGE, content_type="image/png")
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            return web.Response(body=compressed, headers={"Content-Type": "text/html", "Content-Encoding": "gzip"})
+        return web.Response(body=body, headers={"Content-Type": "text/html"})
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, site._server.sockets[0].getsockname()[1], stats  # pylint: disable=protected-access
+
+
+async def fetch_before(session: aiohttp.ClientSession, url: str) -> list[str]:
+    async with async_timeout.timeout(const.FETCH_TIMEOUT):
+        async with session.get(url) as response:
+            return [await response.text()]
+
+
+async def fetch_after(session: aiohttp.ClientSession, url: str) -> list[bytes]:
+    timeout = aiohttp.ClientTimeout(
+        total=const.FETCH_TIMEOUT, sock_connect=const.FETCH_CONNECT_TIMEOUT, sock_read=const.FETCH_READ_TIMEOUT
+    )
+    async with session.get(url, timeout=timeout) as response:
+        return [chunk async for chunk in response.content.iter_chunked(const.FETCH_CHUNK_SIZE)]
+
+
+async def fetch_image(session: aiohttp.ClientSession, url: str) -> bytes:
+    async with session.get(url) as response:
+        return await response.read()
+
+
+def parse(chunks: list) -> list[str]:
+    stream = parser.BulletinStreamParser()
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            stream.feed_bytes(chunk)
+        else:
+            stream.feed(chunk)
+    stream.close()
+    return stream.sections
+
+
+class Client:
+    """One fetch path against its own stand-in server."""
+
+    def __init__(self, name: str, args, body: bytes) -> None:
+        self.name = name
+        self.args = args
+        self.body = body
+        self.latencies: list[list[float]] = []
+        self.image_latencies: list[float] = []
+        self.chunks: list = []
+
+    async def start(self) -> None:
+        self.runner, port, self.server_stats = await start_server(self.body, self.args.handshake_ms / 1000)
+        self.resolver = SlowResolver(self.args.dns_ms / 1000)
+        if self.name == "before":
+            # Home Assistant's shared connector, as async_get_clientsession sets it up
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(resolver=self.resolver, limit=100, limit_per_host=0)
+            )
+            self.fetch = fetch_before
+        else:
+            self.session = session_module.create_session(resolver=self.resolver)
+            self.fetch = fetch_after
+        self.bulletin_url = f"http://{HOSTS[0]}:{port}/tropical-cyclone/severe-weather-bulletin"
+        self.image_url = f"http://{HOSTS[1]}:{port}/tamss/weather/track.png"
+
+    async def refresh(self) -> None:
+        latencies = []
+        for _ in range(self.args.bulletins):
+            start = time.perf_counter()
+            self.chunks = await self.fetch(self.session, self.bulletin_url)
+            latencies.append((time.perf_counter() - start) * 1000)
+        self.latencies.append(latencies)
+        start = time.perf_counter()
+        await fetch_image(self.session, self.image_url)
+        self.image_latencies.append((time.perf_counter() - start) * 1000)
+
+    async def stop(self) -> None:
+        await self.session.close()
+        await self.runner.cleanup()
+
+
+async def run(args, body: bytes) -> list[Client]:
+    clients = [Client(name, args, body) for name in ("before", "after")]
+    for client in clients:
+        await client.start()
+    for refresh in range(args.refreshes):
+        if refresh:
+            await asyncio.sleep(args.interval)
+        for client in clients:
+            await client.refresh()
+    for client in clients:
+        await client.stop()
+    return clients
+
+
+def median(values: list[float]) -> str:
+    return f"{statistics.median(values):.2f}" if values else "-"
+
+
+def main() -> None:
+    argparser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    argparser.add_argument("--refreshes", type=int, default=4)
+    argparser.add_argument("--interval", type=float, default=20, help="seconds between refreshes")
+    argparser.add_argument("--bulletins", type=int, default=2, help="bulletin requests per refresh, as with a retry")
+    argparser.add_argument("--handshake-ms", type=float, default=30, help="delay of a new connection")
+    argparser.add_argument("--dns-ms", type=float, default=20, help="delay of a name lookup")
+    args = argparser.parse_args()
+
+    clients = asyncio.run(run(args, read_fixture("advisory")))
+    assert parse(clients[0].chunks) == parse(clients[1].chunks)
+
+    report(
+        f"median request latency (ms), {args.refreshes} refreshes {args.interval:g} s apart, "
+        f"{args.bulletins} bulletin requests and an image each "
+        f"(new connection +{args.handshake_ms:g} ms, lookup +{args.dns_ms:g} ms)",
+        [
+            ("", "first", "refresh", "same refresh", "image", "connections", "lookups"),
+            *(
+                (
+                    client.name,
+                    f"{client.latencies[0][0]:.2f}",
+                    median([latencies[0] for latencies in client.latencies[1:]]),
+                    median([latency for latencies in client.latencies for latency in latencies[1:]]),
+                    median(client.image_latencies),
+                    client.server_stats["connections"],
+                    client.resolver.lookups,
+                )
+                for client in clients
+            ),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Compare a cold parse of the bulletin with restoring the on-disk snapshot.
+
+Setup with a snapshot skips the network entirely (up to the 10 s fetch
+timeout on a flaky link); this measures what is left on the CPU side.
+
+    python benchmarks/bench_snapshot.py
+"""
+from __future__ import annotations
+
+import json
+
+from common import chunked, load_module, measure, read_fixture, report
+
+parser = load_module("parser")
+const = load_module("const")
+
+
+def cold_parse(chunks: list[bytes]):
+    """Stream and extract the bulletin, as the first refresh does."""
+    stream = parser.BulletinStreamParser()
+    for chunk in chunks:
+        stream.feed_bytes(chunk)
+    stream.close()
+    return parser.Bulletin(
+        parser.parse_bulletin_sections(stream.sections), stream.no_active, stream.digest()
+    )
+
+
+def restore(raw: str):
+    """Decode the stored snapshot, as setup does when one is available."""
+    return parser.Bulletin.from_dict(json.loads(raw)["bulletin"])
+
+
+def main() -> None:
+    for name in ("advisory", "no_advisory"):
+        body = read_fixture(name)
+        chunks = chunked(body, const.FETCH_CHUNK_SIZE)
+        bulletin = cold_parse(chunks)
+        raw = json.dumps({"saved_at": "2026-02-05T12:00:00+00:00", "bulletin": bulletin.as_dict()})
+        assert restore(raw) == bulletin
+
+        parse_ms, parse_kib = measure(cold_parse, chunks)
+        restore_ms, restore_kib = measure(restore, raw)
+        report(
+            f"{name} (snapshot {len(raw)} bytes)",
+            [
+                ("", "time (ms)", "peak (KiB)"),
+                ("stream + parse body", f"{parse_ms:.2f}", f"{parse_kib:.0f}"),
+                ("restore snapshot", f"{restore_ms:.3f}", f"{restore_kib:.0f}"),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
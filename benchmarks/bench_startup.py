@@ -0,0 +1,198 @@
+"""Measure how long the integration takes to load and to create its entities.
+
+Import time is measured in fresh interpreters, with the Home Assistant
+modules the integration builds on already imported (Home Assistant loads
+them itself), so only the integration's own modules count. BeautifulSoup
+and NumPy must not be among them: they are imported on the first parse and
+in the executor during setup, their import time is shown separately.
+
+Setup runs the integration's ``async_setup_entry`` against a stand-in
+server that answers after ``--latency`` seconds, once without and once
+with a saved snapshot. Entities are created when setup forwards to the
+platforms, which must not wait for the server.
+
+    python benchmarks/bench_startup.py [--latency 2] [--repeat 5]
+
+Needs Home Assistant installed.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+from aiohttp import web
+
+from common import FIXTURES, ROOT, report
+
+sys.path.insert(0, str(ROOT))
+
+from homeassistant import config_entries  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+PLATFORMS = ("sensor", "binary_sensor", "button", "image")
+DEFERRED = ("bs4", "numpy")
+PRELOAD = (
+    "homeassistant.components.binary_sensor",
+    "homeassistant.components.button",
+    "homeassistant.components.image",
+    "homeassistant.components.sensor",
+    "homeassistant.components.websocket_api",
+    "homeassistant.helpers.aiohttp_client",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.event",
+    "homeassistant.helpers.selector",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.update_coordinator",
+    "aiohttp",
+)
+
+IMPORT_SCRIPT = f"""
+import importlib, json, sys, time
+sys.path.insert(0, {str(ROOT)!r})
+for name in {PRELOAD!r}:
+    importlib.import_module(name)
+start = time.perf_counter()
+importlib.import_module("custom_components.typhoon_sensor")
+for platform in {PLATFORMS!r}:
+    importlib.import_module("custom_components.typhoon_sensor." + platform)
+integration = time.perf_counter() - start
+loaded = [name for name in {DEFERRED!r} if name in sys.modules]
+start = time.perf_counter()
+for name in {DEFERRED!r}:
+    importlib.import_module(name)
+print(json.dumps({{"integration": integration, "deferred": time.perf_counter() - start, "loaded": loaded}}))
+"""
+
+
+def import_times(repeat: int) -> dict:
+    """Return the best import times of ``repeat`` fresh interpreters."""
+    runs = [
+        json.loads(subprocess.run([sys.executable, "-c", IMPORT_SCRIPT], check=True, capture_output=True, text=True).stdout)
+        for _ in range(repeat)
+    ]
+    for run in runs:
+        assert not run["loaded"], f"imported at load time: {run['loaded']}"
+    return {
+        "integration": min(run["integration"] for run in runs) * 1000,
+        "deferred": min(run["deferred"] for run in runs) * 1000,
+    }
+
+
+async def setup_once(config_dir: str, url: str) -> dict:
+    """Set up one entry and return when its entities were created and got data."""
+    from custom_components.typhoon_sensor import async_setup_entry  # pylint: disable=import-outside-toplevel
+    from custom_components.typhoon_sensor import source as source_module  # pylint: disable=import-outside-toplevel
+
+    hass = HomeAssistant(config_dir)
+    hass.config.set_time_zone("Asia/Manila")
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    entry = config_entries.ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain="typhoon_sensor",
+        title="Typhoon Sensor",
+        data={"latitude": 14.6, "longitude": 121.0, "scan_interval": 30},
+        source="user",
+        options={},
+    )
+    marks = {}
+    first_data = asyncio.Event()
+
+    async def forward(_entry, _platforms):
+        marks["entities"] = time.perf_counter()
+
+    start = time.perf_counter()
+    with (
+        patch.object(source_module, "BULLETIN_URL", url),
+        patch.object(hass.config_entries, "async_forward_entry_setups", forward),
+    ):
+        await async_setup_entry(hass, entry)
+        marks["setup"] = time.perf_counter()
+        coordinator = hass.data["typhoon_sensor"][entry.entry_id]
+        restored = coordinator.source.restored_at is not None
+
+        def _updated():
+            if coordinator.source.fetch_stats["fetches"]:
+                first_data.set()
+
+        coordinator.async_add_listener(_updated)
+        await first_data.wait()
+        marks["data"] = time.perf_counter()
+
+    await coordinator.async_shutdown()
+    coordinator.source.async_release()
+    # Flushes the snapshot the next run restores from
+    await hass.async_stop(force=True)
+    return {
+        "restored": restored,
+        **{name: (mark - start) * 1000 for name, mark in marks.items()},
+    }
+
+
+async def setup_times(latency: float) -> list[dict]:
+    body = FIXTURES["advisory"].read_bytes()
+
+    async def handle(_request):
+        await asyncio.sleep(latency)
+        return web.Response(body=body, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # pylint: disable=protected-access
+    url = f"http://127.0.0.1:{port}/tropical-cyclone/severe-weather-bulletin"
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        runs = [await setup_once(config_dir, url), await setup_once(config_dir, url)]
+    await runner.cleanup()
+    assert not runs[0]["restored"] and runs[1]["restored"]
+    for run in runs:
+        assert run["entities"] < latency * 1000, "setup waited for the server"
+    return runs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--latency", type=float, default=2.0, help="seconds the server takes to answer")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per import measurement")
+    args = parser.parse_args()
+
+    imports = import_times(args.repeat)
+    report(
+        "import (best of %d fresh interpreters)" % args.repeat,
+        [
+            ("", "time (ms)"),
+            ("integration and platforms", f"{imports['integration']:.1f}"),
+            ("bs4 + numpy (deferred)", f"{imports['deferred']:.1f}"),
+        ],
+    )
+
+    runs = asyncio.run(setup_times(args.latency))
+    report(
+        f"setup, server answers after {args.latency:g} s",
+        [
+            ("", "setup (ms)", "entities (ms)", "data (ms)"),
+            *(
+                (
+                    "from snapshot" if run["restored"] else "no snapshot",
+                    f"{run['setup']:.1f}",
+                    f"{run['entities']:.1f}",
+                    f"{run['data']:.1f}",
+                )
+                for run in runs
+            ),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Shared helpers for the Typhoon Sensor benchmarks."""
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = {
+    "advisory": ROOT / "severe-weather-bulletin.html",
+    "no_advisory": ROOT / "severe-weather-bulletin_noadvisory.html",
+}
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def load_module(name: str):
+    """Import a module of the integration, Home Assistant is only needed by the ones that use it."""
+    return importlib.import_module(f"custom_components.typhoon_sensor.{name}")
+
+
+def read_fixture(name: str) -> bytes:
+    """Return the raw bytes of a bundled bulletin fixture."""
+    return FIXTURES[name].read_bytes()
+
+
+def chunked(data: bytes, size: int):
+    """Split a body the way it arrives from the network."""
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def measure(func, *args, repeat: int = 20):
+    """Return (best time in ms, peak traced memory in KiB) for a call."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / 1024
+
+
+def report(title: str, rows: list[tuple]) -> None:
+    """Print a small result table."""
+    print(title)
+    for row in rows:
+        label, *values = row
+        print(f"  {label:<32}" + "".join(f"{value:>14}" for value in values))
+    print()
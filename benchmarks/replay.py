@@ -0,0 +1,363 @@
+"""Replay captured bulletins against the coordinator on a simulated clock.
+
+A local aiohttp server stands in for PAGASA and serves a timeline of
+captured bulletins: every file is published some minutes after its
+"issued at" time (files without an advisory follow the previous one by
+``--step`` hours). The coordinator and shared bulletin source run for real
+inside a bare Home Assistant instance, but instead of waiting for the
+scheduled refresh the clock jumps straight to it, so days of storm
+lifecycle replay in seconds. The server can add latency, fail requests and
+ignore validators to exercise the retry and 304 paths.
+
+Unlike the other benchmarks this one needs Home Assistant installed.
+
+    python benchmarks/replay.py                      # the bundled fixtures
+    python benchmarks/replay.py captures/ --latency 0.2 --error-rate 0.1
+    python benchmarks/replay.py captures/ --json before.json
+
+A directory may contain a ``timeline.json`` mapping file names to ISO
+publication times, to replay captures exactly as they were seen.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+import hashlib
+import json
+import logging
+from pathlib import Path
+import random
+import tempfile
+import time
+import tracemalloc
+from unittest.mock import patch
+
+from aiohttp import web
+
+from common import FIXTURES, load_module, report
+
+advisory_time = load_module("advisory_time")
+const = load_module("const")
+parser = load_module("parser")
+coordinator_module = load_module("coordinator")
+source_module = load_module("source")
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.util import dt as dt_util  # noqa: E402
+
+HOME = (14.6, 121.0)  # Manila
+START_WITHOUT_ADVISORY = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass
+class Publication:
+    """One captured bulletin and when the stand-in server starts serving it."""
+
+    name: str
+    body: bytes
+    published_at: datetime
+    issued_at: datetime | None
+    etag: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.etag = f'"{hashlib.sha1(self.body).hexdigest()[:16]}"'
+
+
+def issued_at(body: bytes) -> datetime | None:
+    """Return the newest "issued at" time of a bulletin, None without advisories."""
+    stream = parser.BulletinStreamParser()
+    stream.feed_bytes(body)
+    stream.close()
+    times = [
+        advisory_time.parse_issued_time(typhoon["advisory_time"])
+        for typhoon in parser.parse_bulletin_sections(stream.sections)
+    ]
+    return max(filter(None, times), default=None)
+
+
+def load_timeline(paths: list[Path], lag: timedelta, step: timedelta) -> list[Publication]:
+    """Order captured bulletins by publication time."""
+    manifest = {}
+    if len(paths) == 1 and paths[0].is_dir():
+        if (timeline := paths[0] / "timeline.json").exists():
+            manifest = json.loads(timeline.read_text(encoding="utf-8"))
+        paths = sorted(paths[0].glob("*.htm*"))
+
+    publications = []
+    previous = None
+    for path in paths:
+        body = path.read_bytes()
+        issued = issued_at(body)
+        if path.name in manifest:
+            published = dt_util.parse_datetime(manifest[path.name])
+        elif issued is not None:
+            published = issued + lag
+        else:
+            published = previous + step if previous else START_WITHOUT_ADVISORY
+        publications.append(Publication(path.name, body, published, issued))
+        previous = published
+    publications.sort(key=lambda publication: publication.published_at)
+    return publications
+
+
+class SimulatedClock:
+    """The time the coordinator, the source and the server agree on."""
+
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def utcnow(self) -> datetime:
+        return self.now
+
+
+class BulletinServer:
+    """Serve the publication that is current on the simulated clock."""
+
+    def __init__(self, timeline, clock, latency, error_rate, conditional, rng) -> None:
+        self.timeline = timeline
+        self.clock = clock
+        self.latency = latency
+        self.error_rate = error_rate
+        self.conditional = conditional
+        self.rng = rng
+        self.requests = {"200": 0, "304": 0, "503": 0}
+        self.bytes_sent = 0
+
+    def current(self) -> Publication:
+        current = self.timeline[0]
+        for publication in self.timeline:
+            if publication.published_at <= self.clock.now:
+                current = publication
+        return current
+
+    async def handle(self, request: web.Request) -> web.Response:
+        if self.latency:
+            # Exponential around the configured mean, like a real link
+            await asyncio.sleep(self.rng.expovariate(1 / self.latency))
+        if self.rng.random() < self.error_rate:
+            self.requests["503"] += 1
+            return web.Response(status=503)
+        publication = self.current()
+        if self.conditional and request.headers.get("If-None-Match") == publication.etag:
+            self.requests["304"] += 1
+            return web.Response(status=304, headers={"ETag": publication.etag})
+        self.requests["200"] += 1
+        self.bytes_sent += len(publication.body)
+        return web.Response(
+            body=publication.body,
+            content_type="text/html",
+            charset="utf-8",
+            headers={"ETag": publication.etag} if self.conditional else None,
+        )
+
+
+class ReplayCoordinator(coordinator_module.TyphoonDataCoordinator):
+    """Coordinator whose scheduled refreshes are driven by the replay loop."""
+
+    def _schedule_poll(self, decision):
+        self.next_decision = decision
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest rank percentile, good enough for a few hundred samples."""
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(q / 100 * len(ordered) + 0.5) - 1))]
+
+
+async def replay(timeline, args, trace_allocations: bool = False) -> dict:
+    """Run the coordinator through the whole timeline once."""
+    rng = random.Random(args.seed)
+    clock = SimulatedClock(timeline[0].published_at)
+    server = BulletinServer(timeline, clock, args.latency, args.error_rate, not args.no_conditional, rng)
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", server.handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # pylint: disable=protected-access
+
+    polls = []
+    seen = {}
+    end = timeline[-1].published_at + timedelta(hours=args.tail)
+    with (
+        tempfile.TemporaryDirectory() as config_dir,
+        patch.object(dt_util, "utcnow", clock.utcnow),
+        # Retry delays are real sleeps, keep them short so failures don't stall the replay
+        patch.object(source_module, "FETCH_RETRY_BACKOFF", args.retry_backoff),
+    ):
+        hass = HomeAssistant(config_dir)
+        hass.config.set_time_zone("Asia/Manila")
+        source = source_module.async_get_source(hass)
+        source.url = f"http://127.0.0.1:{port}{const.BULLETIN_URL.split('gov.ph', 1)[1]}"
+        coordinator = ReplayCoordinator(
+            hass, source, *HOME, args.scan_interval, not args.fixed_interval, args.idle_interval
+        )
+        coordinator.scheduler._rng = random.Random(args.seed)  # pylint: disable=protected-access
+        coordinator.next_decision = None
+        if trace_allocations:
+            tracemalloc.start()
+
+        while clock.now <= end and len(polls) < args.max_polls:
+            # The simulated clock moved on, the source must not hand out its cached bulletin
+            source.async_expire()
+            if trace_allocations:
+                tracemalloc.reset_peak()
+            start = time.perf_counter()
+            await coordinator.async_refresh()
+            latency = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] if trace_allocations else None
+
+            publication = server.current()
+            if coordinator.last_update_success and coordinator.stale_since is None:
+                seen.setdefault(publication.name, clock.now)
+            decision = coordinator.next_decision
+            polls.append({
+                "at": clock.now.isoformat(),
+                "latency_ms": latency * 1000,
+                "parse_ms": source.refresh_stats.get("parse_ms", 0.0),
+                "loop_lag_ms": source.refresh_stats.get("max_loop_lag_ms", 0.0),
+                "peak_kib": peak / 1024 if peak is not None else None,
+                "serving": publication.name,
+                "storms": sorted(coordinator.data["storms"]),
+                "reason": decision.reason if decision else "fixed interval",
+                "stale": coordinator.stale_since is not None,
+            })
+            if decision is not None and decision.next_poll > clock.now:
+                clock.now = decision.next_poll
+            else:
+                clock.now += timedelta(minutes=args.scan_interval)
+
+        if trace_allocations:
+            tracemalloc.stop()
+        final = coordinator.data
+        source.async_release()
+        await hass.async_stop(force=True)
+    await runner.cleanup()
+
+    return {
+        "polls": polls,
+        "requests": dict(server.requests),
+        "bytes_sent": server.bytes_sent,
+        "fetch_stats": dict(source.fetch_stats),
+        "scheduler": coordinator.scheduler.as_dict()["stats"],
+        "detection_delay_min": {
+            publication.name: (seen[publication.name] - publication.published_at).total_seconds() / 60
+            # The replay starts on the first one, there is nothing to detect
+            for publication in timeline
+            if publication.name in seen and publication.published_at > timeline[0].published_at
+        },
+        "missed": [
+            publication.name
+            for publication, following in zip(timeline, [*timeline[1:], None])
+            # A capture replaced at the same instant is never served
+            if publication.name not in seen
+            and (following is None or following.published_at > publication.published_at)
+        ],
+        "final_storms": sorted(final["storms"]),
+    }
+
+
+def check(timeline, result, args) -> None:
+    """Sanity checks, a replay that misses bulletins is not worth timing."""
+    if args.error_rate == 0:
+        assert result["requests"]["503"] == 0
+        assert not result["missed"], f"bulletins never seen: {result['missed']}"
+        last = timeline[-1]
+        stream = parser.BulletinStreamParser()
+        stream.feed_bytes(last.body)
+        stream.close()
+        expected = sorted(parser.storm_ids(parser.parse_bulletin_sections(stream.sections)))
+        assert result["final_storms"] == expected, (result["final_storms"], expected)
+    assert result["fetch_stats"]["full_parses"] <= len(timeline) + result["requests"]["503"]
+
+
+def print_results(timeline, runs, traced, args) -> None:
+    latencies = [poll["latency_ms"] for run in runs for poll in run["polls"]]
+    parses = [poll["parse_ms"] for run in runs for poll in run["polls"] if poll["parse_ms"]]
+    lags = [poll["loop_lag_ms"] for run in runs for poll in run["polls"]]
+    peaks = [poll["peak_kib"] for poll in traced["polls"]]
+    delays = [delay for run in runs for delay in run["detection_delay_min"].values()]
+    first = runs[0]
+
+    span = timeline[-1].published_at - timeline[0].published_at + timedelta(hours=args.tail)
+    report(
+        f"Timeline: {len(timeline)} bulletins over {span.total_seconds() / 3600:.1f} simulated hours",
+        [(p.name[:32], p.published_at.isoformat(), "advisory" if p.issued_at else "none") for p in timeline],
+    )
+    report(
+        f"Requests per run ({len(runs)} runs)",
+        [
+            ("polls", len(first["polls"])),
+            *((f"HTTP {status}", count) for status, count in first["requests"].items()),
+            ("full parses", first["fetch_stats"]["full_parses"]),
+            ("section hash hits", first["fetch_stats"]["hash_hits"]),
+            ("burst probes", first["scheduler"]["probes"]),
+            ("fetch retries", first["fetch_stats"]["retries"]),
+            ("polls served stale", sum(poll["stale"] for poll in first["polls"])),
+            ("KiB served", f"{first['bytes_sent'] / 1024:.0f}"),
+        ],
+    )
+    rows = [("", "p50", "p90", "p99", "max")]
+    for label, values in (
+        ("refresh latency (ms)", latencies),
+        ("parse time (ms)", parses),
+        ("loop lag (ms)", lags),
+        ("peak alloc per refresh (KiB)", peaks),
+        ("detection delay (min)", delays),
+    ):
+        rows.append((label, *(f"{percentile(values, q):.2f}" for q in (50, 90, 99)), f"{max(values, default=float('nan')):.2f}"))
+    report("Percentiles", rows)
+
+    if args.verbose:
+        print("Polls (first run)")
+        for poll in first["polls"]:
+            print(f"  {poll['at'][:19]}  {poll['latency_ms']:8.1f} ms  {poll['serving'][:28]:<28}  {poll['reason']}")
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("captures", nargs="*", type=Path, help="bulletin files or one directory of them")
+    arg_parser.add_argument("--lag", type=float, default=20, help="minutes between issued and published (20)")
+    arg_parser.add_argument("--step", type=float, default=6, help="hours before a bulletin without advisory (6)")
+    arg_parser.add_argument("--tail", type=float, default=12, help="hours to keep polling after the last bulletin (12)")
+    arg_parser.add_argument("--latency", type=float, default=0.0, help="mean server latency in seconds (0)")
+    arg_parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered 503 (0)")
+    arg_parser.add_argument("--retry-backoff", type=float, default=0.05, help="seconds before a fetch retry (0.05)")
+    arg_parser.add_argument("--no-conditional", action="store_true", help="ignore validators, never answer 304")
+    arg_parser.add_argument("--scan-interval", type=int, default=const.DEFAULT_SCAN_INTERVAL, help="minutes")
+    arg_parser.add_argument("--idle-interval", type=int, default=const.DEFAULT_IDLE_POLL_INTERVAL, help="minutes")
+    arg_parser.add_argument("--fixed-interval", action="store_true", help="poll every scan interval, no smart polling")
+    arg_parser.add_argument("--runs", type=int, default=3, help="timed replays, plus one traced for allocations (3)")
+    arg_parser.add_argument("--max-polls", type=int, default=2000)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--json", type=Path, help="also write the raw results to this file")
+    arg_parser.add_argument("-v", "--verbose", action="store_true", help="print every poll and its reason")
+    args = arg_parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    timeline = load_timeline(
+        args.captures or [FIXTURES["advisory"], FIXTURES["no_advisory"]],
+        timedelta(minutes=args.lag),
+        timedelta(hours=args.step),
+    )
+    if not timeline:
+        arg_parser.error("no bulletins to replay")
+
+    runs = [asyncio.run(replay(timeline, args)) for _ in range(args.runs)]
+    # Tracing slows everything down, allocations get a run of their own
+    traced = asyncio.run(replay(timeline, args, trace_allocations=True))
+    for result in (*runs, traced):
+        check(timeline, result, args)
+    print_results(timeline, runs, traced, args)
+
+    if args.json:
+        args.json.write_text(json.dumps({"runs": runs, "traced": traced}, indent=1), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
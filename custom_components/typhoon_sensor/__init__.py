@@ -1,17 +1,37 @@
-"""The Typhoon Sensor integration."""
+"""The Typhoon Sensor integration.
+
+Home Assistant is only imported when an entry is set up, so the HA-free
+modules (parser, archive, history, forecast, signals, distance and the
+rest) can be imported from this package without it.
+"""
 from __future__ import annotations
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from .const import DOMAIN, DATA_SOURCE, DEFAULT_SCAN_INTERVAL, DEFAULT_DISTANCE_THRESHOLD
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL
-from .sensor import TyphoonDataCoordinator
+_LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BUTTON]
+PLATFORMS = ["sensor", "button", "image", "binary_sensor"]
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Typhoon Sensor from a config entry."""
+    # pylint: disable=import-outside-toplevel
+    from .alerts import build_rules
+    from .coordinator import TyphoonDataCoordinator
+    from .distance import load_numpy
+    from .places import locate, normalize
+    from .source import async_apply_source_options, async_get_source
+    from .websocket import async_register_websocket
+
+    start = time.perf_counter()
 
     hass.data.setdefault(DOMAIN, {})
 
@@ -19,26 +39,70 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     smart_polling = entry.data.get("smart_polling", False)
     idle_poll_interval = entry.data.get("idle_poll_interval", 480)
 
+    # One bulletin source is shared by every entry, only the home coordinates differ
+    source = async_get_source(hass)
+    entry.async_on_unload(source.async_release)
+    async_apply_source_options(hass, source)
+
+    # Locating home loads the bundled gazetteer and the distances need NumPy,
+    # load both off the event loop while the snapshot is read
+    (province, town), _, bulletin = await asyncio.gather(
+        hass.async_add_executor_job(locate, entry.data.get("latitude"), entry.data.get("longitude")),
+        hass.async_add_executor_job(load_numpy),
+        source.async_load_snapshot(),
+    )
+    if home_province := entry.options.get("home_province"):
+        province, town = normalize(home_province), None
+
     coordinator = TyphoonDataCoordinator(
-        hass, 
+        hass,
+        source,
         entry.data.get("latitude"), 
         entry.data.get("longitude"),
         scan_interval,
         smart_polling,
-        idle_poll_interval
+        idle_poll_interval,
+        entry.options.get("zones", []),
+        (province, town),
+        entry.options.get("distance_threshold", DEFAULT_DISTANCE_THRESHOLD),
+        build_rules(entry.options),
+    )
+
+    # Start from the last saved bulletin when there is one, otherwise the
+    # entities are unavailable until the first fetch. Either way setup doesn't
+    # wait for PAGASA, the refresh runs in the background
+    if bulletin is not None:
+        coordinator.async_restore(bulletin)
+    else:
+        coordinator.async_set_pending()
+    entry.async_create_background_task(
+        hass, coordinator.async_refresh(), f"{DOMAIN} refresh {entry.entry_id}"
     )
-    
-    await coordinator.async_config_entry_first_refresh()
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    async_register_websocket(hass)
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    _LOGGER.debug(
+        "Setup took %.1f ms (%s)",
+        (time.perf_counter() - start) * 1000,
+        "restored from snapshot" if bulletin is not None else "waiting for the first fetch",
+    )
     return True
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
+        if (source := hass.data[DOMAIN].get(DATA_SOURCE)) is not None:
+            from .source import async_apply_source_options  # pylint: disable=import-outside-toplevel
+
+            async_apply_source_options(hass, source, exclude=entry.entry_id)
 
     return unload_ok
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""Parse the time phrasings used in the PAGASA bulletin."""
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+import re
+from zoneinfo import ZoneInfo
+
+MANILA_TZ = ZoneInfo("Asia/Manila")
+
+# "8:00 PM", "08:00 pm", "5 AM", "12:00 NN" (noon), "12:00 MN" (midnight), "5:00 a.m."
+TIME_PATTERN = re.compile(
+    r"\b(?P<hour>\d{1,2})(?::(?P<minute>\d{2}))?\s*(?P<meridiem>[ap]\.?\s?m\.?|nn|mn)(?![a-z])",
+    re.I,
+)
+# "05 February 2026" or "Feb 06, 2026" / "February 6 2026"
+DATE_PATTERN = re.compile(
+    r"\b(?:(?P<day>\d{1,2})\s+(?P<month>[a-z]{3,9})\.?,?\s+(?P<year>\d{4})"
+    r"|(?P<month2>[a-z]{3,9})\.?\s+(?P<day2>\d{1,2}),?\s+(?P<year2>\d{4}))\b",
+    re.I,
+)
+RELATIVE_PATTERN = re.compile(r"\b(?P<relative>today|tonight|tomorrow|yesterday)\b", re.I)
+
+MONTHS = {
+    name: index
+    for index, names in enumerate((
+        ("jan", "january"), ("feb", "february"), ("mar", "march"), ("apr", "april"),
+        ("may",), ("jun", "june"), ("jul", "july"), ("aug", "august"),
+        ("sep", "sept", "september"), ("oct", "october"), ("nov", "november"), ("dec", "december"),
+    ), start=1)
+    for name in names
+}
+RELATIVE_DAYS = {"yesterday": -1, "today": 0, "tonight": 0, "tomorrow": 1}
+
+
+def _hour(hour: int, meridiem: str) -> int:
+    meridiem = meridiem.lower().replace(".", "").replace(" ", "")
+    if meridiem == "nn":
+        return 12
+    if meridiem == "mn":
+        return 0
+    return hour % 12 + (12 if meridiem == "pm" else 0)
+
+
+@lru_cache(maxsize=256)
+def _parse(text: str, reference: date | None) -> datetime | None:
+    time_match = TIME_PATTERN.search(text)
+    if time_match is None:
+        return None
+    hour = int(time_match.group("hour"))
+    minute = int(time_match.group("minute") or 0)
+    if hour > 12 or minute > 59:
+        return None
+    hour = _hour(hour, time_match.group("meridiem"))
+
+    if date_match := DATE_PATTERN.search(text):
+        month = MONTHS.get((date_match.group("month") or date_match.group("month2")).lower())
+        if month is None:
+            return None
+        try:
+            day = date(
+                int(date_match.group("year") or date_match.group("year2")),
+                month,
+                int(date_match.group("day") or date_match.group("day2")),
+            )
+        except ValueError:
+            return None
+    elif reference is not None:
+        relative = RELATIVE_PATTERN.search(text)
+        day = reference + timedelta(days=RELATIVE_DAYS[relative.group("relative").lower()] if relative else 0)
+    else:
+        return None
+    return datetime(day.year, day.month, day.day, hour, minute, tzinfo=MANILA_TZ)
+
+
+def parse_advisory_time(text: str | None, reference: datetime | None = None) -> datetime | None:
+    """Resolve a bulletin time phrase to an aware Asia/Manila datetime.
+
+    Understands "08:00 pm, 05 February 2026", "Issued at 5:00 PM, 17
+    October 2026", "Feb 06, 2026 05:00 AM", "12:00 NN" and relative
+    phrases such as "11:00 PM today" or "5:00 AM tomorrow". Relative
+    phrases are resolved against the Manila date of ``reference`` (the
+    advisory they were published in, or now), so a bulletin read after
+    midnight still means the day it was issued. Results are memoized per
+    phrase and reference day. Returns None when the phrase has no time.
+    """
+    if not text:
+        return None
+    if reference is None:
+        reference = datetime.now(MANILA_TZ)
+    return _parse(" ".join(text.split()), reference.astimezone(MANILA_TZ).date())
+
+
+def parse_issued_time(text: str | None) -> datetime | None:
+    """Parse an absolute "Issued at" time, None when the phrase has no date."""
+    if not text:
+        return None
+    return _parse(" ".join(text.split()), None)
@@ -0,0 +1,169 @@
+"""Threshold alerts for the Typhoon Sensor integration."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+
+from .const import (
+    ALERT_DISTANCE_HYSTERESIS,
+    ALERT_WIND_HYSTERESIS,
+    ALERT_MIN_HOLD,
+    CLASSIFICATION_RANKS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class AlertRule:
+    """A threshold on one storm value.
+
+    ``kind`` is "distance" (active within ``threshold`` km of home), "wind"
+    (active at or above ``threshold`` km/h sustained winds) or
+    "classification" (fires when a storm is upgraded, no state).
+    """
+
+    kind: str
+    threshold: float = 0
+
+    @property
+    def id(self) -> str:
+        return self.kind if self.kind == "classification" else f"{self.kind}_{self.threshold:g}"
+
+    def is_active(self, storm: dict, active: bool) -> bool:
+        """Return whether the rule holds for a storm, given its current state."""
+        if self.kind == "distance":
+            distance = storm.get("distance")
+            if distance is None:
+                return False
+            # Once inside the ring the storm has to move clearly out of it
+            return distance <= self.threshold + (ALERT_DISTANCE_HYSTERESIS if active else 0)
+        winds = storm.get("sustained_winds")
+        if winds is None:
+            return False
+        return winds >= self.threshold - (ALERT_WIND_HYSTERESIS if active else 0)
+
+
+def build_rules(options: dict) -> list[AlertRule]:
+    """Build the rules configured in the options flow."""
+    rules = []
+    for kind, key in (("distance", "alert_distances"), ("wind", "alert_winds")):
+        for value in options.get(key) or ():
+            try:
+                rules.append(AlertRule(kind, float(value)))
+            except (TypeError, ValueError):
+                _LOGGER.warning("Ignoring invalid %s alert threshold %r", kind, value)
+    if options.get("alert_classification"):
+        rules.append(AlertRule("classification"))
+    return rules
+
+
+def classification_rank(classification: str | None) -> int | None:
+    """Return the rank of a classification, higher is stronger."""
+    try:
+        return CLASSIFICATION_RANKS.index((classification or "").strip().lower())
+    except ValueError:
+        return None
+
+
+class AlertEngine:
+    """Evaluate the alert rules against every storm once per update.
+
+    Only changes are reported: a storm entering or leaving a distance ring,
+    crossing a wind threshold (both with hysteresis) or being upgraded. A
+    state that just changed is held for ALERT_MIN_HOLD before it may change
+    back, so corrected bulletins don't flap. A change held back that way is
+    not dropped: ``pending_until`` tells when the earliest hold ends, the
+    coordinator evaluates the same storms again then. The first evaluation
+    only sets the baseline, storms already inside a ring at startup are
+    active but no crossing is reported.
+    """
+
+    def __init__(self, rules: list[AlertRule]) -> None:
+        """Initialize."""
+        self.rules = rules
+        self._active: dict[tuple[str, str], str] = {}  # (rule id, storm) -> storm name
+        self._changed_at: dict[tuple[str, str], float] = {}
+        self._ranks: dict[str, int] = {}
+        self._initialized = False
+        # When the earliest held back change may be applied, None when nothing is held
+        self.pending_until: float | None = None
+
+    def evaluate(self, storms: dict[str, dict], now: float) -> list[dict]:
+        """Update the rule states and return the crossings since the last call."""
+        crossings = []
+        baseline = not self._initialized
+        self._initialized = True
+        self.pending_until = None
+
+        for rule in self.rules:
+            if rule.kind == "classification":
+                continue
+            # Storms that left the bulletin clear every rule they were active for
+            gone = [key for rule_id, key in self._active if rule_id == rule.id and key not in storms]
+            for key in [*storms, *gone]:
+                state_key = (rule.id, key)
+                was_active = state_key in self._active
+                storm = storms.get(key)
+                active = rule.is_active(storm, was_active) if storm is not None else False
+                if active == was_active:
+                    continue
+                hold_until = self._changed_at.get(state_key, float("-inf")) + ALERT_MIN_HOLD
+                if storm is not None and now < hold_until:
+                    self.pending_until = min(self.pending_until or hold_until, hold_until)
+                    continue
+                if storm is None:
+                    self._changed_at.pop(state_key, None)
+                else:
+                    self._changed_at[state_key] = now
+                if active:
+                    name = self._active[state_key] = storm.get("name")
+                else:
+                    name = self._active.pop(state_key)
+                if not baseline:
+                    crossings.append(self._crossing(rule, key, name, storm, active))
+
+        if any(rule.kind == "classification" for rule in self.rules):
+            for key, storm in storms.items():
+                rank = classification_rank(storm.get("classification"))
+                if rank is None:
+                    continue
+                previous = self._ranks.get(key)
+                self._ranks[key] = rank
+                if not baseline and previous is not None and rank > previous:
+                    crossings.append({
+                        "rule": "classification",
+                        "kind": "classification",
+                        "threshold": None,
+                        "storm": key,
+                        "storm_name": storm.get("name"),
+                        "active": True,
+                        "value": storm.get("classification"),
+                        "previous": CLASSIFICATION_RANKS[previous].title(),
+                    })
+            for key in [key for key in self._ranks if key not in storms]:
+                del self._ranks[key]
+
+        return crossings
+
+    @staticmethod
+    def _crossing(rule: AlertRule, key: str, name: str | None, storm: dict | None, active: bool) -> dict:
+        return {
+            "rule": rule.id,
+            "kind": rule.kind,
+            "threshold": rule.threshold,
+            "storm": key,
+            "storm_name": name,
+            "active": active,
+            "value": (storm.get("distance") if rule.kind == "distance" else storm.get("sustained_winds")) if storm else None,
+        }
+
+    def summary(self) -> dict[str, dict]:
+        """Return every stateful rule with whether it is active and for which storms."""
+        result = {}
+        for rule in self.rules:
+            if rule.kind == "classification":
+                continue
+            names = sorted(name or key for (rule_id, key), name in self._active.items() if rule_id == rule.id)
+            result[rule.id] = {"active": bool(names), "storms": names}
+        return result
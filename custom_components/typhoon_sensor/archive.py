@@ -0,0 +1,116 @@
+"""Parse archived bulletins without Home Assistant.
+
+Turns saved copies of the bulletin page into flat rows, one per storm and
+bulletin (or one empty row for a bulletin without storms), for analysis of
+past seasons. Used by scripts/parse_archive.py.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .advisory_time import parse_advisory_time, parse_issued_time
+from .parser import Bulletin, parse_bulletin, storm_ids
+from .result import build_result
+
+# Column order of the rows, and their types for columnar output
+ROW_FIELDS = {
+    "file": "string",
+    "digest": "string",
+    "no_active": "bool",
+    "storm": "string",
+    "name": "string",
+    "classification": "string",
+    "latitude": "float",
+    "longitude": "float",
+    "sustained_winds": "int",
+    "gustiness": "int",
+    "direction": "string",
+    "speed": "int",
+    "advisory_time": "string",
+    "advisory_at": "string",
+    "next_advisory_at": "string",
+    "forecast_points": "int",
+    "max_wind_signal": "int",
+    # Relative to home, only filled in when a home is given
+    "distance": "float",
+    "wind_signal": "int",
+    "forecast_closest_distance": "float",
+    "forecast_closest_time": "string",
+    "forecast_inside_cone": "bool",
+}
+
+
+def _isoformat(value) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        value = datetime.fromtimestamp(value, timezone.utc)
+    return value.isoformat()
+
+
+def bulletin_rows(
+    bulletin: Bulletin,
+    file: str | None = None,
+    home: tuple[float, float] | None = None,
+    home_area: tuple[str | None, str | None] = (None, None),
+) -> list[dict]:
+    """Flatten a parsed bulletin into one row per storm.
+
+    With ``home`` the distance, the wind signal over home (``home_area`` are
+    its gazetteer keys, see places.locate) and the forecast closest approach
+    are added, as the sensors report them. Motion metrics need the track
+    history of live polling and are not part of the rows.
+    """
+    if home is not None:
+        storms = build_result(bulletin.typhoons, home, home_area=home_area)["storms"]
+    else:
+        storms = {}
+        for key, typhoon in zip(storm_ids(bulletin.typhoons), bulletin.typhoons):
+            issued = parse_issued_time(typhoon["advisory_time"])
+            storms[key] = {
+                **typhoon,
+                "advisory_at": issued,
+                "next_advisory_at": parse_advisory_time(typhoon["next_advisory_time"], issued),
+            }
+
+    base = {"file": file, "digest": bulletin.digest, "no_active": bulletin.no_active}
+    if not storms:
+        return [{**dict.fromkeys(ROW_FIELDS), **base}]
+
+    rows = []
+    for key, storm in storms.items():
+        movement = storm.get("panels", {}).get("movement", {})
+        rows.append({
+            **base,
+            "storm": key,
+            "name": storm["name"],
+            "classification": storm["classification"],
+            "latitude": storm["coordinates"][0],
+            "longitude": storm["coordinates"][1],
+            "sustained_winds": storm["sustained_winds"],
+            "gustiness": storm["gustiness"],
+            "direction": movement.get("direction"),
+            "speed": movement.get("speed"),
+            "advisory_time": storm["advisory_time"],
+            "advisory_at": _isoformat(storm["advisory_at"]),
+            "next_advisory_at": _isoformat(storm["next_advisory_at"]),
+            "forecast_points": len(storm.get("forecast") or ()),
+            "max_wind_signal": max((area["signal"] for area in storm.get("wind_signals") or ()), default=0),
+            "distance": storm.get("distance"),
+            "wind_signal": storm.get("wind_signal"),
+            "forecast_closest_distance": storm.get("forecast_closest_distance"),
+            "forecast_closest_time": _isoformat(storm.get("forecast_closest_time")),
+            "forecast_inside_cone": storm.get("forecast_inside_cone"),
+        })
+    return rows
+
+
+def parse_file(
+    path: str | Path,
+    home: tuple[float, float] | None = None,
+    home_area: tuple[str | None, str | None] = (None, None),
+) -> list[dict]:
+    """Parse one archived bulletin file into rows, see bulletin_rows."""
+    path = Path(path)
+    return bulletin_rows(parse_bulletin(path.read_bytes()), str(path), home, home_area)
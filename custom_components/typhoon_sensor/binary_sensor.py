@@ -0,0 +1,47 @@
+"""Binary sensor support for Typhoon Sensor alerts."""
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .entity import TyphoonBaseSensor
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up a binary sensor for every distance ring and wind threshold."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(
+        TyphoonAlertBinarySensor(coordinator, entry, rule)
+        for rule in coordinator.alerts.rules
+        if rule.kind != "classification"
+    )
+
+class TyphoonAlertBinarySensor(TyphoonBaseSensor, BinarySensorEntity):
+    """On while any storm is inside a distance ring or above a wind threshold."""
+
+    fields = ("alerts",)
+    _attr_device_class = BinarySensorDeviceClass.SAFETY
+
+    def __init__(self, coordinator, entry, rule):
+        super().__init__(coordinator, entry)
+        self._rule = rule
+
+    @property
+    def _alert(self): return self._coordinator.data.get("alerts", {}).get(self._rule.id, {})
+    @property
+    def name(self):
+        if self._rule.kind == "distance":
+            return f"Typhoon Within {self._rule.threshold:g} km"
+        return f"Typhoon Winds {self._rule.threshold:g} km/h"
+    @property
+    def unique_id(self): return f"{self._entry.entry_id}_alert_{self._rule.id}"
+    @property
+    def is_on(self): return self._alert.get("active", False)
+    @property
+    def sensor_attributes(self): return {"threshold": self._rule.threshold, "storms": self._alert.get("storms", [])}
+    @property
+    def icon(self): return "mdi:map-marker-radius" if self._rule.kind == "distance" else "mdi:weather-windy"
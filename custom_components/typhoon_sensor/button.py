@@ -6,6 +6,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .entity import device_info
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -14,7 +15,7 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Typhoon Sensor button."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities([TyphoonRefreshButton(coordinator, entry)], True)
+    async_add_entities([TyphoonRefreshButton(coordinator, entry)])
 
 class TyphoonRefreshButton(CoordinatorEntity, ButtonEntity):
     """Representation of a Typhoon Sensor Manual Refresh button."""
@@ -23,6 +24,7 @@ class TyphoonRefreshButton(CoordinatorEntity, ButtonEntity):
         """Initialize the button."""
         super().__init__(coordinator)
         self._entry = entry
+        self._attr_device_info = device_info(entry)
 
     @property
     def unique_id(self) -> str:
@@ -39,16 +41,8 @@ class TyphoonRefreshButton(CoordinatorEntity, ButtonEntity):
         """Return the icon."""
         return "mdi:refresh"
 
-    @property
-    def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": "Typhoon Sensor",
-            "manufacturer": "PAGASA",
-            "model": "Typhoon Monitor",
-            "entry_type": "service",
-        }
-
     async def async_press(self) -> None:
         """Handle the button press."""
+        # Force a fetch, presses on several entries still share the one in flight
+        self.coordinator.source.async_expire()
         await self.coordinator.async_request_refresh()
@@ -0,0 +1,136 @@
+"""Storm change feed for the Typhoon Sensor integration."""
+from __future__ import annotations
+
+from datetime import datetime
+
+from .alerts import classification_rank
+
+# The storm values a change feed consumer holds, kept as it last received them
+STORM_FIELDS = (
+    "name",
+    "classification",
+    "coordinates",
+    "distance",
+    "sustained_winds",
+    "gustiness",
+    "movement",
+    "advisory_time",
+    "advisory_at",
+    "next_advisory_at",
+)
+# Reported with an advisory change, a new advisory moves the storm
+ADVISORY_FIELDS = ("advisory_time", "advisory_at", "next_advisory_at", "coordinates", "movement")
+
+
+def storm_state(storm: dict) -> dict:
+    """Return the reported values of a storm, timestamps as ISO strings."""
+    state = {}
+    for field in STORM_FIELDS:
+        value = storm.get(field)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, tuple):
+            value = list(value)
+        state[field] = value
+    return state
+
+
+class StormChangeTracker:
+    """Turn every new result into one list of storm changes.
+
+    A change is a dict with a ``type``, the ``storm`` id and its ``name``:
+
+    - ``new_storm``: a storm entered the bulletin, with all its values
+    - ``dissipated``: a storm left the bulletin
+    - ``classification``: ``previous`` and ``current``, ``upgrade`` tells the direction
+    - ``distance``: ``previous``, ``current`` and ``change`` in km, once the
+      distance moved ``distance_threshold`` km from the last reported one
+    - ``wind``: ``previous`` and ``current`` sustained winds and the gustiness
+    - ``advisory``: a new or corrected advisory, its times, position and movement
+
+    ``storms`` holds every storm as the changes so far describe it, applying
+    the changes to it gives the next state. The first update only sets the
+    baseline.
+    """
+
+    def __init__(self, distance_threshold: float = 0.0) -> None:
+        """Initialize."""
+        self.distance_threshold = distance_threshold
+        self.storms: dict[str, dict] = {}
+        # Counts the updates that had changes, consumers can tell they missed one
+        self.sequence = 0
+        self._initialized = False
+
+    def update(self, storms: dict[str, dict]) -> list[dict]:
+        """Compare the storms to the last reported ones and return the changes."""
+        if not self._initialized:
+            self._initialized = True
+            self.storms = {key: storm_state(storm) for key, storm in storms.items()}
+            return []
+
+        changes = []
+        for key, storm in storms.items():
+            state = storm_state(storm)
+            old = self.storms.get(key)
+            if old is None:
+                self.storms[key] = state
+                changes.append({"type": "new_storm", "storm": key, **state})
+                continue
+            changes.extend(self._storm_changes(key, old, state))
+
+        for key in [key for key in self.storms if key not in storms]:
+            old = self.storms.pop(key)
+            changes.append({"type": "dissipated", "storm": key, "name": old["name"]})
+
+        if changes:
+            self.sequence += 1
+        return changes
+
+    def _storm_changes(self, key: str, old: dict, state: dict) -> list[dict]:
+        """Return the changes of one storm and update its reported values."""
+        changes = []
+        base = {"storm": key, "name": state["name"]}
+
+        if any(state[field] != old[field] for field in ADVISORY_FIELDS):
+            changes.append({"type": "advisory", **base, **{field: state[field] for field in ADVISORY_FIELDS}})
+
+        if state["classification"] != old["classification"]:
+            previous = classification_rank(old["classification"])
+            current = classification_rank(state["classification"])
+            changes.append({
+                "type": "classification",
+                **base,
+                "previous": old["classification"],
+                "current": state["classification"],
+                "upgrade": previous is not None and current is not None and current > previous,
+            })
+
+        if state["sustained_winds"] != old["sustained_winds"] or state["gustiness"] != old["gustiness"]:
+            changes.append({
+                "type": "wind",
+                **base,
+                "previous": old["sustained_winds"],
+                "current": state["sustained_winds"],
+                "gustiness": state["gustiness"],
+            })
+
+        distance, reported = state["distance"], old["distance"]
+        if distance != reported:
+            # Compared to the last reported distance, so slow drifts still add up
+            if distance is None or reported is None or abs(distance - reported) >= self.distance_threshold:
+                changes.append({
+                    "type": "distance",
+                    **base,
+                    "previous": reported,
+                    "current": distance,
+                    "change": distance - reported if distance is not None and reported is not None else None,
+                })
+            else:
+                state["distance"] = reported
+
+        self.storms[key] = state
+        return changes
+
+    def snapshot(self) -> dict:
+        """Return the reported state the next changes apply to."""
+        return {"sequence": self.sequence, "storms": {key: dict(state) for key, state in self.storms.items()}}
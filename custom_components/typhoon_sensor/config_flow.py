@@ -3,12 +3,14 @@ import logging
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers import selector
 
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL, MIN_SCAN_INTERVAL, DEFAULT_IDLE_POLL_INTERVAL
+from .const import DOMAIN, DEFAULT_SCAN_INTERVAL, MIN_SCAN_INTERVAL, DEFAULT_IDLE_POLL_INTERVAL, DEFAULT_DISTANCE_THRESHOLD, ALERT_DISTANCE_OPTIONS, ALERT_WIND_OPTIONS
+from .places import province_names
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,6 +19,12 @@ class TyphoonSensorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Get the options flow for this handler."""
+        return TyphoonSensorOptionsFlow(config_entry)
+
     async def async_step_user(self, user_input=None) -> FlowResult:
         """Handle the initial step."""
         if user_input is not None:
@@ -43,4 +51,73 @@ class TyphoonSensorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     ): vol.All(vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL)),
                 }
             ),
-        )
\ No newline at end of file
+        )
+
+
+class TyphoonSensorOptionsFlow(config_entries.OptionsFlow):
+    """Handle Typhoon Sensor options."""
+
+    def __init__(self, config_entry):
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(self, user_input=None) -> FlowResult:
+        """Manage the points of interest, the home province, the distance threshold, the fallback URL and the alerts."""
+        errors = {}
+        if user_input is not None:
+            for key in ("alert_distances", "alert_winds"):
+                try:
+                    user_input[key] = sorted({float(value) for value in user_input.get(key, [])})
+                except ValueError:
+                    errors[key] = "invalid_threshold"
+            if not errors:
+                return self.async_create_entry(title="", data=user_input)
+
+        provinces = await self.hass.async_add_executor_job(province_names)
+        province_default = {"default": self._entry.options["home_province"]} if self._entry.options.get("home_province") else {}
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        "zones", default=self._entry.options.get("zones", [])
+                    ): selector.EntitySelector(
+                        selector.EntitySelectorConfig(domain="zone", multiple=True)
+                    ),
+                    vol.Optional("home_province", **province_default): selector.SelectSelector(
+                        selector.SelectSelectorConfig(options=provinces, mode=selector.SelectSelectorMode.DROPDOWN)
+                    ),
+                    vol.Optional(
+                        "distance_threshold",
+                        default=self._entry.options.get("distance_threshold", DEFAULT_DISTANCE_THRESHOLD),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0, max=100, step=0.5, unit_of_measurement="km", mode=selector.NumberSelectorMode.BOX
+                        )
+                    ),
+                    vol.Optional(
+                        "fallback_url", description={"suggested_value": self._entry.options.get("fallback_url")}
+                    ): selector.TextSelector(
+                        selector.TextSelectorConfig(type=selector.TextSelectorType.URL)
+                    ),
+                    vol.Optional(
+                        "alert_distances", default=[f"{value:g}" for value in self._entry.options.get("alert_distances", [])]
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=[str(value) for value in ALERT_DISTANCE_OPTIONS], multiple=True, custom_value=True
+                        )
+                    ),
+                    vol.Optional(
+                        "alert_winds", default=[f"{value:g}" for value in self._entry.options.get("alert_winds", [])]
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=[str(value) for value in ALERT_WIND_OPTIONS], multiple=True, custom_value=True
+                        )
+                    ),
+                    vol.Optional(
+                        "alert_classification", default=self._entry.options.get("alert_classification", False)
+                    ): bool,
+                }
+            ),
+            errors=errors,
+        )
@@ -1,6 +1,75 @@
 """Constants for the Typhoon Sensor integration."""
+from datetime import timedelta
 
 DOMAIN = "typhoon_sensor"
+DATA_SOURCE = "bulletin_source"
 DEFAULT_SCAN_INTERVAL = 30
 MIN_SCAN_INTERVAL = 15
 DEFAULT_IDLE_POLL_INTERVAL = 480  # 8 hours
+DEFAULT_DISTANCE_THRESHOLD = 0.0  # km, smaller distance changes don't update the distance sensor
+
+EARTH_RADIUS_KM = 6371.0088  # mean radius, same as the haversine package
+
+BULLETIN_URL = "https://www.pagasa.dost.gov.ph/tropical-cyclone/severe-weather-bulletin"
+FETCH_CHUNK_SIZE = 16384
+SOURCE_MAX_AGE = 60  # seconds a fetched bulletin is shared before refetching
+FETCH_TIMEOUT = 10  # seconds per attempt
+FETCH_CONNECT_TIMEOUT = 5  # seconds to open a connection, TLS included
+FETCH_READ_TIMEOUT = 5  # seconds without any data before a read is given up
+FETCH_ATTEMPTS = 3  # per URL
+FETCH_RETRY_BACKOFF = 2  # seconds before the first retry, doubled for every next one
+FETCH_BUDGET = 45  # seconds, no retry is started that could end later
+STALE_MAX_AGE = timedelta(hours=12)  # last good data is served this long while fetches fail
+TIMING_WINDOW = 100  # samples kept per timed stage
+TIMING_BUCKETS = (1, 5, 10, 50, 100, 500, 1000, 5000)  # ms, histogram upper bounds
+
+SNAPSHOT_STORAGE_KEY = f"{DOMAIN}.snapshot"
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_MAX_AGE = timedelta(hours=12)
+SNAPSHOT_SAVE_DELAY = 10  # seconds
+
+TRACK_STORAGE_KEY = f"{DOMAIN}.tracks"
+TRACK_STORAGE_VERSION = 1
+TRACK_HISTORY_SIZE = 64  # advisories kept per storm
+TRACK_RETENTION = timedelta(days=3)  # keep a storm's track this long after it leaves the bulletin
+
+# Forecast track uncertainty, (lead time in hours, radius in km). Roughly the
+# average track error of PAGASA forecasts, used to draw the cone of uncertainty
+FORECAST_CONE_RADII = ((0, 0), (24, 120), (48, 220), (72, 320), (96, 420), (120, 520))
+
+# Smart polling scheduler
+DEFAULT_PUBLICATION_LAG = timedelta(minutes=15)  # prior until lags have been observed
+MAX_PUBLICATION_LAG = timedelta(hours=2)  # longer gaps are not counted as publication lag
+PUBLICATION_LAG_SAMPLES = 12
+PROBE_INTERVAL = timedelta(minutes=3)
+MAX_PROBES = 6  # conditional probes around the expected release
+BACKOFF_BASE = timedelta(minutes=MIN_SCAN_INTERVAL)  # first backoff step, no more often than fixed polling allows
+POLL_JITTER = 60  # max seconds added to every scheduled poll
+SCHEDULER_HISTORY = 20
+
+DATA_SESSION = "session"
+DATA_SESSION_UNSUB = "session_unsub"
+SESSION_CONNECTIONS_PER_HOST = 4
+SESSION_KEEPALIVE = 60  # seconds an idle connection is kept open
+SESSION_DNS_TTL = 300  # seconds a resolved address is reused, shorter than the poll interval so a moved host is followed
+
+DATA_IMAGE_CACHE = "image_cache"
+IMAGE_CACHE_DIR = "images"  # under <config>/typhoon_sensor
+IMAGE_CACHE_SIZE = 16  # track images kept on disk, least recently used are dropped
+IMAGE_FETCH_TIMEOUT = 20  # seconds
+IMAGE_INDEX_STORAGE_KEY = f"{DOMAIN}.images"
+IMAGE_INDEX_STORAGE_VERSION = 1
+THUMBNAIL_SIZE = (480, 480)
+
+# Alert rules
+EVENT_ALERT = f"{DOMAIN}_alert"
+ALERT_DISTANCE_OPTIONS = (100, 200, 300, 500)  # km, suggested rings
+ALERT_WIND_OPTIONS = (62, 89, 118, 185)  # km/h, PAGASA TS/STS/TY/STY thresholds
+ALERT_DISTANCE_HYSTERESIS = 25  # km a storm has to move back out of a ring before it is left
+ALERT_WIND_HYSTERESIS = 5  # km/h winds have to drop below a threshold before it is cleared
+ALERT_MIN_HOLD = 1800  # seconds a rule state is kept before it may change back
+CLASSIFICATION_RANKS = ("tropical depression", "tropical storm", "severe tropical storm", "typhoon", "super typhoon")
+
+# Storm change feed
+EVENT_STORM_UPDATE = f"{DOMAIN}_storm_update"
+DATA_WEBSOCKET = "websocket"
@@ -0,0 +1,282 @@
+"""Data update coordinator for the Typhoon Sensor integration."""
+from datetime import timedelta
+import logging
+import time
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later, async_track_point_in_time
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+from .alerts import AlertEngine
+from .changes import StormChangeTracker
+from .const import DOMAIN, EVENT_ALERT, EVENT_STORM_UPDATE, STALE_MAX_AGE
+from .result import build_result, empty_result
+from .scheduler import PollScheduler
+from .timing import StageTimings
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TyphoonDataCoordinator(DataUpdateCoordinator):
+    """Class to manage fetching Typhoon data."""
+
+    def __init__(self, hass, source, home_lat, home_lon, scan_interval, smart_polling=False, idle_poll_interval=480, zones=(), home_area=(None, None), distance_threshold=0.0, alert_rules=()):
+        """Initialize."""
+        self.source = source
+        self.home_coords = (home_lat, home_lon)
+        # (province, town) keys of home in the gazetteer, for the wind signal lookup
+        self.home_area = home_area
+        # Extra points of interest, zone entity ids resolved on every update
+        self.zones = list(zones)
+        self._points = None
+        self.smart_polling = smart_polling
+        self.scan_interval = scan_interval
+        self.idle_poll_interval = idle_poll_interval
+        self._unsub_schedule = None
+        self.track_image = None
+        self.scheduler = PollScheduler(timedelta(minutes=scan_interval), timedelta(minutes=idle_poll_interval))
+        # Digest of the bulletin behind _last_result, lets unchanged bulletins skip the distance math
+        self._digest = None
+        self._last_result = None
+        self._no_active = False
+        # Rolling durations of this entry's stages, the fetch stages live on the source
+        self.timings = StageTimings()
+        # Stages with a timing sensor, their latest durations are notified as timing_<stage> fields
+        self.timing_stages = {"fetch": source.timings, "parse": source.timings, "update": self.timings}
+        # When the last good data was fetched, while fetches fail and it is served stale
+        self.stale_since = None
+        # Error of the last fetch while fetches fail, the data is then stale or empty
+        self.fetch_error = None
+        # Values the entities were last notified of, entities skip updates
+        # that changed none of their fields (None means everything changed)
+        self.distance_threshold = distance_threshold
+        self._published = {}
+        self._published_state = None
+        self.changed_fields: set[str] | None = None
+        # Threshold alerts, evaluated whenever the result is recomputed
+        self.alerts = AlertEngine(list(alert_rules))
+        self._unsub_alert_hold = None
+        # Storm changes between results, published as one event per refresh
+        self.changes = StormChangeTracker(distance_threshold)
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=timedelta(minutes=scan_interval) if not smart_polling else None,
+        )
+
+    async def _async_update_data(self):
+        """Get the shared bulletin and pick the nearest typhoon."""
+        _LOGGER.debug("Starting async_update for Typhoon Coordinator")
+        with self.timings.time("update"):
+            try:
+                bulletin = await self.source.async_get_bulletin()
+            except Exception as err:
+                 # Revalidate soon, with backoff, while the last good data is served
+                 self._schedule_poll(self.scheduler.retry(dt_util.utcnow()))
+                 self.fetch_error = err
+                 return self._stale_data(err)
+
+            self.fetch_error = None
+            return self._process_bulletin(bulletin)
+
+    def _stale_data(self, err):
+        """Keep the last good result after a failed fetch, until it is too old."""
+        fetched = self.source.fetched_utc
+        if self._last_result is None or fetched is None or dt_util.utcnow() - fetched > STALE_MAX_AGE:
+            _LOGGER.error("Error updating typhoon sensor: %s", err)
+            self.stale_since = None
+            return self._get_empty_data()
+        _LOGGER.warning("Error updating typhoon sensor, keeping the data fetched at %s: %s", fetched, err)
+        self.stale_since = fetched
+        return self._last_result
+
+    def _process_bulletin(self, bulletin, live=True):
+        """Turn the shared bulletin into this entry's result."""
+        # A restored snapshot is shown as stale until the first fetch succeeds
+        self.stale_since = None if live else self.source.fetched_utc
+        points = self._resolve_points()
+        if bulletin.digest != self._digest or points != self._points or self._last_result is None:
+            self._digest = bulletin.digest
+            self._points = points
+            self._no_active = bulletin.no_active
+            with self.timings.time("compute"):
+                self._last_result = self._parse_typhoon_data(bulletin.typhoons, points)
+                self._last_result["alerts"] = self._evaluate_alerts(self._last_result["storms"], live)
+                self._publish_changes(self._last_result["storms"], live)
+        else:
+            _LOGGER.debug("Bulletin unchanged, reusing last result")
+
+        with self.timings.time("schedule"):
+            self._schedule_after_update(self._last_result, self._no_active, live)
+        return self._last_result
+
+    def _evaluate_alerts(self, storms, live):
+        """Run the alert rules and fire an event for every crossing.
+
+        A restored snapshot only updates the rule states, its crossings are
+        old news.
+        """
+        if not self.alerts.rules:
+            return {}
+        now = dt_util.utcnow().timestamp()
+        for crossing in self.alerts.evaluate(storms, now):
+            _LOGGER.debug("Alert %s %s for %s", crossing["rule"], "on" if crossing["active"] else "off", crossing["storm_name"])
+            if live:
+                self.hass.bus.async_fire(EVENT_ALERT, {
+                    "entry_id": self.config_entry.entry_id if self.config_entry else None,
+                    **crossing,
+                })
+        self._schedule_alert_hold(now)
+        return self.alerts.summary()
+
+    def _schedule_alert_hold(self, now):
+        """Evaluate the alerts again when a held back change may be applied.
+
+        The alerts only run when the bulletin changes, a storm leaving a ring
+        within the hold would otherwise wait for the next advisory.
+        """
+        if self._unsub_alert_hold:
+            self._unsub_alert_hold()
+            self._unsub_alert_hold = None
+        if self.alerts.pending_until is not None:
+            self._unsub_alert_hold = async_call_later(
+                self.hass, max(0, self.alerts.pending_until - now), self._handle_alert_hold
+            )
+
+    @callback
+    def _handle_alert_hold(self, _now):
+        self._unsub_alert_hold = None
+        if self._last_result is None or self.data is not self._last_result:
+            return
+        self._last_result["alerts"] = self._evaluate_alerts(self._last_result["storms"], self.stale_since is None)
+        self.async_update_listeners()
+
+    def _publish_changes(self, storms, live):
+        """Fire one event with every storm change since the last result.
+
+        Like the alerts, a restored snapshot only sets the state the changes
+        are computed from.
+        """
+        changes = self.changes.update(storms)
+        if changes and live:
+            _LOGGER.debug("Storm changes: %s", ", ".join(f"{change['type']} {change['storm']}" for change in changes))
+            self.hass.bus.async_fire(EVENT_STORM_UPDATE, {
+                "entry_id": self.config_entry.entry_id if self.config_entry else None,
+                "sequence": self.changes.sequence,
+                "changes": changes,
+            })
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Work out the changed fields and notify the entities, timing the state writes."""
+        start = time.perf_counter()
+        self.changed_fields = self._changed_fields()
+        super().async_update_listeners()
+        self.timings.record("fan_out", time.perf_counter() - start)
+
+    def _changed_fields(self):
+        """Return the result fields that changed since the last notification.
+
+        None means everything, when availability or staleness changed. A
+        distance change smaller than the threshold is not a change, it is
+        compared to the last published distance so slow drifts still add up.
+        The latest stage durations count as timing_<stage> fields.
+        """
+        values = {
+            **(self.data or {}),
+            **{f"timing_{stage}": timings.last(stage) for stage, timings in self.timing_stages.items()},
+        }
+        state = (self.last_update_success, self.stale_since)
+        if state != self._published_state:
+            self._published_state = state
+            self._published = values
+            return None
+
+        changed = set()
+        for key, value in values.items():
+            old = self._published.get(key)
+            if value == old and key in self._published:
+                continue
+            if (
+                key == "distance"
+                and value is not None
+                and old is not None
+                and abs(value - old) < self.distance_threshold
+            ):
+                continue
+            changed.add(key)
+            self._published[key] = value
+        return changed
+
+    @callback
+    def async_restore(self, bulletin):
+        """Seed the coordinator from a restored bulletin snapshot."""
+        self.async_set_updated_data(self._process_bulletin(bulletin, live=False))
+
+    @callback
+    def async_set_pending(self):
+        """Start without a bulletin, the entities are unavailable until the first refresh."""
+        self.data = self._get_empty_data()
+        self.last_update_success = False
+
+    async def async_shutdown(self) -> None:
+        """Cancel the scheduled refresh and alert check."""
+        await super().async_shutdown()
+        if self._unsub_schedule:
+            self._unsub_schedule()
+            self._unsub_schedule = None
+        if self._unsub_alert_hold:
+            self._unsub_alert_hold()
+            self._unsub_alert_hold = None
+
+    def _get_empty_data(self):
+        return empty_result()
+
+    def _resolve_points(self):
+        """Return the configured zones as (entity_id, name, (lat, lon)) tuples."""
+        points = []
+        for entity_id in self.zones:
+            state = self.hass.states.get(entity_id)
+            if state is None or "latitude" not in state.attributes:
+                continue
+            points.append((
+                entity_id,
+                state.name,
+                (state.attributes["latitude"], state.attributes["longitude"]),
+            ))
+        return tuple(points)
+
+    def _parse_typhoon_data(self, typhoons, points=()):
+        """Index every parsed typhoon by storm and pick the nearest, for home and every point."""
+        return build_result(typhoons, self.home_coords, points, self.source.tracks, self.home_area)
+
+    def _schedule_after_update(self, data, no_active, live=True):
+        """Let the scheduler pick the next refresh from the latest result."""
+        if not self.smart_polling:
+            # The fixed interval takes over again, drop a pending retry
+            if self._unsub_schedule:
+                self._unsub_schedule()
+                self._unsub_schedule = None
+            self.scheduler.reset_backoff()
+            return
+        storms = data["storms"].values()
+        issued = max(filter(None, (storm["advisory_at"] for storm in storms)), default=None)
+        expected = min(filter(None, (storm["next_advisory_at"] for storm in storms)), default=None)
+        self._schedule_poll(self.scheduler.next_poll(dt_util.utcnow(), issued, expected, no_active, live))
+
+    def _schedule_poll(self, decision):
+        """Schedule the refresh the scheduler decided on."""
+        if self._unsub_schedule:
+            self._unsub_schedule()
+        _LOGGER.debug("Next refresh at %s (%s)", decision.next_poll, decision.reason)
+        self._unsub_schedule = async_track_point_in_time(
+            self.hass, self._handle_scheduled_refresh, decision.next_poll
+        )
+
+    @callback
+    def _handle_scheduled_refresh(self, _now):
+        self._unsub_schedule = None
+        self.hass.async_create_task(self.async_refresh())
@@ -0,0 +1,31 @@
+"""Diagnostics support for Typhoon Sensor."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, DATA_IMAGE_CACHE
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "fetch_stats": coordinator.source.fetch_stats,
+        "refresh_stats": coordinator.source.refresh_stats,
+        "snapshot_restored_at": coordinator.source.restored_at,
+        "bulletin_fetched_at": coordinator.source.fetched_utc,
+        "scheduler": coordinator.scheduler.as_dict(),
+        "timings": {
+            "source": coordinator.source.timings.as_dict(),
+            "coordinator": coordinator.timings.as_dict(),
+        },
+        "alert_rules": [rule.id for rule in coordinator.alerts.rules],
+        "image_cache": getattr(hass.data[DOMAIN].get(DATA_IMAGE_CACHE), "stats", None),
+        "data": coordinator.data,
+    }
@@ -0,0 +1,50 @@
+"""Batched great-circle distances for the Typhoon Sensor integration."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .const import EARTH_RADIUS_KM
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def load_numpy() -> None:
+    """Import NumPy ahead of the first distance computation.
+
+    Setup runs this in the executor so the import doesn't block the event loop.
+    """
+    import numpy  # pylint: disable=import-outside-toplevel,unused-import  # noqa: F401
+
+
+def distance_matrix(storms, points) -> np.ndarray:
+    """Return the haversine distance in km from every storm to every point.
+
+    ``storms`` and ``points`` are sequences of (lat, lon) pairs, the result
+    has one row per storm and one column per point. Everything is computed
+    in a single broadcast NumPy operation, so thousands of points cost about
+    as much as a handful.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    storms = np.radians(np.asarray(storms, dtype=np.float64).reshape(-1, 2))
+    points = np.radians(np.asarray(points, dtype=np.float64).reshape(-1, 2))
+
+    lat1 = storms[:, 0, None]
+    lon1 = storms[:, 1, None]
+    lat2 = points[None, :, 0]
+    lon2 = points[None, :, 1]
+
+    a = (
+        np.sin((lat2 - lat1) * 0.5) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) * 0.5) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+def nearest_storms(matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return, per point, the index of the nearest storm and its distance."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    index = matrix.argmin(axis=0)
+    return index, matrix[index, np.arange(matrix.shape[1])]
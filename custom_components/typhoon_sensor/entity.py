@@ -0,0 +1,62 @@
+"""Shared entity helpers for the Typhoon Sensor integration."""
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+
+
+def device_info(entry: ConfigEntry) -> DeviceInfo:
+    """Return the device all entities of an entry belong to."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name="Typhoon Sensor",
+        manufacturer="PAGASA",
+        model="Typhoon Monitor",
+        entry_type=DeviceEntryType.SERVICE,
+    )
+
+
+def stale_attributes(coordinator) -> dict:
+    """Return whether the coordinator serves stale data, and since when."""
+    stale_since = coordinator.stale_since
+    return {
+        "stale": stale_since is not None,
+        "stale_since": stale_since.isoformat() if stale_since else None,
+    }
+
+
+class TyphoonBaseSensor(CoordinatorEntity, Entity):
+    """Base class for Typhoon sensors."""
+
+    # Result fields the state depends on, the state is only written when one
+    # of them changed. None means on every update.
+    fields: tuple[str, ...] | None = None
+
+    def __init__(self, coordinator, entry):
+        super().__init__(coordinator)
+        self._coordinator = coordinator
+        self._entry = entry
+        self._attr_device_info = device_info(entry)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        changed = self._coordinator.changed_fields
+        if self.fields is not None and changed is not None and changed.isdisjoint(self.fields):
+            return
+        super()._handle_coordinator_update()
+
+    @property
+    def available(self):
+        return self._coordinator.last_update_success
+
+    # Subclasses return their own attributes here, the staleness is added to all
+    sensor_attributes = None
+
+    @property
+    def extra_state_attributes(self):
+        return {**(self.sensor_attributes or {}), **stale_attributes(self._coordinator)}
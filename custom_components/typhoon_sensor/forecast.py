@@ -0,0 +1,90 @@
+"""Forecast track closest approach for the Typhoon Sensor integration."""
+from __future__ import annotations
+
+import math
+
+from .const import EARTH_RADIUS_KM, FORECAST_CONE_RADII
+
+EMPTY_FORECAST_METRICS = {
+    "forecast_closest_distance": None,
+    "forecast_closest_time": None,
+    "forecast_closest_lead": None,
+    "forecast_cone_radius": None,
+    "forecast_inside_cone": None,
+}
+
+
+def _haversine(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def cone_radius(lead_hours: float) -> float:
+    """Return the uncertainty radius (km) of a forecast position, linearly interpolated."""
+    previous = FORECAST_CONE_RADII[0]
+    for hours, radius in FORECAST_CONE_RADII:
+        if lead_hours <= hours:
+            if hours == previous[0]:
+                return float(radius)
+            share = (lead_hours - previous[0]) / (hours - previous[0])
+            return previous[1] + share * (radius - previous[1])
+        previous = (hours, radius)
+    return float(previous[1])
+
+
+def closest_approach(issued, coordinates, forecast, home_coords) -> dict:
+    """Find the closest point of approach to home along the forecast track.
+
+    The track runs from the current position (``coordinates`` at the
+    ``issued`` timestamp) through every forecast row ``[timestamp, lat,
+    lon, text]`` that has a position. Each segment is projected onto a
+    plane centred on home, the closest point is interpolated along it and
+    its distance measured with haversine. Time is interpolated along the
+    segment the same way. Without an ``issued`` time the current position
+    still counts, but a closest point before the first forecast position
+    has no time and there is no lead time or cone.
+    """
+    metrics = dict(EMPTY_FORECAST_METRICS)
+    track = [row[:3] for row in forecast or () if row[1] is not None]
+    if not track:
+        return metrics
+    track.insert(0, (issued, *coordinates))
+
+    lat0, lon0 = home_coords
+    scale_x = math.cos(math.radians(lat0))
+
+    def project(lat, lon):
+        return math.radians(lon - lon0) * scale_x, math.radians(lat - lat0)
+
+    best = None
+    for start, end in zip(track, track[1:] or track):
+        ax, ay = project(start[1], start[2])
+        bx, by = project(end[1], end[2])
+        dx, dy = bx - ax, by - ay
+        length_sq = dx * dx + dy * dy
+        share = 0.0 if length_sq == 0 else min(1.0, max(0.0, -(ax * dx + ay * dy) / length_sq))
+        lat = start[1] + share * (end[1] - start[1])
+        lon = start[2] + share * (end[2] - start[2])
+        distance = _haversine(lat0, lon0, lat, lon)
+        if best is None or distance < best[0]:
+            if start[0] is not None:
+                timestamp = start[0] + share * (end[0] - start[0])
+            else:
+                timestamp = end[0] if share == 1.0 else None
+            best = (distance, timestamp)
+
+    distance, timestamp = best
+    metrics["forecast_closest_distance"] = round(distance, 2)
+    metrics["forecast_closest_time"] = round(timestamp) if timestamp is not None else None
+    if issued is not None:
+        # The cone only makes sense relative to the advisory the forecast belongs to
+        lead = (timestamp - issued) / 3600
+        radius = cone_radius(lead)
+        metrics["forecast_closest_lead"] = round(lead, 1)
+        metrics["forecast_cone_radius"] = round(radius, 1)
+        metrics["forecast_inside_cone"] = distance <= radius
+    return metrics
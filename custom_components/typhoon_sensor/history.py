@@ -0,0 +1,134 @@
+"""Track history and motion metrics for the Typhoon Sensor integration."""
+from __future__ import annotations
+
+from array import array
+import math
+
+from .const import EARTH_RADIUS_KM, TRACK_HISTORY_SIZE
+
+NAN = float("nan")
+
+# Column layout of a track row
+TIMESTAMP, LATITUDE, LONGITUDE, SUSTAINED_WINDS, GUSTINESS = range(5)
+ROW_SIZE = 5
+
+
+class TrackHistory:
+    """Fixed size ring buffer of a storm's advisories.
+
+    Rows (timestamp, lat, lon, sustained winds, gustiness) are stored
+    back to back in a single ``array('d')``, the oldest row is overwritten
+    once the buffer is full. Missing wind values are stored as NaN.
+    """
+
+    __slots__ = ("_data", "_capacity", "_head", "_count")
+
+    def __init__(self, capacity: int = TRACK_HISTORY_SIZE) -> None:
+        """Initialize."""
+        self._capacity = capacity
+        self._data = array("d", [NAN]) * (capacity * ROW_SIZE)
+        self._head = 0  # Slot the next row is written to
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def last_timestamp(self) -> float | None:
+        """Return the timestamp of the newest row."""
+        return self.row(0)[TIMESTAMP] if self._count else None
+
+    def append(self, timestamp, latitude, longitude, sustained_winds=None, gustiness=None) -> bool:
+        """Add an advisory, ignored unless it is newer than the last one."""
+        if self._count and timestamp <= self.last_timestamp:
+            return False
+        offset = self._head * ROW_SIZE
+        self._data[offset:offset + ROW_SIZE] = array("d", (
+            timestamp,
+            latitude,
+            longitude,
+            NAN if sustained_winds is None else sustained_winds,
+            NAN if gustiness is None else gustiness,
+        ))
+        self._head = (self._head + 1) % self._capacity
+        self._count = min(self._count + 1, self._capacity)
+        return True
+
+    def row(self, age: int) -> tuple:
+        """Return a row, 0 being the newest."""
+        if age >= self._count:
+            raise IndexError(age)
+        offset = ((self._head - 1 - age) % self._capacity) * ROW_SIZE
+        return tuple(self._data[offset:offset + ROW_SIZE])
+
+    def rows(self) -> list[tuple]:
+        """Return every row, oldest first."""
+        return [self.row(age) for age in range(self._count - 1, -1, -1)]
+
+    def as_list(self) -> list[list]:
+        """Return a JSON serializable form, NaN becomes None."""
+        return [[None if math.isnan(value) else value for value in row] for row in self.rows()]
+
+    @classmethod
+    def from_list(cls, rows: list[list], capacity: int = TRACK_HISTORY_SIZE) -> TrackHistory:
+        """Rebuild a track from its stored form."""
+        track = cls(capacity)
+        for row in rows:
+            track.append(*row)
+        return track
+
+
+EMPTY_MOTION_METRICS = {
+    "closing_speed": None,
+    "intensification_rate": None,
+    "time_to_closest_approach": None,
+    "closest_approach_distance": None,
+}
+
+
+def _local_km(origin, latitude, longitude):
+    """Project a point to km east/north of the origin (equirectangular)."""
+    lat0 = math.radians(origin[0])
+    return (
+        math.radians(longitude - origin[1]) * math.cos(lat0) * EARTH_RADIUS_KM,
+        math.radians(latitude - origin[0]) * EARTH_RADIUS_KM,
+    )
+
+
+def motion_metrics(track: TrackHistory, home_coords) -> dict:
+    """Derive motion metrics relative to home from the two newest advisories.
+
+    Only the last two rows are read, so this is O(1) per update.
+    closing_speed is positive while the storm approaches (km/h),
+    intensification_rate is the change in sustained winds per day (km/h/d),
+    time_to_closest_approach is in hours and None once the storm recedes.
+    """
+    metrics = dict(EMPTY_MOTION_METRICS)
+    if len(track) < 2:
+        return metrics
+
+    new, old = track.row(0), track.row(1)
+    hours = (new[TIMESTAMP] - old[TIMESTAMP]) / 3600
+    if hours <= 0:
+        return metrics
+
+    x_new, y_new = _local_km(home_coords, new[LATITUDE], new[LONGITUDE])
+    x_old, y_old = _local_km(home_coords, old[LATITUDE], old[LONGITUDE])
+    metrics["closing_speed"] = round((math.hypot(x_old, y_old) - math.hypot(x_new, y_new)) / hours, 2)
+
+    if not math.isnan(new[SUSTAINED_WINDS]) and not math.isnan(old[SUSTAINED_WINDS]):
+        metrics["intensification_rate"] = round(
+            (new[SUSTAINED_WINDS] - old[SUSTAINED_WINDS]) / hours * 24, 2
+        )
+
+    # Straight line extrapolation of the last motion vector
+    vx, vy = (x_new - x_old) / hours, (y_new - y_old) / hours
+    speed_sq = vx * vx + vy * vy
+    if speed_sq > 0:
+        t_closest = -(x_new * vx + y_new * vy) / speed_sq
+        if t_closest > 0:
+            metrics["time_to_closest_approach"] = round(t_closest, 2)
+            metrics["closest_approach_distance"] = round(
+                math.hypot(x_new + vx * t_closest, y_new + vy * t_closest), 2
+            )
+    return metrics
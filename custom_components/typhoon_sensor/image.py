@@ -0,0 +1,98 @@
+"""Image support for Typhoon Sensor."""
+from __future__ import annotations
+
+from homeassistant.components.image import ImageEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .entity import device_info, stale_attributes
+from .image_cache import async_get_image_cache, content_type, image_key
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Typhoon Sensor track images."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    cache = async_get_image_cache(hass)
+    track = TyphoonTrackImage(hass, coordinator, entry, cache)
+    # The image sensor points its entity_picture at the locally served image
+    coordinator.track_image = track
+    async_add_entities([track, TyphoonTrackThumbnail(hass, coordinator, entry, cache)])
+
+class TyphoonTrackImage(CoordinatorEntity, ImageEntity):
+    """Track image of the nearest storm, served from the local cache."""
+
+    _thumbnail = False
+
+    def __init__(self, hass, coordinator, entry, cache):
+        """Initialize the image."""
+        CoordinatorEntity.__init__(self, coordinator)
+        ImageEntity.__init__(self, hass)
+        self._entry = entry
+        self._attr_device_info = device_info(entry)
+        self._cache = cache
+        self._key = None
+        self._update_source()
+
+    @property
+    def unique_id(self) -> str:
+        """Return the unique ID."""
+        return f"{self._entry.entry_id}_track_image{'_thumbnail' if self._thumbnail else ''}"
+
+    @property
+    def name(self) -> str:
+        """Return the name of the image."""
+        return "Typhoon Track Thumbnail" if self._thumbnail else "Typhoon Track Image"
+
+    @property
+    def available(self) -> bool:
+        """Only available while there is a storm with an image."""
+        return self.coordinator.last_update_success and self._key is not None
+
+    @property
+    def extra_state_attributes(self):
+        return {"source_url": self.coordinator.data.get("image"), **stale_attributes(self.coordinator)}
+
+    def _update_source(self) -> bool:
+        """Follow the nearest storm's image, True when it changed."""
+        url = self.coordinator.data.get("image")
+        key = image_key(url, self.coordinator.data.get("advisory_time")) if url else None
+        if key == self._key:
+            return False
+        self._key = key
+        self._attr_image_last_updated = dt_util.utcnow()
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state when the image or the availability changed.
+
+        The cache is warmed as soon as a new image is announced.
+        """
+        changed = self._update_source()
+        if changed and self._key is not None:
+            self.hass.async_create_task(self.async_image())
+        if changed or self.coordinator.changed_fields is None:
+            self.async_write_ha_state()
+
+    async def async_image(self) -> bytes | None:
+        """Return the image bytes from the cache."""
+        url = self.coordinator.data.get("image")
+        if not url:
+            return None
+        data = await self._cache.async_get(url, self.coordinator.data.get("advisory_time"), self._thumbnail)
+        if data is not None:
+            self._attr_content_type = content_type(data)
+        return data
+
+class TyphoonTrackThumbnail(TyphoonTrackImage):
+    """Downscaled track image for mobile dashboards, needs Pillow."""
+
+    _thumbnail = True
+    _attr_entity_registry_enabled_default = False
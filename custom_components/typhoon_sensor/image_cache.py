@@ -0,0 +1,263 @@
+"""Local cache of the PAGASA track images."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import hashlib
+import io
+import logging
+import os
+from pathlib import Path
+import shutil
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+
+from .const import (
+    DOMAIN,
+    DATA_IMAGE_CACHE,
+    IMAGE_CACHE_DIR,
+    IMAGE_CACHE_SIZE,
+    IMAGE_FETCH_TIMEOUT,
+    IMAGE_INDEX_STORAGE_KEY,
+    IMAGE_INDEX_STORAGE_VERSION,
+    SNAPSHOT_SAVE_DELAY,
+    FETCH_CONNECT_TIMEOUT,
+    FETCH_READ_TIMEOUT,
+    THUMBNAIL_SIZE,
+)
+from .session import async_get_session
+
+_LOGGER = logging.getLogger(__name__)
+
+MEMORY_ENTRIES = 4
+
+
+@callback
+def async_get_image_cache(hass: HomeAssistant) -> TrackImageCache:
+    """Return the domain wide image cache, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (cache := domain_data.get(DATA_IMAGE_CACHE)) is None:
+        cache = domain_data[DATA_IMAGE_CACHE] = TrackImageCache(hass)
+    return cache
+
+
+def image_key(url: str, version: str | None) -> str:
+    """Return the cache key of an image.
+
+    PAGASA reuses the same URL for every advisory of a storm, so the key
+    includes the advisory the image belongs to.
+    """
+    return hashlib.sha1(f"{url}|{version or ''}".encode()).hexdigest()
+
+
+def content_type(data: bytes) -> str:
+    """Guess the content type of an image from its first bytes."""
+    if data.startswith(b"\x89PNG"):
+        return "image/png"
+    if data[:4] in (b"GIF8",):
+        return "image/gif"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return "image/jpeg"
+
+
+def make_thumbnail(data: bytes) -> bytes | None:
+    """Downscale an image to a JPEG thumbnail, None when Pillow is not installed."""
+    try:
+        from PIL import Image  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    with Image.open(io.BytesIO(data)) as image:
+        image.thumbnail(THUMBNAIL_SIZE)
+        output = io.BytesIO()
+        image.convert("RGB").save(output, "JPEG", quality=80, optimize=True)
+        return output.getvalue()
+
+
+class TrackImageCache:
+    """Download every track image once and keep it on disk.
+
+    Images are stored under typhoon_sensor/images in the config directory,
+    one file per key, and the least recently used ones are removed once
+    there are more than IMAGE_CACHE_SIZE. A thumbnail is made from the
+    cached image the first time it is asked for and kept next to it. The
+    few most recent images are also kept in memory. When a download fails
+    the newest cached image of the same URL is served instead. Which image
+    that is gets saved too, so this still works after a restart.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._path = Path(hass.config.path(DOMAIN, IMAGE_CACHE_DIR))
+        # Where earlier versions kept the images, moved on first use
+        self._legacy_path = Path(hass.config.path(STORAGE_DIR, f"{DOMAIN}_images"))
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._pending: dict[str, asyncio.Task] = {}
+        self._latest: dict[str, str] = {}  # url -> key of its newest cached image
+        self._index_store = Store(hass, IMAGE_INDEX_STORAGE_VERSION, IMAGE_INDEX_STORAGE_KEY)
+        self._load_task: asyncio.Task | None = None
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "downloads": 0, "failures": 0, "evictions": 0}
+
+    async def async_get(self, url: str, version: str | None = None, thumbnail: bool = False) -> bytes | None:
+        """Return the image (or its thumbnail), downloading it if needed."""
+        key, data = await self._async_get_image(url, version)
+        if not thumbnail or data is None:
+            return data
+        # The thumbnail is made from the cached image, never downloaded on its own
+        thumb = await self.async_get_key(key, thumbnail=True)
+        if thumb is None:
+            thumb = await self.hass.async_add_executor_job(self._store_thumbnail, key, data)
+            if thumb is not None:
+                self._memory_put(f"{key}_thumb.jpg", thumb)
+        # Without Pillow there is no thumbnail, the full image is better than nothing
+        return thumb or data
+
+    async def _async_get_image(self, url: str, version: str | None) -> tuple[str, bytes | None]:
+        """Return the key and the bytes of the image served for url and version."""
+        await self._async_load_index()
+        key = image_key(url, version)
+        if (data := self._memory_get(key)) is not None:
+            return key, data
+
+        data = await self.hass.async_add_executor_job(self._read, key)
+        if data is not None:
+            self.stats["disk_hits"] += 1
+        elif (data := self._memory_get(key)) is None:
+            # Concurrent requests for the same image share one download. A
+            # download that finished during the read above is in memory already
+            if key not in self._pending:
+                self._pending[key] = self.hass.async_create_task(self._async_download(url, key))
+            try:
+                await asyncio.shield(self._pending[key])
+            finally:
+                self._pending.pop(key, None)
+            data = self._memory.get(key)
+
+        if data is None and (latest := self._latest.get(url)) and latest != key:
+            _LOGGER.debug("Serving the last cached image of %s", url)
+            return latest, await self.async_get_key(latest)
+        if data is not None:
+            self._memory_put(key, data)
+        return key, data
+
+    async def _async_load_index(self) -> None:
+        """Load the newest image per URL saved before a restart, once."""
+        if self._load_task is None:
+            self._load_task = self.hass.async_create_task(self._async_load_index_once())
+        await asyncio.shield(self._load_task)
+
+    async def _async_load_index_once(self) -> None:
+        await self.hass.async_add_executor_job(self._migrate)
+        try:
+            data = await self._index_store.async_load()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Could not load the track image index: %s", err)
+            return
+        if not data:
+            return
+        # Images evicted since are dropped, downloads since the start win
+        cached = await self.hass.async_add_executor_job(self._cached_keys)
+        for url, key in data.get("latest", {}).items():
+            if key in cached:
+                self._latest.setdefault(url, key)
+
+    def _migrate(self) -> None:
+        """Move the images out of .storage, where earlier versions kept them."""
+        if not self._legacy_path.is_dir():
+            return
+        if self._path.exists():
+            shutil.rmtree(self._legacy_path, ignore_errors=True)
+            return
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._legacy_path.rename(self._path)
+        except OSError as err:
+            _LOGGER.debug("Could not move the cached track images, dropping them: %s", err)
+            shutil.rmtree(self._legacy_path, ignore_errors=True)
+
+    def _cached_keys(self) -> set[str]:
+        try:
+            return {path.name for path in self._path.iterdir()}
+        except FileNotFoundError:
+            return set()
+
+    async def async_get_key(self, key: str, thumbnail: bool = False) -> bytes | None:
+        """Return a cached image by key, without downloading."""
+        name = f"{key}_thumb.jpg" if thumbnail else key
+        if (data := self._memory_get(name)) is None:
+            data = await self.hass.async_add_executor_job(self._read, name)
+            if data is not None:
+                self._memory_put(name, data)
+        return data
+
+    def _memory_get(self, name: str) -> bytes | None:
+        if (data := self._memory.get(name)) is not None:
+            self._memory.move_to_end(name)
+            self.stats["memory_hits"] += 1
+        return data
+
+    def _memory_put(self, name: str, data: bytes) -> None:
+        self._memory[name] = data
+        self._memory.move_to_end(name)
+        while len(self._memory) > MEMORY_ENTRIES:
+            self._memory.popitem(last=False)
+
+    async def _async_download(self, url: str, key: str) -> None:
+        session = async_get_session(self.hass)
+        timeout = aiohttp.ClientTimeout(
+            total=IMAGE_FETCH_TIMEOUT, sock_connect=FETCH_CONNECT_TIMEOUT, sock_read=FETCH_READ_TIMEOUT
+        )
+        try:
+            async with session.get(url, timeout=timeout) as response:
+                if response.status != 200:
+                    raise RuntimeError(f"HTTP {response.status}")
+                data = await response.read()
+        except Exception as err:  # pylint: disable=broad-except
+            self.stats["failures"] += 1
+            _LOGGER.warning("Could not download track image %s: %s", url, err)
+            return
+
+        self.stats["downloads"] += 1
+        await self.hass.async_add_executor_job(self._store, key, data)
+        self._memory_put(key, data)
+        self._latest[url] = key
+        self._index_store.async_delay_save(lambda: {"latest": self._latest}, SNAPSHOT_SAVE_DELAY)
+
+    def _read(self, name: str) -> bytes | None:
+        path = self._path / name
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        os.utime(path)  # Mark as recently used
+        return data
+
+    def _store(self, key: str, data: bytes) -> None:
+        """Write an image, then evict the least recently used."""
+        self._path.mkdir(parents=True, exist_ok=True)
+        (self._path / key).write_bytes(data)
+
+        images = sorted(
+            (path for path in self._path.iterdir() if not path.name.endswith("_thumb.jpg")),
+            key=lambda path: path.stat().st_mtime,
+        )
+        for path in images[:-IMAGE_CACHE_SIZE]:
+            path.unlink(missing_ok=True)
+            (self._path / f"{path.name}_thumb.jpg").unlink(missing_ok=True)
+            self.stats["evictions"] += 1
+
+    def _store_thumbnail(self, key: str, data: bytes) -> bytes | None:
+        """Make the thumbnail of a cached image and write it next to the image."""
+        try:
+            thumbnail = make_thumbnail(data)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Could not create a thumbnail: %s", err)
+            return None
+        # Not for an image evicted meanwhile, its thumbnail would never be removed
+        if thumbnail is not None and (self._path / key).exists():
+            (self._path / f"{key}_thumb.jpg").write_bytes(thumbnail)
+        return thumbnail
@@ -0,0 +1,398 @@
+"""Streaming parser for the PAGASA severe weather bulletin page."""
+from __future__ import annotations
+
+import codecs
+from dataclasses import dataclass
+import hashlib
+from html.parser import HTMLParser
+import logging
+import re
+
+from .advisory_time import parse_issued_time
+from .places import geocode
+from .signals import parse_wind_signals
+
+_LOGGER = logging.getLogger(__name__)
+
+SECTION_CLASS = "tropical-cyclone-weather-bulletin-page"
+NO_ACTIVE_PATTERN = re.compile(r"No Active Tropical Cyclone", re.I)
+COORDINATES_PATTERN = re.compile(r"\(\s*(\d+\.\d+)\s*°N,\s*(\d+\.\d+)\s*°E\s*\)")
+LAT_LON_PATTERN = re.compile(r"Lat:\s*([^,\n]*),[^\n]*?Lon:\s*([^\n]*)")
+SUSTAINED_PATTERN = re.compile(r"sustained winds of (\d+)")
+GUST_PATTERN = re.compile(r"gustiness of up to (\d+)")
+NEXT_ADVISORY_PATTERN = re.compile(r"issued at ([\d:]+ [AP]M \w+)")
+STORM_ID_PATTERN = re.compile(r"[^a-z0-9]+")
+MOVEMENT_PATTERN = re.compile(r"^(?:moving\s+)?(?P<direction>.+?)(?:\s+at\s+(?P<speed>\d+)\s*km/?h)?$", re.I)
+
+# Structured panels, (key, lowercased heading prefix). The wind signal
+# heading reads "Wind Signal(Areas with TCWS)" on the current page.
+PANEL_HEADINGS = (
+    ("location", "location of eye"),
+    ("movement", "movement"),
+    ("strength", "strength"),
+    ("forecast", "forecast position"),
+    ("signals", "wind signal"),
+)
+KNOWN_PANELS = {key for key, _ in PANEL_HEADINGS}
+
+
+@dataclass(slots=True)
+class Bulletin:
+    """A parsed bulletin, shared by every config entry."""
+
+    typhoons: list[dict]
+    no_active: bool
+    digest: str
+
+    def as_dict(self) -> dict:
+        """Return a JSON serializable form, used for the on-disk snapshot."""
+        return {
+            "typhoons": [
+                {**typhoon, "coordinates": list(typhoon["coordinates"])}
+                for typhoon in self.typhoons
+            ],
+            "no_active": self.no_active,
+            "digest": self.digest,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Bulletin:
+        """Rebuild a bulletin from its snapshot form."""
+        return cls(
+            [
+                {**typhoon, "coordinates": tuple(typhoon["coordinates"])}
+                for typhoon in data["typhoons"]
+            ],
+            data["no_active"],
+            data["digest"],
+        )
+
+
+class BulletinStreamParser(HTMLParser):
+    """Incrementally scan the bulletin page, keeping only the bulletin sections.
+
+    The page is fed chunk by chunk as it arrives. Everything outside the
+    tropical cyclone bulletin sections is discarded on the fly, so only the
+    sections themselves (a small fraction of the page) are ever handed to
+    BeautifulSoup.
+    """
+
+    def __init__(self, encoding: str = "utf-8") -> None:
+        """Initialize."""
+        super().__init__(convert_charrefs=False)
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self._buffer: list[str] | None = None
+        self._depth = 0
+        self._h3_text: list[str] | None = None
+        self.sections: list[str] = []
+        self.no_active = False
+
+    def feed_bytes(self, chunk: bytes) -> None:
+        """Feed a chunk of the raw response body."""
+        self.feed(self._decoder.decode(chunk))
+
+    def close(self) -> None:
+        """Flush the decoder and finish parsing."""
+        self.feed(self._decoder.decode(b"", final=True))
+        super().close()
+        if self._buffer is not None:
+            # Truncated page, keep whatever we got of the last section
+            self.sections.append("".join(self._buffer))
+            self._buffer = None
+
+    def digest(self) -> str:
+        """Return a hash of the bulletin sections, used to detect unchanged bulletins."""
+        sha = hashlib.sha1(b"no-active" if self.no_active else b"active")
+        for section in self.sections:
+            sha.update(section.encode("utf-8"))
+        return sha.hexdigest()
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "h3":
+            self._h3_text = []
+        if self._buffer is not None:
+            self._buffer.append(self.get_starttag_text())
+            if tag == "div":
+                self._depth += 1
+        elif tag == "div":
+            classes = dict(attrs).get("class") or ""
+            if SECTION_CLASS in classes.split():
+                self._buffer = [self.get_starttag_text()]
+                self._depth = 1
+
+    def handle_startendtag(self, tag, attrs):
+        if self._buffer is not None:
+            self._buffer.append(self.get_starttag_text())
+
+    def handle_endtag(self, tag):
+        if tag == "h3" and self._h3_text is not None:
+            if NO_ACTIVE_PATTERN.search("".join(self._h3_text)):
+                self.no_active = True
+            self._h3_text = None
+        if self._buffer is not None:
+            self._buffer.append(f"</{tag}>")
+            if tag == "div":
+                self._depth -= 1
+                if self._depth == 0:
+                    self.sections.append("".join(self._buffer))
+                    self._buffer = None
+
+    def handle_data(self, data):
+        if self._buffer is not None:
+            self._buffer.append(data)
+        if self._h3_text is not None:
+            self._h3_text.append(data)
+
+    def handle_entityref(self, name):
+        self.handle_data(f"&{name};")
+
+    def handle_charref(self, name):
+        self.handle_data(f"&#{name};")
+
+    def handle_comment(self, data):
+        if self._buffer is not None:
+            self._buffer.append(f"<!--{data}-->")
+
+
+def parse_forecast_positions(items: list[str]) -> list[list]:
+    """Parse the Forecast Position list into [timestamp, lat, lon, text] rows.
+
+    Items look like "Feb 06, 2026 05:00 AM - In the vicinity of Ilog,
+    Negros Occidental". Positions given as coordinates are used as is,
+    place names are resolved with the bundled gazetteer; lat/lon are None
+    when neither works. Items without a valid time are skipped.
+    """
+    rows = []
+    for item in items:
+        when, _, text = item.partition(" - ")
+        if (forecast_time := parse_issued_time(when)) is None:
+            continue
+        timestamp = forecast_time.timestamp()
+        text = " ".join(text.split())
+        if match := COORDINATES_PATTERN.search(text):
+            coords = (float(match.group(1)), float(match.group(2)))
+        else:
+            coords = geocode(text) or (None, None)
+        rows.append([timestamp, *coords, text])
+    return rows
+
+
+def storm_id(name: str) -> str:
+    """Return a stable key for a storm, derived from its local name."""
+    return STORM_ID_PATTERN.sub("_", name.lower()).strip("_") or "unknown"
+
+
+def storm_ids(typhoons: list[dict]) -> list[str]:
+    """Return the key of every storm of a bulletin, in bulletin order.
+
+    Names that give the same key (two storms without a readable name are
+    both "unknown") would share one entity, from the second storm on the
+    key gets the storm's position in the bulletin appended.
+    """
+    ids = []
+    for position, typhoon in enumerate(typhoons, 1):
+        key = storm_id(typhoon["name"])
+        ids.append(f"{key}_{position}" if key in ids else key)
+    return ids
+
+
+def index_panels(section) -> dict:
+    """Map the panels of a storm section by heading, in one pass.
+
+    The panels the integration understands are keyed by their PANEL_HEADINGS
+    name ("location", "movement", ...), any other headed panel by its
+    lowercased heading.
+    """
+    panels = {}
+    for panel in section.find_all("div", class_="panel"):
+        head = panel.find("div", class_="panel-heading")
+        if head is None:
+            continue
+        heading = head.get_text(strip=True).lower()
+        key = next((key for key, prefix in PANEL_HEADINGS if prefix in heading), heading)
+        panels.setdefault(key, panel)
+    return panels
+
+
+def panel_text(panel, clean: bool = False) -> str | None:
+    """Return the text of a panel's body, with whitespace collapsed if ``clean``."""
+    body = panel.find("div", class_="panel-body") if panel is not None else None
+    if body is None:
+        return None
+    return " ".join(body.get_text(" ").split()) if clean else body.get_text(strip=True)
+
+
+def _issued_headings(section) -> tuple[str | None, str | None]:
+    """Return the "Issued at" and next advisory h5 texts of a section."""
+    issued_tag = next_tag = None
+    headings = section.find_all("h5")
+    for h5 in headings:
+        style = h5.get("style") or ""
+        if issued_tag is None and "margin-bottom" in style:
+            issued_tag = h5
+        if next_tag is None and "margin-top" in style:
+            next_tag = h5
+    for h5 in headings:
+        text = h5.get_text()
+        if issued_tag is None and "Issued at" in text:
+            issued_tag = h5
+        if next_tag is None and "next advisory" in text:
+            next_tag = h5
+    return (
+        issued_tag.get_text(strip=True) if issued_tag else None,
+        next_tag.get_text(strip=True) if next_tag else None,
+    )
+
+
+def parse_movement(text: str | None) -> dict:
+    """Split "Moving West Northwestward at 20 km/h" into direction and speed."""
+    match = MOVEMENT_PATTERN.match(" ".join(text.split())) if text else None
+    if match is None:
+        return {"direction": None, "speed": None}
+    speed = match.group("speed")
+    return {"direction": match.group("direction"), "speed": int(speed) if speed else None}
+
+
+def parse_bulletin(body: bytes) -> Bulletin:
+    """Parse a whole bulletin page, e.g. an archived copy, in one call."""
+    stream = BulletinStreamParser()
+    stream.feed_bytes(body)
+    stream.close()
+    return Bulletin(parse_bulletin_sections(stream.sections), stream.no_active, stream.digest())
+
+
+def parse_bulletin_sections(sections: list[str]) -> list[dict]:
+    """Extract every typhoon with a known position from the bulletin sections.
+
+    This is a pure function so it can run in a worker thread.
+    """
+    # BeautifulSoup is only needed once there is a storm to parse, import it
+    # here so loading the integration doesn't pay for it
+    from bs4 import BeautifulSoup  # pylint: disable=import-outside-toplevel
+
+    typhoons = []
+    soup = BeautifulSoup("".join(sections), "html.parser")
+
+    typhoon_sections = soup.find_all("div", class_=SECTION_CLASS)
+    _LOGGER.debug("Found %d typhoon sections", len(typhoon_sections))
+
+    # With more than one active storm every storm gets its own tab in the section
+    storm_sections = []
+    for section in typhoon_sections:
+        storm_sections.extend(section.find_all("div", class_="tab-pane") or [section])
+
+    for section in storm_sections:
+        # Extract typhoon name and classification
+        typhoon_name_tag = section.find("h3")
+        classification = "Unknown"
+        typhoon_name = "Unknown"
+
+        if typhoon_name_tag:
+            full_text = typhoon_name_tag.get_text(strip=True)
+            if '"' in full_text:
+                parts = full_text.split('"')
+                if len(parts) >= 2:
+                    classification = parts[0].strip()
+                    typhoon_name = parts[1].strip()
+                else:
+                    typhoon_name = full_text
+            else:
+                typhoon_name = full_text
+
+        # Extract details
+        details_tag = section.find("p")
+        details = details_tag.get_text(strip=True) if details_tag else "No details available"
+
+        # Every panel is looked up once, the fields below read from the index
+        panels = index_panels(section)
+
+        image_url = None
+        img_tag = section.find("img", class_="img-responsive image-preview")
+        if img_tag and img_tag.get("src"):
+            src = img_tag.get("src")
+            if src.startswith("http"):
+                image_url = src
+            else:
+                image_url = f"https://pubfiles.pagasa.dost.gov.ph{src}" if src.startswith("/") else f"https://pubfiles.pagasa.dost.gov.ph/{src}"
+
+        movement = panel_text(panels.get("movement"))
+
+        strength_text = panel_text(panels.get("strength"))
+        sustained_winds = None
+        gustiness = None
+        if strength_text:
+            if sust_match := SUSTAINED_PATTERN.search(strength_text):
+                sustained_winds = int(sust_match.group(1))
+            if gust_match := GUST_PATTERN.search(strength_text):
+                gustiness = int(gust_match.group(1))
+
+        issued_text, next_text = _issued_headings(section)
+        advisory_time = issued_text.replace("Issued at ", "") if issued_text is not None else None
+        next_advisory_time = None
+        if next_text is not None:
+            # Extract time from text like "(Valid ... issued at 11:00 PM today)"
+            match = NEXT_ADVISORY_PATTERN.search(next_text)
+            next_advisory_time = match.group(1) if match else next_text
+
+        forecast_body = panels.get("forecast")
+        forecast_body = forecast_body.find("div", class_="panel-body") if forecast_body else None
+        forecast = parse_forecast_positions(
+            [li.get_text(" ", strip=True) for li in forecast_body.find_all("li")] if forecast_body else []
+        )
+
+        signal_panel = panels.get("signals")
+        wind_signals = parse_wind_signals(signal_panel) if signal_panel else []
+
+        # Extract coordinates, from the details or else the location panel
+        lat, lon = None, None
+        location_text = panel_text(panels.get("location"), clean=True)
+        match = COORDINATES_PATTERN.search(details)
+        if not match and location_text:
+            match = COORDINATES_PATTERN.search(location_text)
+
+        if match:
+            try:
+                lat = float(match.group(1))
+                lon = float(match.group(2))
+            except ValueError: pass
+
+        if lat is None or lon is None:
+            for match in LAT_LON_PATTERN.finditer(details):
+                try:
+                    lat = float(match.group(1))
+                    lon = float(match.group(2))
+                except ValueError: continue
+
+        if lat is not None and lon is not None:
+            _LOGGER.debug("Adding typhoon: %s", typhoon_name)
+            typhoons.append({
+                "name": typhoon_name,
+                "classification": classification,
+                "coordinates": (lat, lon),
+                "details": details,
+                "image": image_url,
+                "movement": movement,
+                "sustained_winds": sustained_winds,
+                "gustiness": gustiness,
+                "advisory_time": advisory_time,
+                "next_advisory_time": next_advisory_time,
+                "forecast": forecast,
+                "wind_signals": wind_signals,
+                # Every panel in structured form, forecast and signals are above
+                "panels": {
+                    "location": {"text": location_text, "latitude": lat, "longitude": lon},
+                    "strength": {
+                        "text": panel_text(panels.get("strength"), clean=True),
+                        "sustained_winds": sustained_winds,
+                        "gustiness": gustiness,
+                    },
+                    "movement": {"text": panel_text(panels.get("movement"), clean=True), **parse_movement(movement)},
+                    "other": {
+                        heading: panel_text(panel, clean=True)
+                        for heading, panel in panels.items()
+                        if heading not in KNOWN_PANELS
+                    },
+                },
+            })
+
+    return typhoons
@@ -0,0 +1,180 @@
+"""Bundled gazetteer of Philippine provinces and reference places."""
+from __future__ import annotations
+
+from functools import lru_cache
+import json
+import math
+from pathlib import Path
+import re
+
+from .const import EARTH_RADIUS_KM
+
+PLACES_FILE = Path(__file__).parent / "places.json"
+GRID_SIZE = 1.0  # degrees per spatial index cell
+TOWN_RADIUS = 15  # km, how close a reference place must be to count as home's town
+
+OFFSET_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*km\s+([a-z ]+?)\s+of\s+(.+)", re.I)
+PREFIX_PATTERN = re.compile(r"^(?:over|in|near|off)\s+(?:the\s+)?", re.I)
+NON_ALNUM_PATTERN = re.compile(r"[^a-z0-9]+")
+PLACE_AFFIX_PATTERN = re.compile(r"^city of |\b(?:city|islands?)\b")
+PARENTHESES_PATTERN = re.compile(r"\(.*?\)")
+
+# 16 point compass, as used in the bulletin ("West Southwest")
+BEARINGS = {
+    name: index * 22.5
+    for index, name in enumerate((
+        "north", "northnortheast", "northeast", "eastnortheast",
+        "east", "eastsoutheast", "southeast", "southsoutheast",
+        "south", "southsouthwest", "southwest", "westsouthwest",
+        "west", "westnorthwest", "northwest", "northnorthwest",
+    ))
+}
+
+
+def normalize(name: str) -> str:
+    """Return a lookup key for a place name ("City of Sipalay" -> "sipalay")."""
+    name = NON_ALNUM_PATTERN.sub(" ", name.lower())
+    name = PLACE_AFFIX_PATTERN.sub(" ", name)
+    return " ".join(name.split())
+
+
+@lru_cache(maxsize=None)
+def _load() -> dict:
+    return json.loads(PLACES_FILE.read_text(encoding="utf-8"))
+
+
+def province_names() -> list[str]:
+    """Return the province names of the gazetteer, as written in the bulletin."""
+    return sorted(_load()["provinces"])
+
+
+@lru_cache(maxsize=None)
+def gazetteer() -> tuple[dict, dict, dict]:
+    """Load the bundled places once per process.
+
+    Returns (provinces, places, unique places) keyed by normalized name.
+    Provinces map to (lat, lon, island group), places to (lat, lon,
+    province key) and are keyed by (name, province key).
+    """
+    data = _load()
+    provinces = {
+        normalize(name): (lat, lon, group) for name, (lat, lon, group) in data["provinces"].items()
+    }
+    places = {}
+    by_name = {}
+    for name, (lat, lon, province) in data["places"].items():
+        key = normalize(name)
+        places[key, normalize(province)] = (lat, lon, normalize(province))
+        by_name.setdefault(key, []).append((lat, lon, normalize(province)))
+    unique = {key: found[0] for key, found in by_name.items() if len(found) == 1}
+    return provinces, places, unique
+
+
+@lru_cache(maxsize=None)
+def spatial_index() -> dict[tuple[int, int], list[tuple]]:
+    """Bucket every province and place centroid into a coarse lat/lon grid.
+
+    Built from the gazetteer on first use and kept for the process. Cells
+    hold (lat, lon, province key, place key or None) entries.
+    """
+    provinces, places, _ = gazetteer()
+    grid = {}
+    for key, (lat, lon, _) in provinces.items():
+        grid.setdefault(_cell(lat, lon), []).append((lat, lon, key, None))
+    for (key, province), (lat, lon, _) in places.items():
+        grid.setdefault(_cell(lat, lon), []).append((lat, lon, province, key))
+    return grid
+
+
+def _cell(lat: float, lon: float) -> tuple[int, int]:
+    return math.floor(lat / GRID_SIZE), math.floor(lon / GRID_SIZE)
+
+
+def locate(lat: float, lon: float) -> tuple[str | None, str | None]:
+    """Return (province key, town key) for a point.
+
+    The province is the one with the nearest centroid or reference place,
+    found by scanning the grid cells around the point, so the lookup cost
+    does not depend on the size of the gazetteer. The town is only set when
+    a reference place lies within TOWN_RADIUS km.
+    """
+    grid = spatial_index()
+    row, col = _cell(lat, lon)
+    scale = math.cos(math.radians(lat))
+    best = None
+    # Widen the search ring until something is found, plus one ring to be sure it is the nearest
+    for radius in range(4):
+        for r in range(row - radius, row + radius + 1):
+            for c in range(col - radius, col + radius + 1):
+                if max(abs(r - row), abs(c - col)) != radius:
+                    continue
+                for entry in grid.get((r, c), ()):
+                    dist = math.hypot(entry[0] - lat, (entry[1] - lon) * scale)
+                    if best is None or dist < best[0]:
+                        best = (dist, entry)
+        if best is not None and best[0] < radius * GRID_SIZE:
+            break
+    if best is None:
+        return None, None
+    dist, (_, _, province, town) = best
+    if town is not None and math.radians(dist) * EARTH_RADIUS_KM > TOWN_RADIUS:
+        town = None
+    return province, town
+
+
+def destination(lat: float, lon: float, bearing: float, distance: float) -> tuple[float, float]:
+    """Return the point ``distance`` km from (lat, lon) along ``bearing`` degrees."""
+    lat1, lon1, theta = map(math.radians, (lat, lon, bearing))
+    delta = distance / EARTH_RADIUS_KM
+    lat2 = math.asin(
+        math.sin(lat1) * math.cos(delta) + math.cos(lat1) * math.sin(delta) * math.cos(theta)
+    )
+    lon2 = lon1 + math.atan2(
+        math.sin(theta) * math.sin(delta) * math.cos(lat1),
+        math.cos(delta) - math.sin(lat1) * math.sin(lat2),
+    )
+    return round(math.degrees(lat2), 3), round(math.degrees(lon2), 3)
+
+
+def lookup(name: str, province: str | None = None) -> tuple[float, float] | None:
+    """Return the coordinates of a place, optionally within a province."""
+    provinces, places, unique = gazetteer()
+    key = normalize(name)
+    if province:
+        province_key = normalize(province)
+        if (found := places.get((key, province_key))) is not None:
+            return found[:2]
+        if key == province_key or province_key not in provinces:
+            found = provinces.get(key) or provinces.get(province_key)
+            return found[:2] if found else None
+        # Unknown town, the province centroid is the best we have
+        return provinces[province_key][:2]
+    found = provinces.get(key) or unique.get(key)
+    return found[:2] if found else None
+
+
+def geocode(text: str) -> tuple[float, float] | None:
+    """Resolve a bulletin position description to coordinates.
+
+    Handles "Over the coastal waters of Balingasag, Misamis Oriental",
+    "In the vicinity of Ilog, Negros Occidental" and offsets such as
+    "145 km West Southwest of Coron, Palawan". Returns None when the
+    place is not in the gazetteer.
+    """
+    text = PARENTHESES_PATTERN.sub("", text).strip(" .")
+    offset = None
+    if match := OFFSET_PATTERN.search(text):
+        bearing = BEARINGS.get(match.group(2).lower().replace(" ", ""))
+        if bearing is None:
+            return None
+        offset = (bearing, float(match.group(1)))
+        text = match.group(3)
+    elif " of " in text:
+        text = text.rsplit(" of ", 1)[1]
+    else:
+        text = PREFIX_PATTERN.sub("", text)
+
+    name, _, province = (part.strip() for part in text.partition(","))
+    if (coords := lookup(name, province.rsplit(",", 1)[-1].strip() or None)) is None:
+        return None
+    return destination(*coords, *offset) if offset else coords
@@ -0,0 +1,139 @@
+"""Build an entry's result from the parsed typhoons.
+
+Nothing here depends on Home Assistant, the coordinator and the archive
+parser share it.
+"""
+from __future__ import annotations
+
+from .advisory_time import parse_advisory_time, parse_issued_time
+from .distance import distance_matrix, nearest_storms
+from .forecast import EMPTY_FORECAST_METRICS, closest_approach
+from .history import EMPTY_MOTION_METRICS, motion_metrics
+from .parser import storm_ids
+from .signals import home_signal, signal_index
+
+
+def empty_result() -> dict:
+    """Return the result when no storm is active."""
+    return {
+        "name": "No typhoon detected",
+        "classification": "None",
+        "distance": None,
+        "details": "No active typhoon detected",
+        "image": None,
+        "movement": None,
+        "sustained_winds": None,
+        "gustiness": None,
+        "advisory_time": None,
+        "next_advisory_time": None,
+        "advisory_at": None,
+        "next_advisory_at": None,
+        **EMPTY_MOTION_METRICS,
+        "forecast_storm": None,
+        **EMPTY_FORECAST_METRICS,
+        "wind_signal": 0,
+        "wind_signal_partial": False,
+        "wind_signal_storm": None,
+        "storms": {},
+        "points": {},
+    }
+
+
+def build_result(typhoons, home, points=(), tracks=None, home_area=(None, None)) -> dict:
+    """Index every parsed typhoon by storm and pick the nearest, for home and every point.
+
+    ``home`` is a (lat, lon) pair, ``points`` extra (id, name, (lat, lon))
+    points of interest, ``tracks`` the track history per storm id (motion
+    metrics are left empty without it) and ``home_area`` the (province,
+    town) gazetteer keys of home for the wind signal lookup.
+    """
+    tracks = tracks or {}
+    nearest_typhoon = None
+    nearest_distance = float("inf")
+    forecast_storm = None
+    wind_signal = (0, False, None)
+    storms = {}
+    if not typhoons:
+        return empty_result()
+
+    # Every storm against home and every point of interest in one batch, home is column 0
+    matrix = distance_matrix(
+        [typhoon["coordinates"] for typhoon in typhoons],
+        [home, *(coords for _, _, coords in points)],
+    )
+
+    for row, (key, typhoon) in enumerate(zip(storm_ids(typhoons), typhoons)):
+        distance = float(matrix[row, 0])
+        track = tracks.get(key)
+        issued = parse_issued_time(typhoon["advisory_time"])
+        storms[key] = {
+            **typhoon,
+            "advisory_at": issued,
+            # "11:00 PM today" means the day of the advisory, not the day we read it
+            "next_advisory_at": parse_advisory_time(typhoon["next_advisory_time"], issued),
+            "distance": distance,
+            "track_points": len(track) if track else 0,
+            **(motion_metrics(track, home) if track else EMPTY_MOTION_METRICS),
+            **closest_approach(
+                issued.timestamp() if issued else None,
+                typhoon["coordinates"],
+                typhoon.get("forecast"),
+                home,
+            ),
+        }
+        signal, partial = home_signal(signal_index(typhoon.get("wind_signals") or ()), *home_area)
+        storms[key]["wind_signal"] = signal
+        storms[key]["wind_signal_partial"] = partial
+        if signal > wind_signal[0] or (signal == wind_signal[0] and wind_signal[1] and not partial):
+            wind_signal = (signal, partial, typhoon["name"])
+        if distance < nearest_distance:
+            nearest_distance = distance
+            nearest_typhoon = storms[key]
+        # The forecast sensors follow whichever storm is predicted to come closest
+        closest = storms[key]["forecast_closest_distance"]
+        if closest is not None and (forecast_storm is None or closest < forecast_storm["forecast_closest_distance"]):
+            forecast_storm = storms[key]
+
+    if nearest_typhoon:
+        return {
+            "name": nearest_typhoon["name"],
+            "classification": nearest_typhoon["classification"],
+            "distance": nearest_distance,
+            "details": nearest_typhoon["details"],
+            "image": nearest_typhoon["image"],
+            "movement": nearest_typhoon["movement"],
+            "sustained_winds": nearest_typhoon["sustained_winds"],
+            "gustiness": nearest_typhoon["gustiness"],
+            "advisory_time": nearest_typhoon["advisory_time"],
+            "next_advisory_time": nearest_typhoon["next_advisory_time"],
+            "advisory_at": nearest_typhoon["advisory_at"],
+            "next_advisory_at": nearest_typhoon["next_advisory_at"],
+            "closing_speed": nearest_typhoon["closing_speed"],
+            "intensification_rate": nearest_typhoon["intensification_rate"],
+            "time_to_closest_approach": nearest_typhoon["time_to_closest_approach"],
+            "closest_approach_distance": nearest_typhoon["closest_approach_distance"],
+            "forecast_storm": forecast_storm["name"] if forecast_storm else None,
+            **{key: forecast_storm[key] if forecast_storm else None for key in EMPTY_FORECAST_METRICS},
+            "wind_signal": wind_signal[0],
+            "wind_signal_partial": wind_signal[1],
+            "wind_signal_storm": wind_signal[2],
+            "storms": storms,
+            "points": nearest_per_point(typhoons, points, matrix),
+        }
+
+    return empty_result()
+
+
+def nearest_per_point(typhoons, points, matrix) -> dict:
+    """Return the nearest storm for every point of interest."""
+    if not points:
+        return {}
+    index, distances = nearest_storms(matrix[:, 1:])
+    return {
+        entity_id: {
+            "name": name,
+            "storm": typhoons[storm]["name"],
+            "distance": float(distance),
+        }
+        for (entity_id, name, _), storm, distance in zip(points, index.tolist(), distances.tolist())
+    }
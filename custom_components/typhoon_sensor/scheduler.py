@@ -0,0 +1,163 @@
+"""Adaptive poll scheduling for the Typhoon Sensor integration."""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import random
+from statistics import median
+
+from .const import (
+    DEFAULT_PUBLICATION_LAG,
+    MAX_PUBLICATION_LAG,
+    PUBLICATION_LAG_SAMPLES,
+    PROBE_INTERVAL,
+    MAX_PROBES,
+    BACKOFF_BASE,
+    POLL_JITTER,
+    SCHEDULER_HISTORY,
+)
+
+
+@dataclass(slots=True)
+class PollDecision:
+    """When to poll next and why."""
+
+    decided_at: datetime
+    next_poll: datetime
+    reason: str
+    probes_used: int
+
+    def as_dict(self) -> dict:
+        return {
+            "decided_at": self.decided_at.isoformat(),
+            "next_poll": self.next_poll.isoformat(),
+            "reason": self.reason,
+            "probes_used": self.probes_used,
+        }
+
+
+class PollScheduler:
+    """Pick the next poll time from what the last polls saw.
+
+    PAGASA publishes an advisory some time after its nominal "issued at"
+    time. The scheduler learns that lag from the advisories it sees change
+    (see publication_lag) and, around the expected release, runs a short
+    burst of probes (cheap, the source answers them with a conditional
+    request). Outside the burst window the interval doubles on every
+    unchanged poll, from BACKOFF_BASE (the shortest scan interval) up to the
+    scan interval. Every poll gets some jitter so entries don't poll in
+    lockstep.
+    """
+
+    def __init__(self, scan_interval: timedelta, idle_interval: timedelta, rng: random.Random | None = None) -> None:
+        """Initialize."""
+        self.scan_interval = scan_interval
+        self.idle_interval = idle_interval
+        self._rng = rng or random.Random()
+        self._lags: deque[float] = deque(maxlen=PUBLICATION_LAG_SAMPLES)
+        self._probes = 0
+        self._backoff = 0
+        self._last_issued: datetime | None = None
+        self._last_poll: datetime | None = None
+        self._live = False
+        self.decision: PollDecision | None = None
+        self.history: deque[PollDecision] = deque(maxlen=SCHEDULER_HISTORY)
+        self.stats = {"polls": 0, "changed": 0, "probes": 0, "errors": 0}
+
+    @property
+    def publication_lag(self) -> timedelta:
+        """Return the learned publication lag, the median of the observed ones.
+
+        The observed lags are upper bounds: a poll only tells that the
+        advisory was published at some point since the previous poll. Half
+        the gap since that poll is taken off every observation, so the lag
+        doesn't creep up with the poll interval, but the learned value stays
+        on the late side.
+        """
+        return timedelta(seconds=median(self._lags)) if self._lags else DEFAULT_PUBLICATION_LAG
+
+    def next_poll(
+        self,
+        now: datetime,
+        issued: datetime | None,
+        expected: datetime | None,
+        no_active: bool,
+        live: bool = True,
+    ) -> PollDecision:
+        """Record a poll result and decide when to poll next.
+
+        ``issued`` is the newest advisory time in the bulletin and
+        ``expected`` the earliest announced next advisory. ``live`` is
+        False for results restored from disk, which are not used to learn
+        the publication lag.
+        """
+        self.stats["polls"] += 1
+        changed = issued != self._last_issued
+        if changed:
+            self.stats["changed"] += 1
+            # Only a change seen between two live polls tells when it was published,
+            # somewhere since the previous poll, take the middle of that gap
+            if live and self._live and issued is not None and self._last_poll is not None:
+                published = max(self._last_poll + (now - self._last_poll) / 2, issued)
+                if timedelta(0) <= now - issued <= MAX_PUBLICATION_LAG:
+                    self._lags.append((published - issued).total_seconds())
+            self._last_issued = issued
+            self._probes = 0
+            self._backoff = 0
+        self._live = live
+        self._last_poll = now
+
+        if no_active:
+            return self._decide(now, self.idle_interval, "idle, no active tropical cyclone")
+
+        if expected is not None:
+            lag = self.publication_lag
+            # Probes are centred on the learned release time, never before the nominal time
+            burst_start = max(expected, expected + lag - PROBE_INTERVAL * (MAX_PROBES // 2))
+            if now < burst_start:
+                return self._decide(
+                    now,
+                    burst_start - now,
+                    f"advisory due {expected.isoformat()}, learned lag {lag.total_seconds() / 60:.0f} min",
+                )
+            if self._probes < MAX_PROBES:
+                self._probes += 1
+                self.stats["probes"] += 1
+                return self._decide(now, PROBE_INTERVAL, f"probe {self._probes}/{MAX_PROBES} around the expected release")
+
+        return self._decide(now, self._backoff_delay(), f"no change, backoff step {self._backoff}")
+
+    def retry(self, now: datetime) -> PollDecision:
+        """Decide when to poll again after a failed poll."""
+        self.stats["errors"] += 1
+        return self._decide(now, self._backoff_delay(), f"poll failed, backoff step {self._backoff}")
+
+    def _backoff_delay(self) -> timedelta:
+        """Return the next backoff delay, BACKOFF_BASE doubled per step up to the scan interval."""
+        delay = max(min(BACKOFF_BASE * (2 ** self._backoff), self.scan_interval), BACKOFF_BASE)
+        self._backoff += 1
+        return delay
+
+    def reset_backoff(self) -> None:
+        """Forget failed polls, for fixed interval polling which never calls next_poll."""
+        self._backoff = 0
+
+    def _decide(self, now: datetime, delay: timedelta, reason: str) -> PollDecision:
+        jitter = self._rng.uniform(0, min(POLL_JITTER, delay.total_seconds() * 0.1))
+        self.decision = PollDecision(now, now + delay + timedelta(seconds=jitter), reason, self._probes)
+        self.history.append(self.decision)
+        return self.decision
+
+    def as_dict(self) -> dict:
+        """Return the scheduler state, for diagnostics."""
+        return {
+            "next_poll": self.decision.next_poll.isoformat() if self.decision else None,
+            "reason": self.decision.reason if self.decision else None,
+            "probes_used": self._probes,
+            "backoff_step": self._backoff,
+            "publication_lag_minutes": round(self.publication_lag.total_seconds() / 60, 1),
+            "publication_lag_samples": len(self._lags),
+            "stats": self.stats,
+            "history": [decision.as_dict() for decision in self.history],
+        }
@@ -2,22 +2,17 @@
 Platform for Typhoon Sensor integration.
 """
 
-from homeassistant.helpers.entity import Entity
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, CoordinatorEntity
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-import async_timeout
-from bs4 import BeautifulSoup
+from homeassistant.helpers import entity_registry as er
 from homeassistant.util import dt as dt_util
-from homeassistant.helpers.event import async_track_point_in_time
-from haversine import haversine
-from datetime import datetime, timedelta
 import logging
-import re
 
 from .const import DOMAIN
+from .entity import TyphoonBaseSensor
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,307 +31,65 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         TyphoonGustinessSensor(coordinator, entry),
         TyphoonAdvisoryTimeSensor(coordinator, entry),
         TyphoonNextAdvisoryTimeSensor(coordinator, entry),
+        TyphoonClosingSpeedSensor(coordinator, entry),
+        TyphoonIntensificationRateSensor(coordinator, entry),
+        TyphoonTimeToClosestApproachSensor(coordinator, entry),
+        TyphoonForecastClosestApproachSensor(coordinator, entry),
+        TyphoonForecastClosestApproachTimeSensor(coordinator, entry),
+        TyphoonWindSignalSensor(coordinator, entry),
+        TyphoonTimingSensor(coordinator, entry, "fetch", "Typhoon Fetch Time"),
+        TyphoonTimingSensor(coordinator, entry, "parse", "Typhoon Parse Time"),
+        TyphoonTimingSensor(coordinator, entry, "update", "Typhoon Update Time"),
     ]
-    async_add_entities(sensors, True)
-
-class TyphoonDataCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching Typhoon data."""
-
-    def __init__(self, hass, home_lat, home_lon, scan_interval, smart_polling=False, idle_poll_interval=480):
-        """Initialize."""
-        self.home_coords = (home_lat, home_lon)
-        self.smart_polling = smart_polling
-        self.scan_interval = scan_interval
-        self.idle_poll_interval = idle_poll_interval
-        self._unsub_schedule = None
-        
-        super().__init__(
-            hass,
-            _LOGGER,
-            name=DOMAIN,
-            update_interval=timedelta(minutes=scan_interval) if not smart_polling else None,
-        )
-
-    async def _async_update_data(self):
-        """Fetch data from API endpoint."""
-        _LOGGER.debug("Starting async_update for Typhoon Coordinator")
-        url = "https://www.pagasa.dost.gov.ph/tropical-cyclone/severe-weather-bulletin"
-        
-        session = async_get_clientsession(self.hass)
-        try:
-            async with async_timeout.timeout(10):
-                _LOGGER.debug("Requesting URL: %s", url)
-                async with session.get(url) as response:
-                    _LOGGER.debug("Response status: %s", response.status)
-                    if response.status == 200:
-                        html = await response.text()
-                        _LOGGER.debug("Response received, length: %d", len(html))
-                        soup = BeautifulSoup(html, 'html.parser')
-                        return self._parse_typhoon_data(soup)
-                    else:
-                        _LOGGER.warning("Failed to fetch data: %s", response.status)
-                        return self._get_empty_data()
-        except Exception as err:
-             _LOGGER.error("Error updating typhoon sensor: %s", err)
-             return self._get_empty_data()
-
-    def _get_empty_data(self):
-        return {
-            "name": "No typhoon detected",
-            "classification": "None",
-            "distance": None,
-            "details": "No active typhoon detected",
-            "image": None,
-            "movement": None,
-            "sustained_winds": None,
-            "gustiness": None,
-            "advisory_time": None,
-            "next_advisory_time": None,
-        }
-
-    def _parse_typhoon_data(self, soup):
-        """Parse the PAGASA HTML to extract typhoon data."""
-        _LOGGER.debug("Parsing typhoon data from HTML")
-        typhoons = []
-
-        # Find the relevant section containing typhoon information
-        typhoon_sections = soup.find_all("div", class_="tropical-cyclone-weather-bulletin-page")
-        _LOGGER.debug("Found %d typhoon sections", len(typhoon_sections))
-
-        if not typhoon_sections:
-            # Check for "No Active Tropical Cyclone"
-            no_active_tag = soup.find("h3", string=re.compile(r"No Active Tropical Cyclone", re.I))
-            if no_active_tag:
-                 _LOGGER.info("No active tropical cyclone detected. Scheduling idle poll.")
-                 self._schedule_next_refresh(None) # Schedule using idle_poll_interval
-        
-        for section in typhoon_sections:
-            # Extract typhoon name and classification
-            typhoon_name_tag = section.find("h3")
-            classification = "Unknown"
-            typhoon_name = "Unknown"
-            
-            if typhoon_name_tag:
-                full_text = typhoon_name_tag.get_text(strip=True)
-                if '"' in full_text:
-                    parts = full_text.split('"')
-                    if len(parts) >= 2:
-                        classification = parts[0].strip()
-                        typhoon_name = parts[1].strip()
-                    else:
-                        typhoon_name = full_text
-                else:
-                    typhoon_name = full_text
-            
-            # Extract details
-            details_tag = section.find("p")
-            details = details_tag.get_text(strip=True) if details_tag else "No details available"
-
-            # Helper to find panel text by heading
-            def get_panel_text(heading):
-                panels = section.find_all("div", class_="panel")
-                for panel in panels:
-                    head = panel.find("div", class_="panel-heading")
-                    if head and heading.lower() in head.get_text(strip=True).lower():
-                        body = panel.find("div", class_="panel-body")
-                        if body:
-                            return body.get_text(strip=True)
-                return None
-
-            image_url = None
-            img_tag = section.find("img", class_="img-responsive image-preview")
-            if img_tag and img_tag.get("src"):
-                src = img_tag.get("src")
-                if src.startswith("http"):
-                    image_url = src
+    sensors.extend(TyphoonPointDistanceSensor(coordinator, entry, zone) for zone in coordinator.zones)
+    async_add_entities(sensors)
+
+    # One extra sensor per active storm, added and removed as storms enter or leave the PAR
+    storm_entities = {}
+    storm_prefix = f"{entry.entry_id}_storm_"
+    registry = er.async_get(hass)
+    pruned = False
+
+    @callback
+    def _async_sync_storms():
+        nonlocal pruned
+        if not coordinator.last_update_success:
+            # No bulletin yet, don't mistake that for no storms
+            return
+        storms = coordinator.data.get("storms", {})
+        # Stale data, restored or kept after failed fetches, and the empty result
+        # once it expired don't tell which storms left, only add storms then
+        current = coordinator.stale_since is None and coordinator.fetch_error is None
+        if current and not pruned:
+            # Drop storms that left while Home Assistant was not running
+            for reg_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+                if reg_entry.unique_id.startswith(storm_prefix) and reg_entry.unique_id[len(storm_prefix):] not in storms:
+                    registry.async_remove(reg_entry.entity_id)
+            pruned = True
+        new_entities = []
+        for key in storms:
+            if key not in storm_entities:
+                storm_entities[key] = TyphoonStormSensor(coordinator, entry, key)
+                new_entities.append(storm_entities[key])
+        if new_entities:
+            async_add_entities(new_entities)
+
+        if not current:
+            return
+        for key in list(storm_entities):
+            if key not in storms:
+                entity = storm_entities.pop(key)
+                if entity.entity_id and registry.async_get(entity.entity_id):
+                    registry.async_remove(entity.entity_id)
                 else:
-                    image_url = f"https://pubfiles.pagasa.dost.gov.ph{src}" if src.startswith("/") else f"https://pubfiles.pagasa.dost.gov.ph/{src}"
-
-            movement = get_panel_text("Movement")
-            
-            strength_text = get_panel_text("Strength")
-            sustained_winds = None
-            gustiness = None
-            if strength_text:
-                sust_match = re.search(r"sustained winds of (\d+)", strength_text)
-                gust_match = re.search(r"gustiness of up to (\d+)", strength_text)
-                if sust_match: sustained_winds = int(sust_match.group(1))
-                if gust_match: gustiness = int(gust_match.group(1))
-
-            advisory_time = None
-            # Find Issued at ...
-            issued_tag = section.find("h5", style=lambda s: s and "margin-bottom" in s) # simple heuristic based on example
-            if not issued_tag:
-                # Fallback: search all h5
-                for h5 in section.find_all("h5"):
-                    if "Issued at" in h5.get_text():
-                        issued_tag = h5
-                        break
-            if issued_tag:
-                advisory_time = issued_tag.get_text(strip=True).replace("Issued at ", "")
-
-            next_advisory_time = None
-            # Find next advisory ...
-            next_tag = section.find("h5", style=lambda s: s and "margin-top" in s)
-            if not next_tag:
-                 for h5 in section.find_all("h5"):
-                    if "next advisory" in h5.get_text():
-                        next_tag = h5
-                        break
-            if next_tag:
-                 # Extract time from text like "(Valid ... issued at 11:00 PM today)"
-                 next_text = next_tag.get_text(strip=True)
-                 match = re.search(r"issued at ([\d:]+ [AP]M \w+)", next_text)
-                 if match:
-                     next_advisory_time = match.group(1)
-                 else:
-                     next_advisory_time = next_text
-
-            # Extract coordinates
-            lat, lon = None, None
-            match = re.search(r'\(\s*(\d+\.\d+)\s*°N,\s*(\d+\.\d+)\s*°E\s*\)', details)
-            if not match:
-                 # Try location panel
-                 loc_text = get_panel_text("Location of Eye/center")
-                 if loc_text:
-                     match = re.search(r'\(\s*(\d+\.\d+)\s*°N,\s*(\d+\.\d+)\s*°E\s*\)', loc_text)
-            
-            if match:
-                try:
-                    lat = float(match.group(1))
-                    lon = float(match.group(2))
-                except ValueError: pass
-
-            if lat is None or lon is None:
-                for line in details.split("\n"):
-                    if "Lat:" in line and "Lon:" in line:
-                        try:
-                            lat = float(line.split("Lat:")[1].split(",")[0].strip())
-                            lon = float(line.split("Lon:")[1].strip())
-                        except (ValueError, IndexError): continue
-
-            if lat is not None and lon is not None:
-                _LOGGER.debug("Adding typhoon: %s", typhoon_name)
-                typhoons.append({
-                    "name": typhoon_name,
-                    "classification": classification,
-                    "coordinates": (lat, lon),
-                    "details": details,
-                    "image": image_url,
-                    "movement": movement,
-                    "sustained_winds": sustained_winds,
-                    "gustiness": gustiness,
-                    "advisory_time": advisory_time,
-                    "next_advisory_time": next_advisory_time,
-                })
-
-        nearest_typhoon = None
-        nearest_distance = float("inf")
-        
-        for typhoon in typhoons:
-            distance = haversine(self.home_coords, typhoon["coordinates"])
-            if distance < nearest_distance:
-                nearest_distance = distance
-                nearest_typhoon = typhoon
-        
-        # Schedule next update if smart polling is enabled
-        if self.smart_polling and nearest_typhoon and nearest_typhoon["next_advisory_time"]:
-            self._schedule_next_refresh(nearest_typhoon["next_advisory_time"])
-            
-        if nearest_typhoon:
-            return {
-                "name": nearest_typhoon["name"],
-                "classification": nearest_typhoon["classification"],
-                "distance": nearest_distance,
-                "details": nearest_typhoon["details"],
-                "image": nearest_typhoon["image"],
-                "movement": nearest_typhoon["movement"],
-                "sustained_winds": nearest_typhoon["sustained_winds"],
-                "gustiness": nearest_typhoon["gustiness"],
-                "advisory_time": nearest_typhoon["advisory_time"],
-                "next_advisory_time": nearest_typhoon["next_advisory_time"],
-            }
-        
-        return self._get_empty_data()
-
-    def _parse_advisory_time(self, time_str):
-        """Parse advisory time string to datetime."""
-        if not time_str:
-            return None
-            
-        try:
-            # Expected format: "11:00 PM today" or "5:00 AM tomorrow"
-            match = re.search(r"([\d:]+ [AP]M) (\w+)", time_str)
-            if not match:
-                return None
-                
-            time_part = match.group(1)
-            day_part = match.group(2).lower()
-            
-            now = dt_util.now()
-            base_date = now.date()
-            if day_part == "tomorrow":
-                base_date += timedelta(days=1)
-                
-            time_obj = datetime.strptime(time_part, "%I:%M %p").time()
-            return dt_util.as_utc(datetime.combine(base_date, time_obj).replace(tzinfo=dt_util.DEFAULT_TIME_ZONE))
-        except Exception as e:
-            _LOGGER.error("Error parsing advisory time '%s': %s", time_str, e)
-            return None
-
-    def _schedule_next_refresh(self, next_advisory_str):
-        """Schedule next refresh based on advisory time or idle interval."""
-        if self._unsub_schedule:
-            self._unsub_schedule()
-            self._unsub_schedule = None
-
-        if next_advisory_str:
-            next_time = self._parse_advisory_time(next_advisory_str)
-            if next_time:
-                # Add 15 min buffer to ensure PAGASA has updated
-                target_time = next_time + timedelta(minutes=15)
-                # If target time is in the past, fall back to scan_interval
-                if target_time <= dt_util.now():
-                    target_time = dt_util.now() + timedelta(minutes=self.scan_interval)
-                    
-                _LOGGER.info("Smart polling: Scheduling next refresh for %s", target_time)
-                self._unsub_schedule = async_track_point_in_time(
-                    self.hass, self.async_request_refresh, target_time
-                )
-                return
-
-        # Fallback to idle_poll_interval or scan_interval
-        interval = self.idle_poll_interval if not next_advisory_str else self.scan_interval
-        target_time = dt_util.now() + timedelta(minutes=interval)
-        _LOGGER.info("Scheduling next refresh in %d minutes (%s)", interval, target_time)
-        self._unsub_schedule = async_track_point_in_time(
-            self.hass, self._async_refresh, target_time
-        )
-
-
-class TyphoonBaseSensor(CoordinatorEntity, Entity):
-    """Base class for Typhoon sensors."""
-    
-    def __init__(self, coordinator, entry):
-        super().__init__(coordinator)
-        self._coordinator = coordinator
-        self._entry = entry
-
-    @property
-    def available(self):
-        return self._coordinator.last_update_success
-
-    @property
-    def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": "Typhoon Sensor",
-            "manufacturer": "PAGASA",
-            "model": "Typhoon Monitor",
-            "entry_type": "service",
-        }
+                    hass.async_create_task(entity.async_remove(force_remove=True))
+
+    _async_sync_storms()
+    entry.async_on_unload(coordinator.async_add_listener(_async_sync_storms))
 
 class TyphoonNameSensor(TyphoonBaseSensor):
+    fields = ("name",)
+
     @property
     def name(self): return "Typhoon Name"
     @property
@@ -347,6 +100,8 @@ class TyphoonNameSensor(TyphoonBaseSensor):
     def icon(self): return "mdi:weather-hurricane"
 
 class TyphoonClassificationSensor(TyphoonBaseSensor):
+    fields = ("classification",)
+
     @property
     def name(self): return "Typhoon Classification"
     @property
@@ -357,6 +112,8 @@ class TyphoonClassificationSensor(TyphoonBaseSensor):
     def icon(self): return "mdi:alert-circle-outline"
 
 class TyphoonDistanceSensor(TyphoonBaseSensor):
+    fields = ("distance",)
+
     @property
     def name(self): return "Typhoon Distance"
     @property
@@ -371,6 +128,8 @@ class TyphoonDistanceSensor(TyphoonBaseSensor):
     def icon(self): return "mdi:map-marker-distance"
 
 class TyphoonDetailsSensor(TyphoonBaseSensor):
+    fields = ("details",)
+
     @property
     def name(self): return "Typhoon Details"
     @property
@@ -380,11 +139,13 @@ class TyphoonDetailsSensor(TyphoonBaseSensor):
         details = self._coordinator.data.get("details")
         return details[:255] if details else "No details"
     @property
-    def extra_state_attributes(self): return {"full_details": self._coordinator.data.get("details")}
+    def sensor_attributes(self): return {"full_details": self._coordinator.data.get("details")}
     @property
     def icon(self): return "mdi:text-box-outline"
 
 class TyphoonImageSensor(TyphoonBaseSensor):
+    fields = ("image", "advisory_time")
+
     @property
     def name(self): return "Typhoon Image"
     @property
@@ -392,11 +153,18 @@ class TyphoonImageSensor(TyphoonBaseSensor):
     @property
     def state(self): return self._coordinator.data.get("image")
     @property
-    def entity_picture(self): return self._coordinator.data.get("image")
+    def entity_picture(self):
+        # Served from the local cache when the track image entity is set up
+        track = self._coordinator.track_image
+        if track is not None and track.entity_id and track.available:
+            return track.entity_picture
+        return self._coordinator.data.get("image")
     @property
     def icon(self): return "mdi:image"
 
 class TyphoonMovementSensor(TyphoonBaseSensor):
+    fields = ("movement",)
+
     @property
     def name(self): return "Typhoon Movement"
     @property
@@ -407,6 +175,8 @@ class TyphoonMovementSensor(TyphoonBaseSensor):
     def icon(self): return "mdi:arrow-expand-all"
 
 class TyphoonSustainedWindsSensor(TyphoonBaseSensor):
+    fields = ("sustained_winds",)
+
     @property
     def name(self): return "Typhoon Maximum Sustained Winds"
     @property
@@ -419,6 +189,8 @@ class TyphoonSustainedWindsSensor(TyphoonBaseSensor):
     def icon(self): return "mdi:weather-windy"
 
 class TyphoonGustinessSensor(TyphoonBaseSensor):
+    fields = ("gustiness",)
+
     @property
     def name(self): return "Typhoon Gustiness"
     @property
@@ -430,22 +202,278 @@ class TyphoonGustinessSensor(TyphoonBaseSensor):
     @property
     def icon(self): return "mdi:weather-windy-variant"
 
-class TyphoonAdvisoryTimeSensor(TyphoonBaseSensor):
+class TyphoonAdvisoryTimeSensor(TyphoonBaseSensor, SensorEntity):
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    fields = ("advisory_at", "advisory_time")
+
     @property
     def name(self): return "Typhoon Advisory Time"
     @property
     def unique_id(self): return f"{self._entry.entry_id}_advisory_time"
     @property
-    def state(self): return self._coordinator.data.get("advisory_time")
+    def native_value(self): return self._coordinator.data.get("advisory_at")
+    @property
+    def sensor_attributes(self): return {"raw": self._coordinator.data.get("advisory_time")}
     @property
     def icon(self): return "mdi:clock-outline"
 
-class TyphoonNextAdvisoryTimeSensor(TyphoonBaseSensor):
+class TyphoonNextAdvisoryTimeSensor(TyphoonBaseSensor, SensorEntity):
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    fields = ("next_advisory_at", "next_advisory_time")
+
     @property
     def name(self): return "Typhoon Next Advisory Time"
     @property
     def unique_id(self): return f"{self._entry.entry_id}_next_advisory_time"
     @property
-    def state(self): return self._coordinator.data.get("next_advisory_time")
+    def native_value(self): return self._coordinator.data.get("next_advisory_at")
+    @property
+    def sensor_attributes(self): return {"raw": self._coordinator.data.get("next_advisory_time")}
     @property
     def icon(self): return "mdi:clock-time-four-outline"
+
+class TyphoonClosingSpeedSensor(TyphoonBaseSensor):
+    fields = ("closing_speed",)
+
+    @property
+    def name(self): return "Typhoon Closing Speed"
+    @property
+    def unique_id(self): return f"{self._entry.entry_id}_closing_speed"
+    @property
+    def state(self): return self._coordinator.data.get("closing_speed")
+    @property
+    def unit_of_measurement(self): return "km/h"
+    @property
+    def icon(self): return "mdi:arrow-collapse-horizontal"
+
+class TyphoonIntensificationRateSensor(TyphoonBaseSensor):
+    fields = ("intensification_rate",)
+
+    @property
+    def name(self): return "Typhoon Intensification Rate"
+    @property
+    def unique_id(self): return f"{self._entry.entry_id}_intensification_rate"
+    @property
+    def state(self): return self._coordinator.data.get("intensification_rate")
+    @property
+    def unit_of_measurement(self): return "km/h/d"
+    @property
+    def icon(self): return "mdi:trending-up"
+
+class TyphoonTimeToClosestApproachSensor(TyphoonBaseSensor):
+    fields = ("time_to_closest_approach", "closest_approach_distance")
+
+    @property
+    def name(self): return "Typhoon Time To Closest Approach"
+    @property
+    def unique_id(self): return f"{self._entry.entry_id}_time_to_closest_approach"
+    @property
+    def state(self): return self._coordinator.data.get("time_to_closest_approach")
+    @property
+    def unit_of_measurement(self): return "h"
+    @property
+    def sensor_attributes(self): return {"closest_approach_distance": self._coordinator.data.get("closest_approach_distance")}
+    @property
+    def icon(self): return "mdi:timer-sand"
+
+class TyphoonForecastClosestApproachSensor(TyphoonBaseSensor):
+    fields = ("forecast_closest_distance", "forecast_storm", "forecast_closest_lead", "forecast_cone_radius", "forecast_inside_cone")
+
+    @property
+    def name(self): return "Typhoon Forecast Closest Approach"
+    @property
+    def unique_id(self): return f"{self._entry.entry_id}_forecast_closest_approach"
+    @property
+    def state(self): return self._coordinator.data.get("forecast_closest_distance")
+    @property
+    def unit_of_measurement(self): return "km"
+    @property
+    def sensor_attributes(self):
+        return {
+            "storm_name": self._coordinator.data.get("forecast_storm"),
+            "lead_time": self._coordinator.data.get("forecast_closest_lead"),
+            "cone_radius": self._coordinator.data.get("forecast_cone_radius"),
+            "inside_cone": self._coordinator.data.get("forecast_inside_cone"),
+        }
+    @property
+    def icon(self): return "mdi:crosshairs-gps"
+
+class TyphoonForecastClosestApproachTimeSensor(TyphoonBaseSensor, SensorEntity):
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    fields = ("forecast_closest_time", "forecast_storm")
+
+    @property
+    def name(self): return "Typhoon Forecast Closest Approach Time"
+    @property
+    def unique_id(self): return f"{self._entry.entry_id}_forecast_closest_approach_time"
+    @property
+    def native_value(self):
+        timestamp = self._coordinator.data.get("forecast_closest_time")
+        return dt_util.utc_from_timestamp(timestamp) if timestamp is not None else None
+    @property
+    def sensor_attributes(self): return {"storm_name": self._coordinator.data.get("forecast_storm")}
+    @property
+    def icon(self): return "mdi:clock-alert-outline"
+
+class TyphoonWindSignalSensor(TyphoonBaseSensor):
+    fields = ("wind_signal", "wind_signal_partial", "wind_signal_storm")
+
+    @property
+    def name(self): return "Typhoon Wind Signal"
+    @property
+    def unique_id(self): return f"{self._entry.entry_id}_wind_signal"
+    @property
+    def state(self): return self._coordinator.data.get("wind_signal")
+    @property
+    def sensor_attributes(self):
+        province, town = self._coordinator.home_area
+        return {
+            "storm_name": self._coordinator.data.get("wind_signal_storm"),
+            "partial": self._coordinator.data.get("wind_signal_partial"),
+            "province": province,
+            "town": town,
+        }
+    @property
+    def icon(self): return "mdi:flag-variant"
+
+class TyphoonPointDistanceSensor(TyphoonBaseSensor):
+    """Distance from a point of interest (zone) to its nearest storm."""
+
+    fields = ("points",)
+
+    def __init__(self, coordinator, entry, zone):
+        super().__init__(coordinator, entry)
+        self._zone = zone
+        state = coordinator.hass.states.get(zone)
+        self._zone_name = state.name if state else zone.split(".", 1)[-1]
+        self._point = coordinator.data.get("points", {}).get(zone)
+
+    @property
+    def name(self): return f"Typhoon Distance {self._zone_name}"
+    @property
+    def unique_id(self): return f"{self._entry.entry_id}_point_{self._zone}"
+    @property
+    def state(self):
+        dist = self._coordinator.data.get("points", {}).get(self._zone, {}).get("distance")
+        return round(dist, 2) if dist is not None else None
+    @property
+    def unit_of_measurement(self): return "km"
+    @property
+    def sensor_attributes(self):
+        return {
+            "zone": self._zone,
+            "nearest_storm": self._coordinator.data.get("points", {}).get(self._zone, {}).get("storm"),
+        }
+    @property
+    def icon(self): return "mdi:map-marker-radius"
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write state when this zone's entry in points changed, not another zone's."""
+        point = self._coordinator.data.get("points", {}).get(self._zone)
+        if self._coordinator.changed_fields is not None and point == self._point:
+            return
+        self._point = point
+        super()._handle_coordinator_update()
+
+class TyphoonStormSensor(TyphoonBaseSensor):
+    """Distance to one active storm, with the storm's full data as attributes."""
+
+    def __init__(self, coordinator, entry, storm_key):
+        super().__init__(coordinator, entry)
+        self.storm_key = storm_key
+        self._storm = coordinator.data["storms"][storm_key]
+        self._storm_name = self._storm["name"]
+        self._stale_since = coordinator.stale_since
+
+    @property
+    def name(self): return f"Typhoon {self._storm_name}"
+    @property
+    def unique_id(self): return f"{self._entry.entry_id}_storm_{self.storm_key}"
+    @property
+    def state(self): return round(self._storm["distance"], 2)
+    @property
+    def unit_of_measurement(self): return "km"
+    @property
+    def icon(self): return "mdi:weather-hurricane"
+    @property
+    def sensor_attributes(self):
+        lat, lon = self._storm["coordinates"]
+        closest_time = self._storm["forecast_closest_time"]
+        return {
+            "storm_name": self._storm["name"],
+            "classification": self._storm["classification"],
+            "latitude": lat,
+            "longitude": lon,
+            "movement": self._storm["movement"],
+            "sustained_winds": self._storm["sustained_winds"],
+            "gustiness": self._storm["gustiness"],
+            "advisory_time": self._storm["advisory_at"].isoformat() if self._storm["advisory_at"] else self._storm["advisory_time"],
+            "next_advisory_time": self._storm["next_advisory_at"].isoformat() if self._storm["next_advisory_at"] else self._storm["next_advisory_time"],
+            "image": self._storm["image"],
+            "details": self._storm["details"],
+            "closing_speed": self._storm["closing_speed"],
+            "intensification_rate": self._storm["intensification_rate"],
+            "time_to_closest_approach": self._storm["time_to_closest_approach"],
+            "closest_approach_distance": self._storm["closest_approach_distance"],
+            "track_points": self._storm["track_points"],
+            "forecast_positions": [row[3] for row in self._storm.get("forecast") or ()],
+            "forecast": [
+                {
+                    "time": dt_util.utc_from_timestamp(timestamp).isoformat(),
+                    "latitude": lat,
+                    "longitude": lon,
+                    "position": text,
+                }
+                for timestamp, lat, lon, text in self._storm.get("forecast") or ()
+            ],
+            "forecast_closest_distance": self._storm["forecast_closest_distance"],
+            "forecast_closest_time": dt_util.utc_from_timestamp(closest_time).isoformat() if closest_time is not None else None,
+            "forecast_inside_cone": self._storm["forecast_inside_cone"],
+            "wind_signal": self._storm["wind_signal"],
+            "wind_signal_partial": self._storm["wind_signal_partial"],
+            "wind_signal_areas": self._storm.get("wind_signals") or [],
+            # Location, strength, movement and any other panel of the bulletin
+            "panels": self._storm.get("panels") or {},
+        }
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write state when this storm's data or its staleness changed."""
+        storm = self._coordinator.data.get("storms", {}).get(self.storm_key)
+        if storm is None or (storm == self._storm and self._coordinator.stale_since == self._stale_since):
+            return
+        self._storm = storm
+        self._stale_since = self._coordinator.stale_since
+        self.async_write_ha_state()
+
+class TyphoonTimingSensor(TyphoonBaseSensor):
+    """Latest duration of a refresh stage, with its rolling percentiles."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, coordinator, entry, stage, name):
+        super().__init__(coordinator, entry)
+        self._timings = coordinator.timing_stages[stage]
+        self._stage = stage
+        self._name = name
+        self.fields = (f"timing_{stage}",)
+
+    @property
+    def name(self): return self._name
+    @property
+    def unique_id(self): return f"{self._entry.entry_id}_timing_{self._stage}"
+    @property
+    def state(self):
+        last = self._timings.last(self._stage)
+        return round(last, 1) if last is not None else None
+    @property
+    def unit_of_measurement(self): return "ms"
+    @property
+    def sensor_attributes(self):
+        summary = self._timings.summary(self._stage)
+        summary.pop("histogram", None)
+        return summary
+    @property
+    def icon(self): return "mdi:timer-outline"
@@ -0,0 +1,70 @@
+"""Dedicated HTTP session for the PAGASA hosts."""
+from __future__ import annotations
+
+import aiohttp
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util.ssl import get_default_context
+
+from .const import (
+    DOMAIN,
+    DATA_SESSION,
+    DATA_SESSION_UNSUB,
+    SESSION_CONNECTIONS_PER_HOST,
+    SESSION_DNS_TTL,
+    SESSION_KEEPALIVE,
+)
+from .timing import trace_config
+
+
+def create_session(ssl=True, **connector_options) -> aiohttp.ClientSession:
+    """Create a session tuned for a few requests to the same two hosts.
+
+    The bulletin (www.pagasa.dost.gov.ph) and the track images
+    (pubfiles.pagasa.dost.gov.ph) are fetched in bursts: the page, its
+    retries and then the images. Its own connector keeps their connections
+    alive and their addresses cached within a burst, instead of sharing Home
+    Assistant's pool and its 10 s DNS cache. The DNS cache expires before
+    the next poll, so a host that moved is resolved again. Compressed
+    responses are negotiated and decoded by aiohttp. Timeouts are set per
+    request.
+    """
+    connector = aiohttp.TCPConnector(
+        limit_per_host=SESSION_CONNECTIONS_PER_HOST,
+        keepalive_timeout=SESSION_KEEPALIVE,
+        ttl_dns_cache=SESSION_DNS_TTL,
+        ssl=ssl,
+        **connector_options,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers={"User-Agent": SERVER_SOFTWARE},
+        trace_configs=[trace_config()],
+    )
+
+
+@callback
+def async_get_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the domain wide PAGASA session, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (session := domain_data.get(DATA_SESSION)) is None:
+        session = domain_data[DATA_SESSION] = create_session(get_default_context())
+
+        async def _async_close(_event):
+            domain_data.pop(DATA_SESSION, None)
+            domain_data.pop(DATA_SESSION_UNSUB, None)
+            await session.close()
+
+        domain_data[DATA_SESSION_UNSUB] = hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+    return session
+
+
+@callback
+def async_close_session(hass: HomeAssistant) -> None:
+    """Close the PAGASA session, once the last entry is unloaded."""
+    domain_data = hass.data.get(DOMAIN, {})
+    if (session := domain_data.pop(DATA_SESSION, None)) is not None:
+        domain_data.pop(DATA_SESSION_UNSUB)()
+        hass.async_create_task(session.close())
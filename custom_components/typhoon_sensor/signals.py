@@ -0,0 +1,126 @@
+"""Tropical Cyclone Wind Signal areas for the Typhoon Sensor integration."""
+from __future__ import annotations
+
+import re
+
+from .places import gazetteer, normalize
+
+SIGNAL_CLASS_PATTERN = re.compile(r"signalno(\d+)")
+PORTION_PATTERN = re.compile(r"^(?:the\s+)?(.+?)\s+portions?\s+of\s+(.+)$", re.I)
+REST_PATTERN = re.compile(r"^(?:the\s+)?(rest|remaining portion)\s+of\s+(.+)$", re.I)
+TOWNS_PATTERN = re.compile(r"\(([^)]*)\)")
+AND_PATTERN = re.compile(r"^and\s+", re.I)
+
+
+def _split_top_level(text: str) -> list[str]:
+    """Split on commas that are not inside parentheses."""
+    parts, depth, start = [], 0, 0
+    for index, char in enumerate(text):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append(text[start:index])
+            start = index + 1
+    parts.append(text[start:])
+    return [part.strip() for part in parts if part.strip()]
+
+
+def _strip_and(text: str) -> str:
+    return AND_PATTERN.sub("", text.strip())
+
+
+def parse_signal_areas(signal: int, text: str) -> list[dict]:
+    """Parse one "Affected Areas" list of a signal level.
+
+    Text looks like "Siquijor, the southern portion of Negros Oriental
+    (Dumaguete City, San Jose), and Camiguin". Every province becomes an
+    area with the portion ("southern") and municipalities listed for it;
+    items that are not provinces ("Cuyo, and Cagayancilo Islands" after an
+    "including") are attached to the preceding area.
+    """
+    provinces = gazetteer()[0]
+    areas = []
+    for item in _split_top_level(" ".join(text.split())):
+        item = _strip_and(item)
+        if item in ("", "-"):
+            continue
+        towns = []
+        if match := TOWNS_PATTERN.search(item):
+            towns = [_strip_and(town) for town in match.group(1).split(",") if town.strip()]
+            item = TOWNS_PATTERN.sub("", item).strip()
+        name, _, including = (part.strip() for part in item.partition(" including "))
+        portion = None
+        if match := REST_PATTERN.match(name):
+            # Whatever part of the province a higher signal did not cover
+            portion, name = "rest", match.group(2).strip()
+        elif match := PORTION_PATTERN.match(name):
+            portion, name = match.group(1).lower(), match.group(2).strip()
+
+        if normalize(name) not in provinces and areas:
+            areas[-1]["including"].append(item)
+            continue
+        areas.append({
+            "signal": signal,
+            "province": name,
+            "portion": portion,
+            "municipalities": towns,
+            "including": [including] if including else [],
+        })
+    return areas
+
+
+def parse_wind_signals(panel) -> list[dict]:
+    """Extract every signal level's areas from the Wind Signal panel (a bs4 tag)."""
+    areas = []
+    signal = None
+    for tag in panel.find_all(["th", "tbody"]):
+        if tag.name == "th":
+            match = SIGNAL_CLASS_PATTERN.search(" ".join(tag.get("class") or ()))
+            signal = int(match.group(1)) if match else None
+            continue
+        if signal is None:
+            continue
+        for row in tag.find_all("tr", recursive=False):
+            cells = row.find_all("td", recursive=False)
+            if len(cells) < 2 or "affected areas" not in cells[0].get_text(strip=True).lower():
+                continue
+            # One nested list per island group, whose items are the area lists
+            for group in cells[1].find_all("ul", recursive=True):
+                for item in group.find_all("li", recursive=False):
+                    if item.find("strong"):
+                        continue
+                    areas.extend(parse_signal_areas(signal, item.get_text(" ", strip=True)))
+        signal = None
+    return areas
+
+
+def signal_index(areas: list[dict]) -> dict[str, list[dict]]:
+    """Index signal areas by normalized province name."""
+    index = {}
+    for area in areas:
+        index.setdefault(normalize(area["province"]), []).append(area)
+    return index
+
+
+def home_signal(index: dict[str, list[dict]], province: str | None, town: str | None = None):
+    """Return (signal, partial) for home, (0, False) when no signal applies.
+
+    An area listed "in part" only counts for certain when home's town is
+    one of its municipalities; when the town is not known (or the area
+    also names islands the gazetteer can't place) the signal is still
+    reported with ``partial`` set, a known town that is not listed is not
+    affected. "The rest of" a province always applies.
+    """
+    best = (0, False)
+    for area in index.get(province, ()) if province else ():
+        partial = False
+        if area["portion"] not in (None, "rest") or area["municipalities"]:
+            if town is None or area["including"]:
+                partial = town not in {normalize(name) for name in area["municipalities"]}
+            elif town not in {normalize(name) for name in area["municipalities"]}:
+                continue
+        if (area["signal"], not partial) > (best[0], not best[1]):
+            best = (area["signal"], partial)
+    return best
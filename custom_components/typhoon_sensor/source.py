@@ -0,0 +1,405 @@
+"""Shared bulletin source for the Typhoon Sensor integration."""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import random
+import time
+from typing import Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    DATA_SOURCE,
+    BULLETIN_URL,
+    FETCH_CHUNK_SIZE,
+    SOURCE_MAX_AGE,
+    FETCH_TIMEOUT,
+    FETCH_CONNECT_TIMEOUT,
+    FETCH_READ_TIMEOUT,
+    FETCH_ATTEMPTS,
+    FETCH_RETRY_BACKOFF,
+    FETCH_BUDGET,
+    SNAPSHOT_STORAGE_KEY,
+    SNAPSHOT_STORAGE_VERSION,
+    SNAPSHOT_MAX_AGE,
+    SNAPSHOT_SAVE_DELAY,
+    TRACK_STORAGE_KEY,
+    TRACK_STORAGE_VERSION,
+    TRACK_RETENTION,
+)
+from .history import TrackHistory
+from .advisory_time import parse_issued_time
+from .parser import Bulletin, BulletinStreamParser, parse_bulletin_sections, storm_ids
+from .session import async_close_session, async_get_session
+from .timing import LoopLagMonitor, StageTimings
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FetchError(Exception):
+    """The bulletin could not be fetched."""
+
+    def __init__(self, message: str, retryable: bool = True) -> None:
+        """Initialize."""
+        super().__init__(message)
+        self.retryable = retryable
+
+
+@callback
+def async_get_source(hass: HomeAssistant) -> BulletinSource:
+    """Return the domain wide bulletin source, creating it for the first entry."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (source := domain_data.get(DATA_SOURCE)) is None:
+        source = domain_data[DATA_SOURCE] = BulletinSource(hass)
+    source.users += 1
+    return source
+
+
+@callback
+def async_apply_source_options(hass: HomeAssistant, source: BulletinSource, exclude: str | None = None) -> None:
+    """Configure the shared source from the entries that use it.
+
+    The fallback URL applies to every entry, the first entry that sets one
+    wins. Applied again whenever an entry is set up or unloaded, so a removed
+    option or entry doesn't leave its value behind.
+    """
+    entries = [
+        entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.disabled_by is None and entry.entry_id != exclude
+    ]
+    if not entries:
+        return
+    source.fallback_url = next(filter(None, (entry.options.get("fallback_url") for entry in entries)), None)
+
+
+class BulletinSource:
+    """Fetch and parse the PAGASA bulletin once per cycle for all config entries.
+
+    Every coordinator asks the source for the bulletin. Requests arriving
+    while a fetch is in flight wait for that fetch, and a bulletin fetched
+    less than SOURCE_MAX_AGE seconds ago is handed out as is, so N entries
+    (and their refresh buttons) cost one request and one parse.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.users = 0
+        self.url = BULLETIN_URL
+        # Optional mirror of the bulletin page, tried when PAGASA keeps failing
+        self.fallback_url: str | None = None
+        # Parsing is CPU bound, its own thread keeps it off the event loop.
+        # Fetches are shared, so there is never more than one parse to run,
+        # and the single thread feeds the chunks to the parser in order
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{DOMAIN}_parse")
+        self._fetch_task: asyncio.Task | None = None
+        self._fetched_at: float | None = None
+        # Conditional fetch state, lets unchanged bulletins skip the parse
+        self._etag = None
+        self._last_modified = None
+        self.bulletin: Bulletin | None = None
+        # Last good bulletin is kept on disk so setup doesn't wait on PAGASA
+        self._store = Store(hass, SNAPSHOT_STORAGE_VERSION, SNAPSHOT_STORAGE_KEY)
+        self._load_task: asyncio.Task | None = None
+        self.restored_at = None
+        self.fetched_utc = None
+        # Per storm ring buffers of past advisories, also kept on disk
+        self._tracks_store = Store(hass, TRACK_STORAGE_VERSION, TRACK_STORAGE_KEY)
+        self.tracks: dict[str, TrackHistory] = {}
+        self.refresh_stats = {}
+        # Rolling per-stage durations of the fetches, for diagnostics
+        self.timings = StageTimings()
+        self.fetch_stats = {
+            "requests": 0,
+            "fetches": 0,
+            "coalesced": 0,
+            "not_modified": 0,
+            "hash_hits": 0,
+            "full_parses": 0,
+            "bytes_received": 0,
+            "retries": 0,
+            "fallback_fetches": 0,
+            "failures": 0,
+        }
+
+    async def async_load_snapshot(self) -> Bulletin | None:
+        """Restore the last saved bulletin, only loaded once per source."""
+        if self._load_task is None:
+            self._load_task = self.hass.async_create_task(self._async_load_snapshot())
+        return await asyncio.shield(self._load_task)
+
+    async def _async_load_snapshot(self) -> Bulletin | None:
+        try:
+            tracks = await self._tracks_store.async_load()
+            if tracks and not self.tracks:
+                self.tracks = {
+                    key: TrackHistory.from_list(rows) for key, rows in tracks["tracks"].items()
+                }
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Could not load the track history: %s", err)
+
+        try:
+            data = await self._store.async_load()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Could not load the bulletin snapshot: %s", err)
+            return None
+        if not data or self.bulletin is not None:
+            return self.bulletin
+
+        try:
+            saved_at = dt_util.parse_datetime(data["saved_at"])
+            if saved_at is None or dt_util.utcnow() - saved_at > SNAPSHOT_MAX_AGE:
+                _LOGGER.debug("Bulletin snapshot from %s is too old, ignoring it", data["saved_at"])
+                return None
+            bulletin = Bulletin.from_dict(data["bulletin"])
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Ignoring invalid bulletin snapshot: %s", err)
+            return None
+
+        _LOGGER.debug("Restored bulletin snapshot saved at %s", saved_at)
+        self.bulletin = bulletin
+        self.restored_at = self.fetched_utc = saved_at
+        # Validators still apply, the background refresh is usually a 304
+        self._etag = data.get("etag")
+        self._last_modified = data.get("last_modified")
+        return bulletin
+
+    @callback
+    def _async_save_snapshot(self) -> None:
+        """Save the current bulletin, writes are batched by the store."""
+        self._store.async_delay_save(self._snapshot_data, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _snapshot_data(self) -> dict:
+        return {
+            "saved_at": self.fetched_utc.isoformat(),
+            "etag": self._etag,
+            "last_modified": self._last_modified,
+            "bulletin": self.bulletin.as_dict(),
+        }
+
+    @callback
+    def _async_update_tracks(self) -> None:
+        """Record the advisory of every storm that has a new one."""
+        now = self.fetched_utc.timestamp()
+        changed = False
+        active = set()
+        for key, typhoon in zip(storm_ids(self.bulletin.typhoons), self.bulletin.typhoons):
+            issued = parse_issued_time(typhoon["advisory_time"])
+            active.add(key)
+            track = self.tracks.setdefault(key, TrackHistory())
+            lat, lon = typhoon["coordinates"]
+            changed |= track.append(
+                issued.timestamp() if issued else now,
+                lat,
+                lon,
+                typhoon["sustained_winds"],
+                typhoon["gustiness"],
+            )
+
+        # Forget storms that left the bulletin a while ago
+        cutoff = now - TRACK_RETENTION.total_seconds()
+        for key in [
+            key for key, track in self.tracks.items()
+            if key not in active and (not track.last_timestamp or track.last_timestamp < cutoff)
+        ]:
+            del self.tracks[key]
+            changed = True
+
+        if changed:
+            self._tracks_store.async_delay_save(
+                lambda: {"tracks": {key: track.as_list() for key, track in self.tracks.items()}},
+                SNAPSHOT_SAVE_DELAY,
+            )
+
+    async def async_get_bulletin(self) -> Bulletin:
+        """Return the current bulletin, fetching it if it is stale."""
+        self.fetch_stats["requests"] += 1
+        if self._fetch_task is None:
+            if (
+                self.bulletin is not None
+                and self._fetched_at is not None
+                and time.monotonic() - self._fetched_at < SOURCE_MAX_AGE
+            ):
+                self.fetch_stats["coalesced"] += 1
+                return self.bulletin
+            self._fetch_task = self.hass.async_create_task(self._async_fetch())
+            self._fetch_task.add_done_callback(self._fetch_done)
+        else:
+            self.fetch_stats["coalesced"] += 1
+
+        # Shielded so one caller being cancelled doesn't abort the shared fetch
+        return await asyncio.shield(self._fetch_task)
+
+    @callback
+    def _fetch_done(self, task: asyncio.Task) -> None:
+        self._fetch_task = None
+
+    @callback
+    def async_expire(self) -> None:
+        """Make the next request fetch, used for manual refreshes."""
+        self._fetched_at = None
+
+    @callback
+    def async_release(self) -> None:
+        """Drop a user, tearing the source down after the last one."""
+        self.users -= 1
+        if self.users > 0:
+            return
+        self.hass.data[DOMAIN].pop(DATA_SOURCE, None)
+        if self._fetch_task:
+            self._fetch_task.cancel()
+        async_close_session(self.hass)
+        self._executor.shutdown(wait=False)
+
+    async def _async_fetch(self) -> Bulletin:
+        """Fetch and parse the bulletin, retrying and falling back to the mirror.
+
+        Every attempt gets FETCH_TIMEOUT seconds. Failed attempts are retried
+        after an exponential, jittered delay, then the fallback URL gets the
+        same. No attempt is started that could end past FETCH_BUDGET seconds,
+        and with a fallback URL the retries stop early enough to leave it one
+        attempt.
+        """
+        deadline = time.monotonic() + FETCH_BUDGET
+        error = None
+        for url in filter(None, (self.url, self.fallback_url)):
+            reserve = FETCH_TIMEOUT if url == self.url and self.fallback_url else 0
+            for attempt in range(FETCH_ATTEMPTS):
+                delay = FETCH_RETRY_BACKOFF * 2 ** (attempt - 1) * random.uniform(1, 1.5) if attempt else 0
+                if time.monotonic() + delay + FETCH_TIMEOUT + reserve > deadline:
+                    break
+                if attempt:
+                    _LOGGER.debug("Retrying %s in %.1f s after: %s", url, delay, error)
+                    self.fetch_stats["retries"] += 1
+                    await asyncio.sleep(delay)
+                elif url != self.url:
+                    _LOGGER.warning("Fetching the bulletin failed (%s), trying %s", error, url)
+                try:
+                    bulletin = await self._async_fetch_url(url)
+                except (asyncio.TimeoutError, aiohttp.ClientError, FetchError) as err:
+                    error = str(err) or type(err).__name__
+                    retryable = not isinstance(err, FetchError) or err.retryable
+                    if not retryable:
+                        break
+                    continue
+                if url != self.url:
+                    self.fetch_stats["fallback_fetches"] += 1
+                return bulletin
+
+        self.fetch_stats["failures"] += 1
+        raise FetchError(f"Failed to fetch data: {error}")
+
+    async def _async_fetch_url(self, url: str) -> Bulletin:
+        """Fetch and parse the bulletin from one URL, once."""
+        _LOGGER.debug("Fetching the severe weather bulletin")
+        headers = {}
+        if self.bulletin is not None:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+
+        session = async_get_session(self.hass)
+        loop = self.hass.loop
+        lag_monitor = LoopLagMonitor(loop)
+        lag_monitor.start()
+        fetch_start = time.perf_counter()
+        parse_time = 0.0
+        try:
+            _LOGGER.debug("Requesting URL: %s", url)
+            self.fetch_stats["fetches"] += 1
+            # A slow connect and a stalled body fail fast, the total still bounds the attempt
+            timeout = aiohttp.ClientTimeout(
+                total=FETCH_TIMEOUT, sock_connect=FETCH_CONNECT_TIMEOUT, sock_read=FETCH_READ_TIMEOUT
+            )
+            async with session.get(url, headers=headers, timeout=timeout, trace_request_ctx=self.timings) as response:
+                _LOGGER.debug("Response status: %s", response.status)
+                if response.status == 304 and self.bulletin is not None:
+                    _LOGGER.debug("Bulletin not modified, reusing last result")
+                    self.fetch_stats["not_modified"] += 1
+                    self._fetched_at = time.monotonic()
+                    self.fetched_utc = dt_util.utcnow()
+                    self._async_save_snapshot()
+                    return self.bulletin
+                if response.status != 200:
+                    raise FetchError(
+                        f"HTTP {response.status}",
+                        retryable=response.status >= 500 or response.status == 429,
+                    )
+
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+
+                # Scan the body as it streams in, only the bulletin sections are kept.
+                # Chunks are queued to the parse thread without waiting for it,
+                # so reading the next chunk doesn't wait for the last one's parse
+                parser = BulletinStreamParser(response.charset or "utf-8")
+                feeds = []
+                length = 0
+                body_start = time.perf_counter()
+                async for chunk in response.content.iter_chunked(FETCH_CHUNK_SIZE):
+                    length += len(chunk)
+                    feeds.append(self._executor.submit(_timed, parser.feed_bytes, chunk))
+                self.timings.record("body", time.perf_counter() - body_start)
+                self.fetch_stats["bytes_received"] += length
+                _LOGGER.debug("Response received, length: %d", length)
+
+            previous_digest = self.bulletin.digest if self.bulletin is not None else None
+            (digest, typhoons), parse_time = await loop.run_in_executor(
+                self._executor, _timed, self._parse_sections, parser, previous_digest
+            )
+            # Queued before the sections were parsed, so they are done by now
+            parse_time += sum(feed.result()[1] for feed in feeds)
+        finally:
+            self.timings.record("fetch", time.perf_counter() - fetch_start)
+            if parse_time:
+                self.timings.record("parse", parse_time)
+            self.refresh_stats = {
+                "parse_ms": round(parse_time * 1000, 2),
+                "max_loop_lag_ms": round(lag_monitor.stop() * 1000, 2),
+            }
+            _LOGGER.debug("Refresh stats: %s", self.refresh_stats)
+
+        self._etag = etag
+        self._last_modified = last_modified
+        self._fetched_at = time.monotonic()
+        self.fetched_utc = dt_util.utcnow()
+        if typhoons is None:
+            _LOGGER.debug("Bulletin sections unchanged, reusing last result")
+            self.fetch_stats["hash_hits"] += 1
+        else:
+            self.fetch_stats["full_parses"] += 1
+            self.bulletin = Bulletin(typhoons, parser.no_active, digest)
+            self._async_update_tracks()
+
+        self._async_save_snapshot()
+        return self.bulletin
+
+    @staticmethod
+    def _parse_sections(parser, previous_digest):
+        """Finish the stream and extract the typhoons, runs in the parse thread.
+
+        Extraction is skipped (None is returned) when the sections hash the
+        same as the previously parsed bulletin.
+        """
+        parser.close()
+        digest = parser.digest()
+        if digest == previous_digest:
+            return digest, None
+        return digest, parse_bulletin_sections(parser.sections)
+
+
+def _timed(func, *args) -> tuple[Any, float]:
+    """Call func, return its result and how long it took."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
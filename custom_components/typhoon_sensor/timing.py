@@ -0,0 +1,170 @@
+"""Timing instrumentation for the Typhoon Sensor integration."""
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+import time
+
+import aiohttp
+
+from .const import TIMING_BUCKETS, TIMING_WINDOW
+
+DEFAULT_LAG_INTERVAL = 0.01
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop runs a periodic callback.
+
+    While running, a callback is scheduled every ``interval`` seconds. The
+    difference between when it was due and when it actually ran is the time
+    the loop was blocked by something else, e.g. a synchronous parse.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, interval: float = DEFAULT_LAG_INTERVAL) -> None:
+        """Initialize."""
+        self._loop = loop
+        self._interval = interval
+        self._handle: asyncio.TimerHandle | None = None
+        self._due = 0.0
+        self.max_lag = 0.0
+
+    def start(self) -> None:
+        """Start sampling the loop lag."""
+        self.max_lag = 0.0
+        self._schedule()
+
+    def stop(self) -> float:
+        """Stop sampling and return the maximum lag seen, in seconds."""
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+        return self.max_lag
+
+    def _schedule(self) -> None:
+        self._due = self._loop.time() + self._interval
+        self._handle = self._loop.call_at(self._due, self._tick)
+
+    def _tick(self) -> None:
+        self.max_lag = max(self.max_lag, self._loop.time() - self._due)
+        self._schedule()
+
+
+class RollingHistogram:
+    """The last TIMING_WINDOW durations of one stage.
+
+    Recording is a deque append, the percentiles and bucket counts are only
+    computed when a summary is asked for.
+    """
+
+    __slots__ = ("_samples", "count")
+
+    def __init__(self, window: int = TIMING_WINDOW) -> None:
+        """Initialize."""
+        self._samples: deque[float] = deque(maxlen=window)
+        self.count = 0
+
+    def add(self, seconds: float) -> None:
+        """Record one duration."""
+        self._samples.append(seconds * 1000)
+        self.count += 1
+
+    @property
+    def last(self) -> float | None:
+        """Return the latest duration in ms."""
+        return self._samples[-1] if self._samples else None
+
+    def summary(self) -> dict:
+        """Return count, last, percentiles and bucket counts, in ms."""
+        samples = sorted(self._samples)
+        if not samples:
+            return {"count": 0}
+        buckets = [0] * (len(TIMING_BUCKETS) + 1)
+        for sample in samples:
+            buckets[bisect_left(TIMING_BUCKETS, sample)] += 1
+
+        def percentile(q):
+            return round(samples[min(len(samples) - 1, int(q * len(samples)))], 2)
+
+        return {
+            "count": self.count,
+            "last_ms": round(self._samples[-1], 2),
+            "p50_ms": percentile(0.5),
+            "p90_ms": percentile(0.9),
+            "p99_ms": percentile(0.99),
+            "max_ms": round(samples[-1], 2),
+            "histogram": {
+                f"<={bound}" if bound is not None else f">{TIMING_BUCKETS[-1]}": count
+                for bound, count in zip((*TIMING_BUCKETS, None), buckets)
+            },
+        }
+
+
+class StageTimings:
+    """Rolling histograms of the stages of a refresh, cheap enough to stay on."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.stages: dict[str, RollingHistogram] = {}
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Record the duration of a stage."""
+        if (histogram := self.stages.get(stage)) is None:
+            histogram = self.stages[stage] = RollingHistogram()
+        histogram.add(seconds)
+
+    @contextmanager
+    def time(self, stage: str):
+        """Time the body of a with block as a stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def last(self, stage: str) -> float | None:
+        """Return the latest duration of a stage in ms."""
+        histogram = self.stages.get(stage)
+        return histogram.last if histogram else None
+
+    def summary(self, stage: str) -> dict:
+        """Return the summary of one stage."""
+        histogram = self.stages.get(stage)
+        return histogram.summary() if histogram else {"count": 0}
+
+    def as_dict(self) -> dict:
+        """Return the summary of every stage, for diagnostics."""
+        return {stage: histogram.summary() for stage, histogram in self.stages.items()}
+
+
+def trace_config() -> aiohttp.TraceConfig:
+    """Return an aiohttp trace that records DNS, connect and time to first byte.
+
+    The durations are recorded into the StageTimings passed as the
+    request's ``trace_request_ctx``, requests without one are not timed.
+    DNS and connect are only seen when the session opens a new connection,
+    reused keep-alive connections skip them.
+    """
+
+    def _start(stage):
+        async def handler(_session, context, _params):
+            setattr(context, stage, time.perf_counter())
+        return handler
+
+    def _end(stage):
+        async def handler(_session, context, _params):
+            timings = context.trace_request_ctx
+            if timings is not None and (start := getattr(context, stage, None)) is not None:
+                timings.record(stage, time.perf_counter() - start)
+        return handler
+
+    config = aiohttp.TraceConfig()
+    config.on_dns_resolvehost_start.append(_start("dns"))
+    config.on_dns_resolvehost_end.append(_end("dns"))
+    config.on_connection_create_start.append(_start("connect"))
+    config.on_connection_create_end.append(_end("connect"))
+    config.on_request_start.append(_start("ttfb"))
+    # Fired once the response headers are in
+    config.on_request_end.append(_end("ttfb"))
+    return config
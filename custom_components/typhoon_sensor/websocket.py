@@ -0,0 +1,63 @@
+"""Websocket subscription to the storm change feed."""
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import DOMAIN, DATA_WEBSOCKET, EVENT_STORM_UPDATE
+from .coordinator import TyphoonDataCoordinator
+
+
+@callback
+def async_register_websocket(hass: HomeAssistant) -> None:
+    """Register the websocket commands, once for all entries."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if domain_data.get(DATA_WEBSOCKET):
+        return
+    domain_data[DATA_WEBSOCKET] = True
+    websocket_api.async_register_command(hass, websocket_subscribe_changes)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe_changes",
+        vol.Optional("entry_id"): str,
+    }
+)
+@callback
+def websocket_subscribe_changes(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Send the storms of every entry (or one), then only their changes.
+
+    The first message per entry is a ``snapshot`` with the storms as the
+    changes that follow describe them, then every refresh that changed
+    something sends ``changes``, the payload of the storm update event.
+    """
+    coordinators = {
+        entry_id: coordinator
+        for entry_id, coordinator in hass.data.get(DOMAIN, {}).items()
+        if isinstance(coordinator, TyphoonDataCoordinator)
+    }
+    entry_id = msg.get("entry_id")
+    if entry_id is not None:
+        if entry_id not in coordinators:
+            connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Config entry not found")
+            return
+        coordinators = {entry_id: coordinators[entry_id]}
+
+    @callback
+    def _forward(event: Event) -> None:
+        if entry_id is None or event.data.get("entry_id") == entry_id:
+            connection.send_message(websocket_api.event_message(msg["id"], {"type": "changes", **event.data}))
+
+    connection.subscriptions[msg["id"]] = hass.bus.async_listen(EVENT_STORM_UPDATE, _forward)
+    connection.send_result(msg["id"])
+    for coordinator_entry_id, coordinator in coordinators.items():
+        connection.send_message(
+            websocket_api.event_message(
+                msg["id"], {"type": "snapshot", "entry_id": coordinator_entry_id, **coordinator.changes.snapshot()}
+            )
+        )
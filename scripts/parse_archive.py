@@ -0,0 +1,145 @@
+"""Parse a directory of archived bulletins into JSONL or Parquet.
+
+Every bulletin page (``*.htm*`` by default) found under the given paths
+is parsed in a pool of worker processes, one row per storm and bulletin
+(see ROW_FIELDS in archive.py). Rows are written as they come in, in file
+order, so large archives don't have to fit in memory. Throughput is
+reported on stderr at the end.
+
+    python scripts/parse_archive.py archive/ -o season.jsonl
+    python scripts/parse_archive.py archive/ -o season.parquet --format parquet --home 14.6,121.0
+
+Needs the integration's requirements (beautifulsoup4, numpy) but not Home
+Assistant. Parquet output also needs pyarrow.
+"""
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import json
+import os
+from pathlib import Path
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# The package only imports Home Assistant when an entry is set up
+from custom_components.typhoon_sensor import archive, places  # noqa: E402
+
+PARQUET_TYPES = {"string": "string", "bool": "bool_", "int": "int64", "float": "float64"}
+
+
+def find_files(paths: list[str], pattern: str) -> list[Path]:
+    """Return the bulletin files under the given files and directories, sorted."""
+    files = []
+    for path in map(Path, paths):
+        files.extend(sorted(path.rglob(pattern)) if path.is_dir() else [path])
+    return files
+
+
+def parse_one(path: Path, home, home_area) -> tuple[str, list[dict] | None, str | None]:
+    """Parse one file in a worker, returning the error instead of raising it."""
+    try:
+        return str(path), archive.parse_file(path, home, home_area), None
+    except Exception as err:  # pylint: disable=broad-except
+        return str(path), None, f"{type(err).__name__}: {err}"
+
+
+class JsonlWriter:
+    """Write one JSON object per line."""
+
+    def __init__(self, output: str) -> None:
+        self._file = sys.stdout if output == "-" else open(output, "w", encoding="utf-8")
+
+    def write(self, rows: list[dict]) -> None:
+        for row in rows:
+            self._file.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+    def close(self) -> None:
+        if self._file is not sys.stdout:
+            self._file.close()
+
+
+class ParquetWriter:
+    """Write the rows in Parquet row groups of ``batch_size`` rows."""
+
+    def __init__(self, output: str, batch_size: int) -> None:
+        try:
+            import pyarrow as pa  # pylint: disable=import-outside-toplevel
+            import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            sys.exit("Parquet output needs pyarrow: pip install pyarrow")
+        if output == "-":
+            sys.exit("Parquet output needs a file, pass -o")
+        self._pa = pa
+        self._schema = pa.schema(
+            [(name, getattr(pa, PARQUET_TYPES[kind])()) for name, kind in archive.ROW_FIELDS.items()]
+        )
+        self._writer = pq.ParquetWriter(output, self._schema)
+        self._batch_size = batch_size
+        self._rows: list[dict] = []
+
+    def write(self, rows: list[dict]) -> None:
+        self._rows.extend(rows)
+        if len(self._rows) >= self._batch_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._rows:
+            self._writer.write_table(self._pa.Table.from_pylist(self._rows, schema=self._schema))
+            self._rows = []
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("paths", nargs="+", help="bulletin files or directories")
+    parser.add_argument("-o", "--output", default="-", help="output file, stdout by default (JSONL only)")
+    parser.add_argument("--format", choices=("jsonl", "parquet"), help="default: from the output extension, else jsonl")
+    parser.add_argument("--pattern", default="*.htm*", help="file name pattern inside directories")
+    parser.add_argument("--home", help="LAT,LON to add distances, the home wind signal and the forecast closest approach")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes (default: one per core)")
+    parser.add_argument("--batch-size", type=int, default=10000, help="rows per Parquet row group")
+    args = parser.parse_args()
+
+    files = find_files(args.paths, args.pattern)
+    if not files:
+        sys.exit("No bulletin files found")
+    home = tuple(float(value) for value in args.home.split(",")) if args.home else None
+    home_area = places.locate(*home) if home else (None, None)
+
+    output_format = args.format or ("parquet" if args.output.endswith(".parquet") else "jsonl")
+    writer = ParquetWriter(args.output, args.batch_size) if output_format == "parquet" else JsonlWriter(args.output)
+
+    start = time.perf_counter()
+    rows = failures = 0
+    workers = max(1, min(args.workers or 1, len(files)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Batches of files per task keep the inter-process overhead small
+        chunksize = max(1, min(64, len(files) // (workers * 4)))
+        for path, file_rows, error in executor.map(
+            partial(parse_one, home=home, home_area=home_area), files, chunksize=chunksize
+        ):
+            if error is not None:
+                failures += 1
+                print(f"{path}: {error}", file=sys.stderr)
+                continue
+            writer.write(file_rows)
+            rows += len(file_rows)
+    writer.close()
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"Parsed {len(files) - failures} of {len(files)} files ({rows} rows) in {elapsed:.2f} s, "
+        f"{len(files) / elapsed:.1f} files/s with {workers} worker(s)",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
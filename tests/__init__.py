@@ -0,0 +1 @@
+"""Tests for the Typhoon Sensor integration."""
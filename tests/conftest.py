@@ -0,0 +1,30 @@
+"""Fixtures for the Typhoon Sensor tests.
+
+Run with ``pip install -r requirements_test.txt`` and ``pytest``. Tests
+that need Home Assistant use the ``hass`` fixture of
+pytest-homeassistant-custom-component, the HA-free modules are tested
+without it.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = {
+    "advisory": ROOT / "severe-weather-bulletin.html",
+    "no_advisory": ROOT / "severe-weather-bulletin_noadvisory.html",
+}
+
+
+@pytest.fixture
+def advisory_html() -> bytes:
+    """Return the bundled bulletin with an active storm."""
+    return FIXTURES["advisory"].read_bytes()
+
+
+@pytest.fixture
+def no_advisory_html() -> bytes:
+    """Return the bundled bulletin without active storms."""
+    return FIXTURES["no_advisory"].read_bytes()
@@ -0,0 +1,104 @@
+"""Tests for the advisory time parser."""
+from __future__ import annotations
+
+from datetime import date, datetime
+import re
+
+import pytest
+
+from custom_components.typhoon_sensor import advisory_time
+from custom_components.typhoon_sensor.advisory_time import MANILA_TZ, _parse, parse_advisory_time
+
+# The Manila date relative phrases are resolved against
+REFERENCE = date(2026, 2, 5)
+
+
+def manila(*args) -> datetime:
+    return datetime(*args, tzinfo=MANILA_TZ)
+
+
+# The issued time, the next advisory and the forecast times of severe-weather-bulletin.html
+FIXTURE_PHRASES = [
+    ("08:00 pm, 05 February 2026", manila(2026, 2, 5, 20, 0)),
+    ("11:00 PM today", manila(2026, 2, 5, 23, 0)),
+    ("Feb 06, 2026 05:00 AM", manila(2026, 2, 6, 5, 0)),
+    ("Feb 06, 2026 05:00 PM", manila(2026, 2, 6, 17, 0)),
+    ("Feb 07, 2026 05:00 AM", manila(2026, 2, 7, 5, 0)),
+    ("Feb 07, 2026 05:00 PM", manila(2026, 2, 7, 17, 0)),
+    ("Feb 08, 2026 05:00 AM", manila(2026, 2, 8, 5, 0)),
+    ("Feb 08, 2026 05:00 PM", manila(2026, 2, 8, 17, 0)),
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty memo."""
+    advisory_time._parse.cache_clear()
+
+
+@pytest.mark.parametrize(
+    ("phrase", "expected"),
+    [
+        ("08:00 pm, 05 February 2026", manila(2026, 2, 5, 20, 0)),
+        ("Issued at 5:00 PM, 17 October 2026", manila(2026, 10, 17, 17, 0)),
+        ("Issued at 11:00 AM, 1 January 2027", manila(2027, 1, 1, 11, 0)),
+        ("Feb 06, 2026 05:00 AM", manila(2026, 2, 6, 5, 0)),
+        ("Sept 30, 2026 11:00 PM", manila(2026, 9, 30, 23, 0)),
+        ("12:00 NN, 06 February 2026", manila(2026, 2, 6, 12, 0)),
+        ("12:00 MN, 06 February 2026", manila(2026, 2, 6, 0, 0)),
+        ("11:00 PM today", manila(2026, 2, 5, 23, 0)),
+        ("5:00 AM tomorrow", manila(2026, 2, 6, 5, 0)),
+        ("5 a.m. tomorrow", manila(2026, 2, 6, 5, 0)),
+        ("11:00 PM yesterday", manila(2026, 2, 4, 23, 0)),
+        (
+            "(Valid for broadcast until the next advisory to be issued at 11:00 PM today)",
+            manila(2026, 2, 5, 23, 0),
+        ),
+        ("11:00 PM", manila(2026, 2, 5, 23, 0)),
+        ("No time here", None),
+        ("13:00 PM today", None),
+        ("11:00 PM, 30 February 2026", None),
+    ],
+)
+def test_parse(phrase: str, expected: datetime | None) -> None:
+    """Every phrasing resolves to the Manila time it means."""
+    result = _parse(phrase, REFERENCE)
+    assert result == expected
+    if result is not None:
+        assert result.tzinfo is MANILA_TZ
+
+
+@pytest.mark.parametrize(("phrase", "expected"), FIXTURE_PHRASES)
+def test_parse_fixture_phrases(phrase: str, expected: datetime, advisory_html: bytes) -> None:
+    """The time phrases of the bundled bulletin parse."""
+    assert phrase in advisory_html.decode("utf-8")
+    assert _parse(phrase, REFERENCE) == expected
+
+
+def test_fixture_phrases_covered(advisory_html: bytes) -> None:
+    """FIXTURE_PHRASES has every time phrase of the bundled bulletin."""
+    html = advisory_html.decode("utf-8")
+    phrases = set(re.findall(r"Issued at ([^<]+)</h5>", html))
+    phrases |= set(re.findall(r"issued at ([\d:]+ [AP]M \w+)\)", html))
+    phrases |= set(re.findall(r"<li>\s*([A-Z][a-z]{2} \d{2}, \d{4} \d{2}:\d{2} [AP]M)", html))
+    assert phrases == {phrase for phrase, _ in FIXTURE_PHRASES}
+
+
+def test_relative_phrase_without_reference() -> None:
+    """Relative phrases need a reference day."""
+    assert _parse("11:00 PM today", None) is None
+    assert _parse("08:00 pm, 05 February 2026", None) == manila(2026, 2, 5, 20, 0)
+
+
+def test_reference_in_manila() -> None:
+    """The reference is taken as a Manila date, also when given in UTC."""
+    # 17:00 UTC is already the next day in Manila
+    utc = datetime.fromisoformat("2026-02-05T17:00:00+00:00")
+    assert parse_advisory_time("5:00 AM tomorrow", utc) == manila(2026, 2, 7, 5, 0)
+
+
+def test_whitespace_is_normalized() -> None:
+    """Line breaks and repeated spaces of the page don't matter, and share the memo."""
+    assert parse_advisory_time("11:00\n   PM   today", manila(2026, 2, 5, 20, 0)) == manila(2026, 2, 5, 23, 0)
+    parse_advisory_time("11:00 PM today", manila(2026, 2, 5, 20, 0))
+    assert advisory_time._parse.cache_info().hits == 1
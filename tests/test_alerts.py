@@ -0,0 +1,172 @@
+"""Tests for the threshold alerts."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.typhoon_sensor.alerts import AlertEngine, AlertRule, build_rules, classification_rank
+from custom_components.typhoon_sensor.const import (
+    ALERT_DISTANCE_HYSTERESIS,
+    ALERT_MIN_HOLD,
+    ALERT_WIND_HYSTERESIS,
+)
+
+START = 1_770_000_000.0
+DISTANCE = AlertRule("distance", 300)
+WIND = AlertRule("wind", 118)
+
+
+def storm(distance: float | None = 500.0, winds: int | None = 75, classification: str = "Tropical Storm") -> dict:
+    return {"name": "Basyang", "distance": distance, "sustained_winds": winds, "classification": classification}
+
+
+@pytest.fixture
+def engine() -> AlertEngine:
+    """An engine past its baseline, with Basyang outside every threshold."""
+    engine = AlertEngine([DISTANCE, WIND, AlertRule("classification")])
+    assert engine.evaluate({"basyang": storm()}, START) == []
+    return engine
+
+
+def test_build_rules() -> None:
+    """Rules come from the options, invalid thresholds are skipped."""
+    rules = build_rules({"alert_distances": ["300", "x"], "alert_winds": [118], "alert_classification": True})
+    assert rules == [AlertRule("distance", 300), AlertRule("wind", 118), AlertRule("classification")]
+    assert [rule.id for rule in rules] == ["distance_300", "wind_118", "classification"]
+
+
+def test_classification_rank() -> None:
+    assert classification_rank("Typhoon") > classification_rank(" tropical storm ")
+    assert classification_rank("Unknown") is None
+    assert classification_rank(None) is None
+
+
+def test_baseline_reports_nothing() -> None:
+    """A storm already inside a ring at startup is active, but didn't cross it."""
+    engine = AlertEngine([DISTANCE])
+    assert engine.evaluate({"basyang": storm(distance=100)}, START) == []
+    assert engine.summary() == {"distance_300": {"active": True, "storms": ["Basyang"]}}
+
+
+def test_distance_crossing(engine: AlertEngine) -> None:
+    """Entering a ring fires once, staying inside doesn't fire again."""
+    crossings = engine.evaluate({"basyang": storm(distance=290)}, START + 60)
+    assert crossings == [
+        {
+            "rule": "distance_300",
+            "kind": "distance",
+            "threshold": 300,
+            "storm": "basyang",
+            "storm_name": "Basyang",
+            "active": True,
+            "value": 290,
+        }
+    ]
+    assert engine.evaluate({"basyang": storm(distance=250)}, START + ALERT_MIN_HOLD + 120) == []
+    assert engine.summary()["distance_300"] == {"active": True, "storms": ["Basyang"]}
+
+
+def test_distance_hysteresis(engine: AlertEngine) -> None:
+    """A storm has to move ALERT_DISTANCE_HYSTERESIS km back out before the ring is left."""
+    engine.evaluate({"basyang": storm(distance=290)}, START)
+    later = START + ALERT_MIN_HOLD
+    assert engine.evaluate({"basyang": storm(distance=300 + ALERT_DISTANCE_HYSTERESIS)}, later) == []
+    crossings = engine.evaluate({"basyang": storm(distance=301 + ALERT_DISTANCE_HYSTERESIS)}, later)
+    assert [(crossing["rule"], crossing["active"]) for crossing in crossings] == [("distance_300", False)]
+
+
+def test_wind_hysteresis(engine: AlertEngine) -> None:
+    """Winds have to drop ALERT_WIND_HYSTERESIS km/h below the threshold before it clears."""
+    crossings = engine.evaluate({"basyang": storm(winds=118)}, START)
+    assert [(crossing["rule"], crossing["active"], crossing["value"]) for crossing in crossings] == [
+        ("wind_118", True, 118)
+    ]
+    later = START + ALERT_MIN_HOLD
+    assert engine.evaluate({"basyang": storm(winds=118 - ALERT_WIND_HYSTERESIS)}, later) == []
+    crossings = engine.evaluate({"basyang": storm(winds=117 - ALERT_WIND_HYSTERESIS)}, later)
+    assert [(crossing["rule"], crossing["active"]) for crossing in crossings] == [("wind_118", False)]
+
+
+def test_hold_and_pending_until(engine: AlertEngine) -> None:
+    """A state that just changed is held for ALERT_MIN_HOLD, the held back change is pending."""
+    entered = START + 60
+    engine.evaluate({"basyang": storm(distance=290)}, entered)
+    assert engine.pending_until is None
+
+    # Corrected bulletin, clearly out again, but the ring was just entered
+    assert engine.evaluate({"basyang": storm(distance=400)}, entered + 600) == []
+    assert engine.pending_until == entered + ALERT_MIN_HOLD
+    assert engine.summary()["distance_300"]["active"] is True
+
+    # Still held one second before the end of the hold
+    assert engine.evaluate({"basyang": storm(distance=400)}, entered + ALERT_MIN_HOLD - 1) == []
+    assert engine.pending_until == entered + ALERT_MIN_HOLD
+
+    # Re-evaluated when the hold ends, the change is applied
+    crossings = engine.evaluate({"basyang": storm(distance=400)}, entered + ALERT_MIN_HOLD)
+    assert [(crossing["rule"], crossing["active"]) for crossing in crossings] == [("distance_300", False)]
+    assert engine.pending_until is None
+
+
+def test_hold_dropped_when_back(engine: AlertEngine) -> None:
+    """A held back change that no longer applies leaves nothing pending."""
+    engine.evaluate({"basyang": storm(distance=290)}, START)
+    engine.evaluate({"basyang": storm(distance=400)}, START + 60)
+    assert engine.pending_until is not None
+    assert engine.evaluate({"basyang": storm(distance=280)}, START + 120) == []
+    assert engine.pending_until is None
+
+
+def test_pending_until_is_earliest(engine: AlertEngine) -> None:
+    """With several held back changes pending_until is the earliest end of a hold."""
+    engine.evaluate({"basyang": storm(distance=290)}, START)
+    engine.evaluate({"basyang": storm(distance=290, winds=120)}, START + 600)
+    engine.evaluate({"basyang": storm(distance=400, winds=100)}, START + 900)
+    assert engine.pending_until == START + ALERT_MIN_HOLD
+
+
+def test_dissipated_storm_clears_at_once(engine: AlertEngine) -> None:
+    """A storm leaving the bulletin clears its rules without waiting for the hold."""
+    engine.evaluate({"basyang": storm(distance=290)}, START)
+    crossings = engine.evaluate({}, START + 60)
+    assert crossings == [
+        {
+            "rule": "distance_300",
+            "kind": "distance",
+            "threshold": 300,
+            "storm": "basyang",
+            "storm_name": "Basyang",
+            "active": False,
+            "value": None,
+        }
+    ]
+    assert engine.summary()["distance_300"] == {"active": False, "storms": []}
+
+
+def test_missing_values_are_inactive(engine: AlertEngine) -> None:
+    """A storm without a distance or winds is outside every threshold."""
+    assert engine.evaluate({"basyang": storm(distance=None, winds=None)}, START + 60) == []
+
+
+def test_classification_upgrade(engine: AlertEngine) -> None:
+    """Only upgrades fire, downgrades and unknown classifications don't."""
+    crossings = engine.evaluate({"basyang": storm(classification="Typhoon")}, START + 60)
+    assert crossings == [
+        {
+            "rule": "classification",
+            "kind": "classification",
+            "threshold": None,
+            "storm": "basyang",
+            "storm_name": "Basyang",
+            "active": True,
+            "value": "Typhoon",
+            "previous": "Tropical Storm",
+        }
+    ]
+    assert engine.evaluate({"basyang": storm(classification="Tropical Storm")}, START + 120) == []
+    assert engine.evaluate({"basyang": storm(classification="Unknown")}, START + 180) == []
+
+
+def test_new_storm_upgrade_needs_previous(engine: AlertEngine) -> None:
+    """A storm entering the bulletin sets its classification without firing."""
+    storms = {"basyang": storm(), "ada": {**storm(), "name": "Ada", "classification": "Typhoon"}}
+    assert engine.evaluate(storms, START + 60) == []
@@ -0,0 +1,158 @@
+"""Tests for the storm change feed."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from custom_components.typhoon_sensor.changes import StormChangeTracker, storm_state
+
+ISSUED = datetime(2026, 2, 5, 11, 0, tzinfo=timezone.utc)
+
+
+def storm(**values) -> dict:
+    return {
+        "name": "Basyang",
+        "classification": "Tropical Storm",
+        "coordinates": (10.5, 128.2),
+        "distance": 800.0,
+        "sustained_winds": 75,
+        "gustiness": 90,
+        "movement": "West at 20 km/h",
+        "advisory_time": "11:00 AM, 05 February 2026",
+        "advisory_at": ISSUED,
+        "next_advisory_at": None,
+        **values,
+    }
+
+
+@pytest.fixture
+def tracker() -> StormChangeTracker:
+    """A tracker past its baseline, with Basyang in the bulletin."""
+    tracker = StormChangeTracker(distance_threshold=10)
+    assert tracker.update({"basyang": storm()}) == []
+    return tracker
+
+
+def types(changes: list[dict]) -> list[str]:
+    return [change["type"] for change in changes]
+
+
+def test_storm_state() -> None:
+    """Timestamps become ISO strings and coordinates lists, other keys are dropped."""
+    state = storm_state({**storm(), "forecast": []})
+    assert state["advisory_at"] == ISSUED.isoformat()
+    assert state["coordinates"] == [10.5, 128.2]
+    assert "forecast" not in state
+
+
+def test_baseline() -> None:
+    """The first update only sets the state."""
+    tracker = StormChangeTracker()
+    assert tracker.update({"basyang": storm()}) == []
+    assert tracker.sequence == 0
+    assert tracker.snapshot() == {"sequence": 0, "storms": {"basyang": storm_state(storm())}}
+
+
+def test_unchanged(tracker: StormChangeTracker) -> None:
+    assert tracker.update({"basyang": storm()}) == []
+    assert tracker.sequence == 0
+
+
+def test_new_storm(tracker: StormChangeTracker) -> None:
+    """A new storm comes with all its values."""
+    ada = storm(name="Ada", coordinates=(8.0, 135.0))
+    changes = tracker.update({"basyang": storm(), "ada": ada})
+    assert changes == [{"type": "new_storm", "storm": "ada", **storm_state(ada)}]
+    assert tracker.sequence == 1
+
+
+def test_dissipated(tracker: StormChangeTracker) -> None:
+    """A storm leaving the bulletin is reported once and dropped from the state."""
+    assert tracker.update({}) == [{"type": "dissipated", "storm": "basyang", "name": "Basyang"}]
+    assert tracker.snapshot() == {"sequence": 1, "storms": {}}
+    assert tracker.update({}) == []
+
+
+def test_advisory(tracker: StormChangeTracker) -> None:
+    """A new advisory reports its times, position and movement."""
+    changes = tracker.update({"basyang": storm(coordinates=(10.8, 127.5), advisory_time="2:00 PM")})
+    assert changes == [
+        {
+            "type": "advisory",
+            "storm": "basyang",
+            "name": "Basyang",
+            "advisory_time": "2:00 PM",
+            "advisory_at": ISSUED.isoformat(),
+            "next_advisory_at": None,
+            "coordinates": [10.8, 127.5],
+            "movement": "West at 20 km/h",
+        }
+    ]
+
+
+@pytest.mark.parametrize(
+    ("classification", "upgrade"),
+    [("Severe Tropical Storm", True), ("Tropical Depression", False), ("Unknown", False)],
+)
+def test_classification(tracker: StormChangeTracker, classification: str, upgrade: bool) -> None:
+    """Classification changes tell whether they are an upgrade."""
+    (change,) = tracker.update({"basyang": storm(classification=classification)})
+    assert change == {
+        "type": "classification",
+        "storm": "basyang",
+        "name": "Basyang",
+        "previous": "Tropical Storm",
+        "current": classification,
+        "upgrade": upgrade,
+    }
+
+
+def test_wind(tracker: StormChangeTracker) -> None:
+    """Winds report the previous and current sustained winds and the gustiness."""
+    (change,) = tracker.update({"basyang": storm(gustiness=105)})
+    assert change == {
+        "type": "wind",
+        "storm": "basyang",
+        "name": "Basyang",
+        "previous": 75,
+        "current": 75,
+        "gustiness": 105,
+    }
+    (change,) = tracker.update({"basyang": storm(sustained_winds=85, gustiness=105)})
+    assert (change["previous"], change["current"]) == (75, 85)
+
+
+def test_distance_threshold(tracker: StormChangeTracker) -> None:
+    """Distance changes below the threshold add up until they reach it."""
+    assert tracker.update({"basyang": storm(distance=795.0)}) == []
+    assert tracker.snapshot()["storms"]["basyang"]["distance"] == 800.0
+    assert tracker.update({"basyang": storm(distance=792.0)}) == []
+    (change,) = tracker.update({"basyang": storm(distance=789.5)})
+    assert change == {
+        "type": "distance",
+        "storm": "basyang",
+        "name": "Basyang",
+        "previous": 800.0,
+        "current": 789.5,
+        "change": -10.5,
+    }
+    assert tracker.snapshot()["storms"]["basyang"]["distance"] == 789.5
+    assert tracker.sequence == 1
+
+
+def test_distance_unknown(tracker: StormChangeTracker) -> None:
+    """A distance that can't be computed anymore is reported without a change."""
+    (change,) = tracker.update({"basyang": storm(distance=None)})
+    assert (change["previous"], change["current"], change["change"]) == (800.0, None, None)
+    (change,) = tracker.update({"basyang": storm(distance=801.0)})
+    assert (change["previous"], change["current"], change["change"]) == (None, 801.0, None)
+
+
+def test_several_changes_one_sequence(tracker: StormChangeTracker) -> None:
+    """All changes of one update share a sequence number."""
+    changes = tracker.update({"basyang": storm(classification="Typhoon", sustained_winds=120, distance=700.0)})
+    assert types(changes) == ["classification", "wind", "distance"]
+    assert tracker.sequence == 1
+    tracker.update({"basyang": storm(classification="Typhoon", sustained_winds=130, distance=700.0)})
+    assert tracker.sequence == 2
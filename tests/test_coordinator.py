@@ -0,0 +1,137 @@
+"""Tests for the data update coordinator."""
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.typhoon_sensor.const import STALE_MAX_AGE
+from custom_components.typhoon_sensor.coordinator import TyphoonDataCoordinator
+from custom_components.typhoon_sensor.parser import parse_bulletin
+from custom_components.typhoon_sensor.result import empty_result
+from custom_components.typhoon_sensor.source import BulletinSource, FetchError
+
+
+@pytest.fixture
+async def coordinator(hass: HomeAssistant, advisory_html: bytes) -> TyphoonDataCoordinator:
+    """A coordinator whose source hands out the bundled bulletin."""
+    source = BulletinSource(hass)
+    source.async_get_bulletin = AsyncMock(return_value=parse_bulletin(advisory_html))
+    coordinator = TyphoonDataCoordinator(hass, source, 14.6, 121.0, 30)
+    yield coordinator
+    await coordinator.async_shutdown()
+    source._executor.shutdown(wait=False)
+
+
+async def fail_fetch(coordinator: TyphoonDataCoordinator, fetched_ago: timedelta) -> FetchError:
+    """Refresh once successfully, then with a failing fetch."""
+    await coordinator.async_refresh()
+    coordinator.source.fetched_utc = dt_util.utcnow() - fetched_ago
+    error = FetchError("Failed to fetch data: HTTP 503")
+    coordinator.source.async_get_bulletin.side_effect = error
+    await coordinator.async_refresh()
+    return error
+
+
+async def test_serves_stale_data(coordinator: TyphoonDataCoordinator) -> None:
+    """A failed fetch keeps the last good data, marked stale since it was fetched."""
+    error = await fail_fetch(coordinator, timedelta(hours=1))
+    assert coordinator.last_update_success
+    assert coordinator.data["storms"]
+    assert coordinator.stale_since == coordinator.source.fetched_utc
+    assert coordinator.fetch_error is error
+
+
+async def test_stale_data_expires(coordinator: TyphoonDataCoordinator) -> None:
+    """Data older than STALE_MAX_AGE is dropped."""
+    error = await fail_fetch(coordinator, STALE_MAX_AGE + timedelta(minutes=1))
+    assert coordinator.data == empty_result()
+    assert coordinator.stale_since is None
+    assert coordinator.fetch_error is error
+
+
+async def test_no_data_to_serve(coordinator: TyphoonDataCoordinator) -> None:
+    """Without a good fetch before there is nothing stale to serve."""
+    coordinator.source.async_get_bulletin.side_effect = FetchError("Failed to fetch data: HTTP 503")
+    await coordinator.async_refresh()
+    assert coordinator.data == empty_result()
+    assert coordinator.stale_since is None
+    assert coordinator.fetch_error is not None
+
+
+async def test_recovers(coordinator: TyphoonDataCoordinator, advisory_html: bytes) -> None:
+    """The next good fetch clears the error and the staleness, and drops the retry."""
+    await fail_fetch(coordinator, timedelta(hours=1))
+    coordinator.source.async_get_bulletin.side_effect = None
+    await coordinator.async_refresh()
+    assert coordinator.stale_since is None
+    assert coordinator.fetch_error is None
+    assert coordinator._unsub_schedule is None
+
+
+async def test_failed_fetch_schedules_retry(coordinator: TyphoonDataCoordinator) -> None:
+    """A failed fetch is retried with backoff, even with fixed interval polling."""
+    await fail_fetch(coordinator, timedelta(hours=1))
+    assert coordinator.scheduler.stats["errors"] == 1
+    assert coordinator._unsub_schedule is not None
+
+
+@pytest.fixture
+def notified(coordinator: TyphoonDataCoordinator):
+    """Set data on the coordinator and return the fields it reports as changed."""
+    coordinator.distance_threshold = 5.0
+
+    def notify(**data):
+        coordinator.async_set_updated_data({"name": "Basyang", "distance": 100.0, **data})
+        return coordinator.changed_fields
+
+    return notify
+
+
+async def test_first_notification_changes_everything(notified) -> None:
+    assert notified() is None
+
+
+async def test_unchanged_fields(notified) -> None:
+    """Notifying the same data changes nothing, a new value changes only its field."""
+    notified()
+    assert notified() == set()
+    assert notified(name="Ada") == {"name"}
+    assert notified(name="Ada", movement="West") == {"movement"}
+
+
+async def test_distance_threshold(notified) -> None:
+    """Distance changes below the threshold add up against the last notified distance."""
+    notified()
+    assert notified(distance=103.0) == set()
+    assert notified(distance=104.0) == set()
+    assert notified(distance=105.5) == {"distance"}
+    assert notified(distance=108.0) == set()
+    assert notified(distance=None) == {"distance"}
+
+
+async def test_timing_fields(coordinator: TyphoonDataCoordinator, notified) -> None:
+    """New stage durations are reported as timing_<stage> fields."""
+    notified()
+    coordinator.timings.record("update", 0.2)
+    coordinator.source.timings.record("fetch", 0.5)
+    assert notified() == {"timing_update", "timing_fetch"}
+    assert notified() == set()
+
+
+async def test_availability_changes_everything(coordinator: TyphoonDataCoordinator, notified) -> None:
+    """A change in availability or staleness notifies every entity."""
+    notified()
+    coordinator.last_update_success = False
+    coordinator.async_update_listeners()
+    assert coordinator.changed_fields is None
+    assert notified() is None
+    coordinator.stale_since = dt_util.utcnow()
+    coordinator.async_update_listeners()
+    assert coordinator.changed_fields is None
+    coordinator.async_update_listeners()
+    assert coordinator.changed_fields == set()
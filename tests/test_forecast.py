@@ -0,0 +1,100 @@
+"""Tests for the forecast closest approach."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.typhoon_sensor.forecast import EMPTY_FORECAST_METRICS, closest_approach, cone_radius
+
+HOME = (14.6, 121.0)
+ISSUED = 1_770_000_000
+HOUR = 3600
+# One degree of latitude, in km
+DEGREE = 111.19
+
+
+def row(hours: float, lat: float | None, lon: float | None) -> list:
+    return [ISSUED + hours * HOUR, lat, lon, "text"]
+
+
+@pytest.mark.parametrize(
+    ("lead_hours", "expected"),
+    [(0, 0.0), (12, 60.0), (24, 120.0), (36, 170.0), (120, 520.0), (200, 520.0)],
+)
+def test_cone_radius(lead_hours: float, expected: float) -> None:
+    """The cone grows linearly between the tabulated lead times and stops at the last one."""
+    assert cone_radius(lead_hours) == pytest.approx(expected)
+
+
+def test_no_forecast() -> None:
+    """Without forecast positions there is nothing to report."""
+    assert closest_approach(ISSUED, (10.0, 125.0), [], HOME) == EMPTY_FORECAST_METRICS
+    assert closest_approach(ISSUED, (10.0, 125.0), [row(24, None, None)], HOME) == EMPTY_FORECAST_METRICS
+
+
+def test_passes_by() -> None:
+    """A track passing north of home is closest where it crosses home's longitude."""
+    # Due west along 15.6 N, one degree north of home, 24 h from 125 E to 117 E
+    metrics = closest_approach(ISSUED, (15.6, 125.0), [row(24, 15.6, 117.0)], HOME)
+    assert metrics["forecast_closest_distance"] == pytest.approx(DEGREE, rel=0.01)
+    assert metrics["forecast_closest_time"] == ISSUED + 12 * HOUR
+    assert metrics["forecast_closest_lead"] == 12.0
+    assert metrics["forecast_cone_radius"] == 60.0
+    assert metrics["forecast_inside_cone"] is False
+
+
+def test_inside_cone() -> None:
+    """A closest approach nearer than the cone radius is inside the cone."""
+    metrics = closest_approach(ISSUED, (14.8, 125.0), [row(24, 14.8, 117.0)], HOME)
+    assert metrics["forecast_closest_distance"] < 60
+    assert metrics["forecast_inside_cone"] is True
+
+
+def test_closest_at_forecast_position() -> None:
+    """A track turning away is closest at the turn."""
+    forecast = [row(24, 15.0, 123.0), row(48, 20.0, 125.0)]
+    metrics = closest_approach(ISSUED, (12.0, 128.0), forecast, HOME)
+    assert metrics["forecast_closest_time"] == ISSUED + 24 * HOUR
+    assert metrics["forecast_closest_lead"] == 24.0
+
+
+def test_skips_rows_without_position() -> None:
+    """Forecast rows that couldn't be located are left out of the track."""
+    forecast = [row(24, None, None), row(48, 15.6, 117.0)]
+    metrics = closest_approach(ISSUED, (15.6, 125.0), forecast, HOME)
+    assert metrics["forecast_closest_time"] == ISSUED + 24 * HOUR
+
+
+def test_moving_away() -> None:
+    """A storm moving away is closest now."""
+    metrics = closest_approach(ISSUED, (16.0, 122.0), [row(24, 20.0, 125.0)], HOME)
+    assert metrics["forecast_closest_time"] == ISSUED
+    assert metrics["forecast_closest_lead"] == 0.0
+
+
+def test_without_issued_time() -> None:
+    """Without an issued time the current position still counts, only the lead time is missing."""
+    with_issued = closest_approach(ISSUED, (15.6, 125.0), [row(24, 15.6, 117.0)], HOME)
+    metrics = closest_approach(None, (15.6, 125.0), [row(24, 15.6, 117.0)], HOME)
+    assert metrics["forecast_closest_distance"] == with_issued["forecast_closest_distance"]
+    # Between now and the first forecast position the time is unknown
+    assert metrics["forecast_closest_time"] is None
+    assert metrics["forecast_closest_lead"] is None
+    assert metrics["forecast_cone_radius"] is None
+    assert metrics["forecast_inside_cone"] is None
+
+
+def test_without_issued_time_later_segment() -> None:
+    """Without an issued time, closest points after the first forecast position keep their time."""
+    forecast = [row(24, 15.6, 127.0), row(48, 15.6, 115.0)]
+    metrics = closest_approach(None, (15.6, 130.0), forecast, HOME)
+    assert metrics["forecast_closest_distance"] == pytest.approx(DEGREE, rel=0.01)
+    assert metrics["forecast_closest_time"] == ISSUED + 36 * HOUR
+
+
+def test_without_issued_time_moving_away() -> None:
+    """Without an issued time, a storm moving away is still closest at its current position."""
+    metrics = closest_approach(None, (16.0, 122.0), [row(24, 20.0, 125.0)], HOME)
+    assert metrics["forecast_closest_distance"] == closest_approach(
+        ISSUED, (16.0, 122.0), [row(24, 20.0, 125.0)], HOME
+    )["forecast_closest_distance"]
+    assert metrics["forecast_closest_time"] is None
@@ -0,0 +1,94 @@
+"""Tests for the track history and motion metrics."""
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from custom_components.typhoon_sensor.const import EARTH_RADIUS_KM
+from custom_components.typhoon_sensor.history import EMPTY_MOTION_METRICS, TrackHistory, motion_metrics
+
+HOME = (14.6, 121.0)
+ISSUED = 1_770_000_000.0
+HOUR = 3600
+# One degree of longitude along home's latitude, in km
+DEGREE_EAST = math.radians(1) * math.cos(math.radians(HOME[0])) * EARTH_RADIUS_KM
+
+
+def track(*rows) -> TrackHistory:
+    history = TrackHistory()
+    for row in rows:
+        history.append(*row)
+    return history
+
+
+def test_ring_buffer() -> None:
+    """The oldest rows are overwritten once the buffer is full."""
+    history = TrackHistory(capacity=3)
+    for hour in range(5):
+        history.append(ISSUED + hour * HOUR, 10.0 + hour, 130.0)
+    assert len(history) == 3
+    assert [row[0] for row in history.rows()] == [ISSUED + hour * HOUR for hour in (2, 3, 4)]
+    assert history.row(0)[1] == 14.0
+    assert history.last_timestamp == ISSUED + 4 * HOUR
+    with pytest.raises(IndexError):
+        history.row(3)
+
+
+def test_append_only_newer() -> None:
+    """Repeated and older advisories are ignored."""
+    history = track((ISSUED, 10.0, 130.0))
+    assert history.append(ISSUED, 11.0, 129.0) is False
+    assert history.append(ISSUED - HOUR, 11.0, 129.0) is False
+    assert len(history) == 1
+    assert TrackHistory().last_timestamp is None
+
+
+def test_round_trip() -> None:
+    """Missing winds are stored as NaN and serialized as None."""
+    rows = [[ISSUED, 10.0, 130.0, None, None], [ISSUED + HOUR, 10.5, 129.5, 65.0, 80.0]]
+    history = TrackHistory.from_list(rows)
+    assert math.isnan(history.row(1)[3])
+    assert history.as_list() == rows
+    assert TrackHistory.from_list(rows, capacity=1).as_list() == rows[1:]
+
+
+def test_not_enough_rows() -> None:
+    assert motion_metrics(TrackHistory(), HOME) == EMPTY_MOTION_METRICS
+    assert motion_metrics(track((ISSUED, 14.6, 125.0)), HOME) == EMPTY_MOTION_METRICS
+
+
+def test_approaching() -> None:
+    """A storm heading straight for home closes in and reaches it."""
+    history = track((ISSUED, 14.6, 125.0, 65, 80), (ISSUED + 6 * HOUR, 14.6, 124.0, 75, 90))
+    metrics = motion_metrics(history, HOME)
+    assert metrics["closing_speed"] == pytest.approx(DEGREE_EAST / 6, abs=0.01)
+    assert metrics["intensification_rate"] == 40.0
+    assert metrics["time_to_closest_approach"] == pytest.approx(18.0, abs=0.01)
+    assert metrics["closest_approach_distance"] == pytest.approx(0.0, abs=0.01)
+
+
+def test_passing_by() -> None:
+    """A storm moving west one degree north of home is closest north of it."""
+    history = track((ISSUED, 15.6, 125.0), (ISSUED + 6 * HOUR, 15.6, 124.0))
+    metrics = motion_metrics(history, HOME)
+    assert metrics["time_to_closest_approach"] == pytest.approx(18.0, abs=0.01)
+    assert metrics["closest_approach_distance"] == pytest.approx(math.radians(1) * EARTH_RADIUS_KM, abs=0.01)
+
+
+def test_receding() -> None:
+    """A storm moving away has a negative closing speed and no closest approach ahead."""
+    history = track((ISSUED, 14.6, 124.0), (ISSUED + 6 * HOUR, 14.6, 125.0))
+    metrics = motion_metrics(history, HOME)
+    assert metrics["closing_speed"] < 0
+    assert metrics["time_to_closest_approach"] is None
+    assert metrics["closest_approach_distance"] is None
+
+
+def test_stationary_without_winds() -> None:
+    """A stationary storm has no closest approach, unknown winds no intensification rate."""
+    history = track((ISSUED, 14.6, 125.0, None), (ISSUED + 6 * HOUR, 14.6, 125.0, 75))
+    metrics = motion_metrics(history, HOME)
+    assert metrics["closing_speed"] == 0.0
+    assert metrics["intensification_rate"] is None
+    assert metrics["time_to_closest_approach"] is None
@@ -0,0 +1,32 @@
+"""Tests for the bulletin parser."""
+from __future__ import annotations
+
+from custom_components.typhoon_sensor.parser import parse_bulletin, storm_id, storm_ids
+
+
+def test_parse_bulletin(advisory_html: bytes) -> None:
+    """The bundled bulletin has one storm."""
+    bulletin = parse_bulletin(advisory_html)
+    assert not bulletin.no_active
+    assert [typhoon["name"] for typhoon in bulletin.typhoons] == ["Basyang"]
+    assert bulletin.typhoons[0]["classification"] == "Tropical Storm"
+
+
+def test_parse_no_advisory(no_advisory_html: bytes) -> None:
+    """Without an active storm the bulletin says so and has no storms."""
+    bulletin = parse_bulletin(no_advisory_html)
+    assert bulletin.no_active
+    assert bulletin.typhoons == []
+
+
+def test_storm_id() -> None:
+    """Keys are lowercase names, anything else becomes an underscore."""
+    assert storm_id("Basyang") == "basyang"
+    assert storm_id(" Super Typhoon (Ada) ") == "super_typhoon_ada"
+    assert storm_id('""') == "unknown"
+
+
+def test_storm_ids_suffix_collisions() -> None:
+    """Storms sharing a key get their position in the bulletin appended."""
+    typhoons = [{"name": "Unknown"}, {"name": "Ada"}, {"name": "Unknown"}, {"name": "ada"}]
+    assert storm_ids(typhoons) == ["unknown", "ada", "unknown_3", "ada_4"]
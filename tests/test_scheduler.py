@@ -0,0 +1,179 @@
+"""Tests for the adaptive poll scheduler."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import random
+
+import pytest
+
+from custom_components.typhoon_sensor.const import (
+    BACKOFF_BASE,
+    DEFAULT_PUBLICATION_LAG,
+    MAX_PROBES,
+    MIN_SCAN_INTERVAL,
+    POLL_JITTER,
+    PROBE_INTERVAL,
+)
+from custom_components.typhoon_sensor.scheduler import PollScheduler
+
+START = datetime(2026, 2, 5, 12, 0, tzinfo=timezone.utc)
+SCAN_INTERVAL = timedelta(minutes=30)
+IDLE_INTERVAL = timedelta(hours=8)
+
+
+@pytest.fixture
+def scheduler() -> PollScheduler:
+    return PollScheduler(SCAN_INTERVAL, IDLE_INTERVAL, random.Random(0))
+
+
+def delay(decision) -> timedelta:
+    """Return the delay of a decision, without its jitter."""
+    return decision.next_poll - decision.decided_at
+
+
+def assert_delay(decision, expected: timedelta) -> None:
+    jitter = min(POLL_JITTER, expected.total_seconds() * 0.1)
+    assert expected <= delay(decision) <= expected + timedelta(seconds=jitter)
+
+
+def learn_lag(scheduler: PollScheduler, lag: timedelta, advisories: int = 3) -> datetime:
+    """Publish advisories every 3 hours, each seen ``lag`` after its issue time, and return the last issue time."""
+    issued = START
+    for _ in range(advisories):
+        # The poll before the release still sees the previous advisory
+        scheduler.next_poll(issued + lag - timedelta(minutes=1), scheduler._last_issued, None, False)
+        scheduler.next_poll(issued + lag + timedelta(minutes=1), issued, None, False)
+        issued += timedelta(hours=3)
+    return issued - timedelta(hours=3)
+
+
+def test_default_publication_lag(scheduler: PollScheduler) -> None:
+    """Without observations the prior lag is used."""
+    assert scheduler.publication_lag == DEFAULT_PUBLICATION_LAG
+
+
+def test_publication_lag_is_median(scheduler: PollScheduler) -> None:
+    """The learned lag is the median of the observed ones, an outlier doesn't move it."""
+    issued = START
+    for lag in (20, 22, 90, 21, 24):
+        scheduler.next_poll(issued + timedelta(minutes=lag - 1), scheduler._last_issued, None, False)
+        scheduler.next_poll(issued + timedelta(minutes=lag + 1), issued, None, False)
+        issued += timedelta(hours=3)
+    assert scheduler.publication_lag == timedelta(minutes=22)
+
+
+def test_publication_lag_takes_half_the_poll_gap(scheduler: PollScheduler) -> None:
+    """A change seen after a long gap only counts from the middle of the gap."""
+    scheduler.next_poll(START - timedelta(minutes=10), None, None, False)
+    scheduler.next_poll(START + timedelta(minutes=50), START, None, False)
+    assert scheduler.publication_lag == timedelta(minutes=20)
+
+
+def test_publication_lag_needs_two_live_polls(scheduler: PollScheduler) -> None:
+    """Restored results, the first poll and very late changes teach nothing."""
+    scheduler.next_poll(START + timedelta(minutes=20), START, None, False)
+    assert scheduler.publication_lag == DEFAULT_PUBLICATION_LAG
+
+    issued = START + timedelta(hours=3)
+    scheduler.next_poll(issued + timedelta(minutes=5), issued, None, False, live=False)
+    assert scheduler.publication_lag == DEFAULT_PUBLICATION_LAG
+
+    issued += timedelta(hours=3)
+    scheduler.next_poll(issued + timedelta(hours=3), issued, None, False)
+    assert scheduler.publication_lag == DEFAULT_PUBLICATION_LAG
+
+
+def test_waits_for_burst_window(scheduler: PollScheduler) -> None:
+    """Before the expected release the next poll is the start of the burst window."""
+    issued = learn_lag(scheduler, timedelta(minutes=30))
+    expected = issued + timedelta(hours=3)
+    now = issued + timedelta(minutes=31)
+    decision = scheduler.next_poll(now, issued, expected, False)
+    # Centred on the learned release: half of the probes before it
+    burst_start = expected + timedelta(minutes=30) - PROBE_INTERVAL * (MAX_PROBES // 2)
+    assert_delay(decision, burst_start - now)
+
+
+def test_burst_window_not_before_expected(scheduler: PollScheduler) -> None:
+    """With a short learned lag the burst starts at the nominal time, not before."""
+    issued = learn_lag(scheduler, timedelta(minutes=2))
+    expected = issued + timedelta(hours=3)
+    now = issued + timedelta(minutes=10)
+    assert_delay(scheduler.next_poll(now, issued, expected, False), expected - now)
+
+
+def test_probes_then_backoff(scheduler: PollScheduler) -> None:
+    """In the burst window up to MAX_PROBES probes run, then the scheduler backs off."""
+    issued = START
+    expected = START + timedelta(hours=3)
+    now = expected + DEFAULT_PUBLICATION_LAG
+    scheduler.next_poll(now - timedelta(hours=1), issued, expected, False)
+    for probe in range(1, MAX_PROBES + 1):
+        decision = scheduler.next_poll(now, issued, expected, False)
+        assert_delay(decision, PROBE_INTERVAL)
+        assert decision.probes_used == probe
+        now = decision.next_poll
+    assert_delay(scheduler.next_poll(now, issued, expected, False), BACKOFF_BASE)
+
+
+def test_new_advisory_resets_probes(scheduler: PollScheduler) -> None:
+    """A new advisory starts a new burst for the next one."""
+    expected = START + timedelta(hours=3)
+    now = expected + DEFAULT_PUBLICATION_LAG
+    scheduler.next_poll(now - timedelta(hours=1), START, expected, False)
+    for _ in range(MAX_PROBES + 2):
+        now = scheduler.next_poll(now, START, expected, False).next_poll
+    decision = scheduler.next_poll(now, expected, expected + timedelta(hours=3), False)
+    assert decision.probes_used == 0
+    assert decision.next_poll > expected + timedelta(hours=3)
+
+
+def test_backoff_capped_at_scan_interval(scheduler: PollScheduler) -> None:
+    """Unchanged polls double the interval from BACKOFF_BASE up to the scan interval."""
+    now = START
+    delays = []
+    for _ in range(5):
+        decision = scheduler.next_poll(now, START, None, False)
+        delays.append(delay(decision))
+        now = decision.next_poll
+    assert delays[0] >= BACKOFF_BASE
+    assert all(SCAN_INTERVAL <= value <= SCAN_INTERVAL + timedelta(seconds=POLL_JITTER) for value in delays[1:])
+
+
+def test_backoff_never_below_min_scan_interval() -> None:
+    """Backoff doesn't poll more often than the shortest scan interval allows."""
+    scheduler = PollScheduler(timedelta(minutes=5), IDLE_INTERVAL, random.Random(0))
+    assert BACKOFF_BASE >= timedelta(minutes=MIN_SCAN_INTERVAL)
+    now = START
+    for _ in range(3):
+        decision = scheduler.next_poll(now, START, None, False)
+        assert delay(decision) >= timedelta(minutes=MIN_SCAN_INTERVAL)
+        decision = scheduler.retry(decision.next_poll)
+        assert delay(decision) >= timedelta(minutes=MIN_SCAN_INTERVAL)
+        now = decision.next_poll
+
+
+def test_retry_backs_off(scheduler: PollScheduler) -> None:
+    """Failed polls back off like unchanged ones, and reset_backoff starts over."""
+    now = START
+    for expected in (BACKOFF_BASE, SCAN_INTERVAL, SCAN_INTERVAL):
+        decision = scheduler.retry(now)
+        assert_delay(decision, expected)
+        now = decision.next_poll
+    assert scheduler.stats["errors"] == 3
+    scheduler.reset_backoff()
+    assert_delay(scheduler.retry(now), BACKOFF_BASE)
+
+
+def test_idle_interval(scheduler: PollScheduler) -> None:
+    """Without an active storm the idle interval is used."""
+    assert_delay(scheduler.next_poll(START, None, None, True), IDLE_INTERVAL)
+
+
+def test_as_dict(scheduler: PollScheduler) -> None:
+    """The diagnostics have the decision and the learned lag."""
+    decision = scheduler.next_poll(START, START, None, False)
+    state = scheduler.as_dict()
+    assert state["next_poll"] == decision.next_poll.isoformat()
+    assert state["publication_lag_minutes"] == DEFAULT_PUBLICATION_LAG.total_seconds() / 60
+    assert state["history"] == [decision.as_dict()]
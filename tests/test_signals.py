@@ -0,0 +1,62 @@
+"""Tests for the wind signal areas."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.typhoon_sensor.signals import home_signal, parse_signal_areas, signal_index
+
+AREAS = [
+    *parse_signal_areas(3, "Siquijor, and the southern portion of Negros Oriental (Dumaguete City, San Jose)"),
+    *parse_signal_areas(2, "the rest of Negros Oriental, Camiguin"),
+    *parse_signal_areas(1, "the northern portion of Palawan including Cuyo, and Cagayancilo Islands"),
+]
+
+
+@pytest.fixture
+def index() -> dict:
+    return signal_index(AREAS)
+
+
+def test_parse_signal_areas() -> None:
+    """Portions, municipalities and islands are attached to their province."""
+    assert AREAS[1] == {
+        "signal": 3,
+        "province": "Negros Oriental",
+        "portion": "southern",
+        "municipalities": ["Dumaguete City", "San Jose"],
+        "including": [],
+    }
+    assert AREAS[2]["portion"] == "rest"
+    assert AREAS[-1]["including"] == ["Cuyo", "Cagayancilo Islands"]
+
+
+@pytest.mark.parametrize(
+    ("province", "town", "expected"),
+    [
+        # Whole province
+        ("siquijor", None, (3, False)),
+        ("siquijor", "larena", (3, False)),
+        # Listed town of a portion
+        ("negros oriental", "dumaguete", (3, False)),
+        # Town not listed, only the rest of the province applies
+        ("negros oriental", "bais", (2, False)),
+        # Unknown town, the portion might apply
+        ("negros oriental", None, (3, True)),
+        # Islands the gazetteer can't place, even a known town is uncertain
+        ("palawan", "puerto princesa", (1, True)),
+        # Not listed at all
+        ("cebu", "cebu", (0, False)),
+        (None, None, (0, False)),
+    ],
+)
+def test_home_signal(index: dict, province: str | None, town: str | None, expected: tuple) -> None:
+    assert home_signal(index, province, town) == expected
+
+
+def test_certain_beats_partial() -> None:
+    """At the same level a certain signal wins over a partial one."""
+    areas = [
+        *parse_signal_areas(2, "the southern portion of Negros Oriental"),
+        *parse_signal_areas(2, "Negros Oriental"),
+    ]
+    assert home_signal(signal_index(areas), "negros oriental") == (2, False)
@@ -0,0 +1,113 @@
+"""Tests for the shared bulletin source."""
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.typhoon_sensor.const import BULLETIN_URL, FETCH_ATTEMPTS, FETCH_TIMEOUT
+from custom_components.typhoon_sensor.parser import Bulletin
+from custom_components.typhoon_sensor.source import BulletinSource, FetchError
+
+FALLBACK_URL = "https://mirror.example.com/bulletin"
+BULLETIN = Bulletin([], True, "digest")
+
+
+@pytest.fixture
+def source(hass: HomeAssistant) -> BulletinSource:
+    """A source whose retries don't wait."""
+    source = BulletinSource(hass)
+    with patch("custom_components.typhoon_sensor.source.FETCH_RETRY_BACKOFF", 0):
+        yield source
+    source._executor.shutdown(wait=False)
+
+
+def fetch_url(source: BulletinSource, *results) -> AsyncMock:
+    """Patch the single fetch, every call raises or returns the next result."""
+    mock = AsyncMock(side_effect=results)
+    source._async_fetch_url = mock
+    return mock
+
+
+def urls(mock: AsyncMock) -> list[str]:
+    return [call.args[0] for call in mock.call_args_list]
+
+
+async def test_retries_until_success(source: BulletinSource) -> None:
+    """Timeouts and connection errors are retried."""
+    mock = fetch_url(source, asyncio.TimeoutError(), aiohttp.ClientError("reset"), BULLETIN)
+    assert await source._async_fetch() is BULLETIN
+    assert urls(mock) == [BULLETIN_URL] * 3
+    assert source.fetch_stats["retries"] == 2
+    assert source.fetch_stats["failures"] == 0
+
+
+async def test_gives_up_after_attempts(source: BulletinSource) -> None:
+    """After FETCH_ATTEMPTS failures the last error is raised."""
+    mock = fetch_url(source, *[FetchError("HTTP 503")] * FETCH_ATTEMPTS)
+    with pytest.raises(FetchError, match="HTTP 503"):
+        await source._async_fetch()
+    assert mock.call_count == FETCH_ATTEMPTS
+    assert source.fetch_stats["failures"] == 1
+
+
+async def test_not_retryable(source: BulletinSource) -> None:
+    """A client error like a 404 isn't retried."""
+    mock = fetch_url(source, FetchError("HTTP 404", retryable=False))
+    with pytest.raises(FetchError, match="HTTP 404"):
+        await source._async_fetch()
+    assert mock.call_count == 1
+    assert source.fetch_stats["retries"] == 0
+
+
+async def test_fallback(source: BulletinSource) -> None:
+    """The fallback URL is tried once PAGASA keeps failing."""
+    source.fallback_url = FALLBACK_URL
+    mock = fetch_url(source, *[aiohttp.ClientError()] * FETCH_ATTEMPTS, BULLETIN)
+    assert await source._async_fetch() is BULLETIN
+    assert urls(mock) == [BULLETIN_URL] * FETCH_ATTEMPTS + [FALLBACK_URL]
+    assert source.fetch_stats["fallback_fetches"] == 1
+
+
+async def test_fallback_after_not_retryable(source: BulletinSource) -> None:
+    """A non retryable error moves on to the fallback URL at once."""
+    source.fallback_url = FALLBACK_URL
+    mock = fetch_url(source, FetchError("HTTP 404", retryable=False), BULLETIN)
+    assert await source._async_fetch() is BULLETIN
+    assert urls(mock) == [BULLETIN_URL, FALLBACK_URL]
+
+
+async def test_budget_leaves_fallback_an_attempt(source: BulletinSource) -> None:
+    """Retries that could end past the budget aren't started, the fallback keeps its attempt."""
+    source.fallback_url = FALLBACK_URL
+    mock = fetch_url(source, aiohttp.ClientError(), aiohttp.ClientError())
+    with (
+        patch("custom_components.typhoon_sensor.source.FETCH_BUDGET", FETCH_TIMEOUT * 2 + 5),
+        patch("custom_components.typhoon_sensor.source.FETCH_RETRY_BACKOFF", FETCH_TIMEOUT * 2),
+        pytest.raises(FetchError),
+    ):
+        await source._async_fetch()
+    assert urls(mock) == [BULLETIN_URL, FALLBACK_URL]
+    assert source.fetch_stats["retries"] == 0
+
+
+async def test_shared_fetch(source: BulletinSource) -> None:
+    """Concurrent requests share one fetch, a fresh bulletin is handed out as is."""
+    async def fetch(_url):
+        await asyncio.sleep(0)
+        source.bulletin = BULLETIN
+        source._fetched_at = time.monotonic()
+        return BULLETIN
+
+    mock = fetch_url(source)
+    mock.side_effect = fetch
+    results = await asyncio.gather(source.async_get_bulletin(), source.async_get_bulletin())
+    assert results == [BULLETIN, BULLETIN]
+    assert await source.async_get_bulletin() is BULLETIN
+    assert mock.call_count == 1
+    assert source.fetch_stats["coalesced"] == 2